@@ -0,0 +1,107 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+import numpy
+
+# every predict call carries framework overhead that dwarfs a small model's arithmetic
+# so requests from any number of threads are queued and run through the model together
+MAX_BATCH = 256
+# how long the first request of a batch waits for company, in seconds
+BATCH_WINDOW = 0.002
+
+
+class InferenceBatcher:
+    # stands in for a keras model wherever only predict is used
+    # one thread owns the model's predict, callers block on their slice of the batched result
+    def __init__(self, m, max_batch=MAX_BATCH, window=BATCH_WINDOW):
+        self.m = m
+        self.max_batch = max_batch
+        self.window = window
+        self.requests = queue.Queue()
+        self.thread = None
+        # requests go on the queue under the lock, and close() puts its stop marker behind them under the lock too
+        self.lock = threading.Lock()
+        self.closed = False
+        self.batches = 0
+        self.rows = 0
+
+    def predict(self, inputs, verbose=0):
+        return self.submit(inputs).result()
+
+    def submit(self, inputs):
+        # queue a stack of input cubes, the future resolves to their rows of the prediction
+        future = Future()
+        with self.lock:
+            if not self.closed:
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self.run, daemon=True)
+                    self.thread.start()
+                self.requests.put((inputs, future))
+                return future
+        # a caller can still hold a batcher that was swapped out and closed, it gets an answer on its own thread
+        self.run_batch([(inputs, future)])
+        return future
+
+    def close(self):
+        # everything already queued is answered before the thread stops
+        with self.lock:
+            self.closed = True
+            if self.thread is not None:
+                self.requests.put(None)
+                self.thread.join()
+                self.thread = None
+
+    def run(self):
+        while True:
+            first = self.requests.get()
+            if first is None:
+                self.run_leftovers([])
+                return
+            pending = [first]
+            rows = len(first[0])
+            deadline = time.perf_counter() + self.window
+            stop = False
+            while rows < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                pending.append(item)
+                rows += len(item[0])
+            if stop:
+                self.run_leftovers(pending)
+                return
+            self.run_batch(pending)
+
+    def run_leftovers(self, pending):
+        # nothing should be queued behind the stop marker, but anything that is gets answered rather than left hanging
+        while True:
+            try:
+                item = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                pending.append(item)
+        if pending:
+            self.run_batch(pending)
+
+    def run_batch(self, pending):
+        try:
+            outputs = self.m.predict(numpy.concatenate([inputs for inputs, future in pending]), verbose=0)
+        except Exception as e:
+            for inputs, future in pending:
+                future.set_exception(e)
+            return
+        self.batches += 1
+        self.rows += len(outputs)
+        start = 0
+        for inputs, future in pending:
+            future.set_result(outputs[start:start + len(inputs)])
+            start += len(inputs)
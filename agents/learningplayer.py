@@ -1,7 +1,7 @@
 import numpy
-import keras as k
 
-from server import board
+from server import board, zobrist
+from agents import inferencebatcher, numpymodel, replaybuffer
 
 # channels for board data
 INP_TERRAIN = 0
@@ -12,73 +12,111 @@ INP_SHOOT = 4
 INP_CHANNELS = 5
 LAYER_SIZE = board.X_MAX * board.Y_MAX // 2
 
+# fancy index that picks hex (i, j) out of a full board array into [i, j//2] of the compressed layout
+COMPRESS_X = numpy.arange(board.X_MAX).reshape(board.X_MAX, 1)
+COMPRESS_Y = 2 * numpy.arange(board.Y_MAX // 2).reshape(1, board.Y_MAX // 2) + COMPRESS_X % 2
+# columns of the per-token table scan_board builds, HP to range line up with the health to shoot channels
+TOKEN_HP = 0
+TOKEN_MV = 1
+TOKEN_RNG = 2
+TOKEN_OWN = 3
+TOKEN_FLAG = 4
+TOKEN_READY = 5
+
 
 # LearningPlayer class holds on to model instance
 class LearningPlayer:
-    def __init__(self, model_id=None):
+    def __init__(self, model_id=None, replay_path=None, models=None):
         # None model_id will load the latest model
+        # replay_path keeps the move history in memory-mapped files that outlive this process
+        # models is a ModelCache to take inference models from, so they survive reset and pick up new weights
         self.m = None
-        self.all_inputs = None
-        self.all_rewards = None
-        self.history_length = 0
+        self.models = models
+        # the move history is only made once training needs it, players serving games never allocate one
+        self.history = None
+        self.replay_path = replay_path
+        self.encoder = None
+        # predictions outside training go through the batcher so concurrent games share predict calls
+        self.batcher = None
         self.model_id = model_id
+        # weight version of self.m, None when it isn't known and predictions can't be cached
+        self.model_version = None
 
     def reset(self, b, model_id):
         self.m = None
-        self.all_inputs = None
-        self.all_rewards = None
-        self.history_length = 0
+        self.model_version = None
+        if self.history is not None:
+            self.history.clear()
+        if self.batcher is not None:
+            self.batcher.close()
+            self.batcher = None
         self.model_id = model_id
 
     def play_token(self, b, train=False, flip=None):
         # todo set up so we have explicit load model and init from application
-        if self.m is None:
-            self.model_id, self.m = load_model(b, self.model_id)
+        if not train and self.models is not None:
+            # ask every time, the cache may have swapped in newer weights
+            self.model_id, self.model_version, self.m = self.models.get_versioned(self.model_id)
+        elif self.m is None or (train and isinstance(self.m, numpymodel.NumpyModel)):
+            self.model_id, self.m = load_model(b, self.model_id, train)
+            self.model_version = load_version(b, self.model_id)
+        if not train and self.models is not None:
+            # every player on a cached model shares its batcher, so all the games in the process batch together
+            batcher = self.models.batcher(self.model_id, self.m)
+        else:
+            if self.batcher is None or self.batcher.m is not self.m:
+                if self.batcher is not None:
+                    self.batcher.close()
+                self.batcher = make_batcher(self.m)
+            batcher = self.batcher
+
+        if self.encoder is None or self.encoder.board is not b:
+            if self.encoder is not None:
+                self.encoder.detach()
+            self.encoder = BoardEncoder(b)
+
+        # predictions are cached against the weights they came from, so saving a model again never serves stale ones
+        model_key = None
+        if self.model_version is not None:
+            model_key = (self.model_id, self.model_version)
 
         # play token and record what we did
-        state, move = move_token(b, self.m, train, flip)
+        if train:
+            state, move = move_token(b, self.m, train, flip, model_key, self.encoder)
+        else:
+            state, move = move_token(b, batcher, train, flip, model_key, self.encoder)
 
         if state is None:
             # we ended our turn instead of moving a token
             # so reverse reward weights for training
             # every token Red moves rewards Red / punishes Blue, and vice-versa
-            if self.all_rewards is not None:
-                self.all_rewards = numpy.multiply(self.all_rewards, -1)
+            if self.history is not None:
+                self.history.flip_rewards()
 
             # automatically save model on victory
-            if train and b.victory is not None:
-                # reshape total history for input layer
-                train_inputs = self.all_inputs.reshape(
-                    (self.history_length, INP_CHANNELS, board.X_MAX, board.Y_MAX // 2))
-                # add 0.5 to total rewards so training values are 0 or 1, and reshape for output layer
-                train_rewards = numpy.add(self.all_rewards, 0.5).reshape(self.history_length, LAYER_SIZE)
-                self.m.fit(train_inputs, train_rewards, verbose=0)
+            if train and b.victory is not None and self.history is not None and len(self.history) > 0:
+                train_inputs, train_rewards = self.history.contents()
+                # add 0.5 to total rewards so training values are 0 or 1
+                self.m.fit(train_inputs, numpy.add(train_rewards, 0.5), verbose=0)
+                self.history.flush()
                 save_model(self.m, b, self.model_id)
             return 0
         elif train:
             # we moved a token so remember the starting state
             # create an expectation map marking the spot we moved to
-            self.history_length += 1
-            to_x = move[board.COL]
-            to_y = move[board.ROW] // 2
-            if state[0, INP_COLOR, to_x, to_y] == 1:
-                # reward for attacking an opponent token
-                reward_value = 0.5
-            else:
-                # reward for moving to empty tile
-                reward_value = 0.25
-            state_reward = numpy.zeros((board.X_MAX, board.Y_MAX // 2))
-            state_reward[to_x, to_y] = reward_value
-            if self.all_inputs is None:
-                self.all_inputs = state
-                self.all_rewards = state_reward
-            else:
-                self.all_inputs = numpy.append(self.all_inputs, state)
-                self.all_rewards = numpy.append(self.all_rewards, state_reward)
+            self.remember().append(state, generate_reward(state, move))
         return 1
 
+    def remember(self):
+        # the move history, made the first time a training move is recorded
+        if self.history is None:
+            self.history = replaybuffer.ReplayBuffer(
+                (INP_CHANNELS, board.X_MAX, board.Y_MAX // 2), LAYER_SIZE, path=self.replay_path)
+        return self.history
 
-def load_model(b, model_id=None):
+
+def load_model(b, model_id=None, train=True):
+    # keras is only imported when we're going to train, otherwise the model runs on numpy
     if model_id is None:
         # auto-init to latest model
         models = b.list_models()
@@ -91,14 +129,41 @@ def load_model(b, model_id=None):
     if model_id is not None:
         data, weights = b.load_model(model_id)
 
+    return model_id, build_model(data, weights, train)
+
+
+def load_version(b, model_id):
+    # weight version of a model in the database, None offline or for a model that isn't there
+    if model_id is None:
+        return None
+    versions = b.list_model_versions()
+    if versions is None:
+        return None
+    return versions.get(int(model_id))
+
+
+def make_batcher(m):
+    # numpy models answer in microseconds, so don't hold a request back waiting for company
+    # requests that arrive while a batch is running still go together in the next one
+    window = inferencebatcher.BATCH_WINDOW
+    if isinstance(m, numpymodel.NumpyModel):
+        window = 0
+    return inferencebatcher.InferenceBatcher(m, window=window)
+
+
+def build_model(data, weights, train=True):
+    # model from its JSON config and list of weight arrays, no database involved
+    if not train:
+        return numpymodel.NumpyModel(data, weights)
+    import keras as k
     m = k.models.model_from_json(data)
     m.set_weights(weights)
     m.compile(loss='mse', metrics='accuracy')
-
-    return model_id, m
+    return m
 
 
 def generate_model(layers, width):
+    import keras as k
     m = k.models.Sequential()
 
     # input must match input channels of game board
@@ -122,80 +187,120 @@ def save_model(m, b, model_id=None):
 def scan_board(b):
     # board only uses half of its array to make adjacent hex coordinates consistent: (x+-1, y+-1) and (x, y+-2)
     # to minimize input layer size we can compress by a factor of 2 on Y axis
-    input_cube = numpy.zeros((INP_CHANNELS, board.X_MAX, board.Y_MAX // 2))
-    token_pos = []
-    flag_pos = None
-    for i in range(board.X_MAX):
-        for j in range(board.Y_MAX):
-            if i % 2 == j % 2:
-                # we want to encode features of the board and tokens into channels on a 2D array
-                # terrain, acting/finished/opponent {-1, 0, +1}, hp, move, shoot
-                input_cube[INP_TERRAIN, i, j//2] = b.terrain[i, j]
-                token_chars = b.positions[i, j]
-                token = b.tokens.get(token_chars)
-                if token is not None and b.acted.count(token_chars) == 0:
-                    if token.get(board.SIDE) == b.turn and token.get(board.HP) > 0:
-                        # only mark playable units, so weed out flags and dead units
-                        token_pos.append((i, j))
-                    else:
-                        # mark enemy positions
-                        input_cube[INP_COLOR, i, j//2] = 1
-                        if token.get(board.TYPE) == board.FLAG:
-                            # for setting action expectations later
-                            flag_pos = (i, j)
-                    input_cube[INP_HEALTH, i, j//2] = token.get(board.HP)
-                    input_cube[INP_MOVE, i, j//2] = token.get(board.MV)
-                    input_cube[INP_SHOOT, i, j//2] = token.get(board.RNG)
-
-    # leave reshaping expect_cube for later
-    return input_cube.reshape(1, INP_CHANNELS, board.X_MAX, board.Y_MAX // 2), token_pos, flag_pos
+    input_cube, playable, flags = encode_cells(b, COMPRESS_X, COMPRESS_Y)
+    return finish_scan(input_cube, playable, flags)
 
 
-def generate_execute_expectation(b, selection, flag):
+def encode_cells(b, x, y):
+    # channels for the on-board hexes (x, y), which are index arrays of any shape
+    # returns the channels stacked on a leading axis, plus which hexes are playable and opponent flags
+    # we want to encode features of the board and tokens into channels on a 2D array
+    # terrain, acting/finished/opponent {-1, 0, +1}, hp, move, shoot
+    input_cube = numpy.zeros((INP_CHANNELS,) + numpy.broadcast(x, y).shape)
+    input_cube[INP_TERRAIN] = b.terrain[x, y]
+    token_chars = b.positions[x, y]
+    keys = sorted(key for key in set(token_chars.ravel().tolist()) if key in b.tokens)
+    if len(keys) == 0:
+        return input_cube, input_cube[INP_COLOR] > 0, input_cube[INP_COLOR] > 0
+
+    # one column for each token standing on these hexes, then look up which one is on each hex
+    acted = set(b.acted)
+    token_table = numpy.array([[token.get(board.HP, 0), token.get(board.MV, 0), token.get(board.RNG, 0),
+                                token.get(board.SIDE) == b.turn, token.get(board.TYPE) == board.FLAG,
+                                key not in acted] for key, token in ((key, b.tokens[key]) for key in keys)]).T
+    names = numpy.array(keys, dtype='S3')
+    token_ids = numpy.minimum(numpy.searchsorted(names, token_chars), len(names) - 1)
+    columns = token_table[:, token_ids]
+    live = (names[token_ids] == token_chars) & (columns[TOKEN_READY] > 0)
+
+    # only mark playable units, so weed out flags and dead units
+    playable = live & (columns[TOKEN_OWN] > 0) & (columns[TOKEN_HP] > 0)
+    # mark enemy positions, and the flag for setting action expectations later
+    others = live & ~playable
+    input_cube[INP_COLOR] = others
+    input_cube[INP_HEALTH:INP_SHOOT + 1] = columns[TOKEN_HP:TOKEN_RNG + 1] * live
+    return input_cube, playable, others & (columns[TOKEN_FLAG] > 0)
+
+
+def finish_scan(input_cube, playable, flags):
+    # tokens in x-major order like the board loops use, and the last opponent flag in that order
+    xs, ys = numpy.nonzero(playable)
+    token_pos = [make_coordinate(i, j) for i, j in zip(xs.tolist(), ys.tolist())]
+    flag_pos = None
+    xs, ys = numpy.nonzero(flags)
+    if len(xs) > 0:
+        flag_pos = make_coordinate(int(xs[-1]), int(ys[-1]))
+    # leave reshaping expect_cube for later
+    return input_cube.reshape(1, INP_CHANNELS, board.X_MAX, board.Y_MAX // 2).copy(), token_pos, flag_pos
+
+
+class BoardEncoder:
+    # scan_board for one board that keeps its cube between calls
+    # the board reports the hexes each move and end of turn changed, and only those are encoded again
+    def __init__(self, b):
+        self.board = b
+        self.input_cube = numpy.zeros((INP_CHANNELS, board.X_MAX, board.Y_MAX // 2))
+        self.playable = numpy.zeros((board.X_MAX, board.Y_MAX // 2), dtype=bool)
+        self.flags = numpy.zeros((board.X_MAX, board.Y_MAX // 2), dtype=bool)
+        self.dirty = set()
+        self.stale = True
+        b.listeners.append(self.touch)
+
+    def touch(self, cells):
+        if cells is None:
+            self.stale = True
+        else:
+            self.dirty.update(cells)
+
+    def detach(self):
+        if self.touch in self.board.listeners:
+            self.board.listeners.remove(self.touch)
+
+    def scan(self):
+        # same result as scan_board(self.board)
+        if self.stale:
+            self.input_cube, self.playable, self.flags = encode_cells(self.board, COMPRESS_X, COMPRESS_Y)
+        elif len(self.dirty) > 0:
+            cells = numpy.array([cell for cell in self.dirty if board.check_pos(cell)], dtype=int).reshape(-1, 2)
+            x = cells[:, board.COL]
+            y = cells[:, board.ROW]
+            self.input_cube[:, x, y // 2], self.playable[x, y // 2], self.flags[x, y // 2] = \
+                encode_cells(self.board, x, y)
+        self.stale = False
+        self.dirty.clear()
+        return finish_scan(self.input_cube, self.playable, self.flags)
+
+
+def generate_execute_expectation(b, selection, flag, masks=None):
     # place positive values on legal tiles for actions
     # caller must ensure selection result in token value
     # selection co-ordinates are game board values
-    expect_cube = numpy.zeros((board.X_MAX, board.Y_MAX // 2))
+    # masks are the (move, shoot) pair from Board.legal_action_masks, worked out here if not supplied
     x, y = selection
-    total_value = 0
-
     token_chars = b.positions[x, y]
     token = b.tokens.get(token_chars)
+    if masks is None:
+        masks = b.action_masks(selection)
+    move_mask, shoot_mask = masks
+
+    expect_board = numpy.zeros((board.X_MAX, board.Y_MAX))
+    if token.get(board.TYPE) == board.SOLDIER:
+        # encourage soldiers to take the enemy flag
+        tile_dist = board.DISTANCES[flag[board.COL], flag[board.ROW]]
+        token_dist = tile_dist[x, y]
+        expect_board[move_mask] = token_dist / (2 + tile_dist[move_mask])
+    else:
+        expect_board[move_mask] = 0.5
+    expect_board[shoot_mask] = 1
 
-    # shooting range is longer than movement range
-    # selected token set has to exclude flags
-    min_x = max(0, x - token[board.RNG])
-    max_x = min(board.X_MAX, x + token[board.RNG])
-    min_y = max(0, y - token[board.RNG])
-    max_y = min(board.Y_MAX, y + token[board.RNG])
-
-    # check every tile within shooting range for viability
-    for i in range(min_x, max_x):
-        for j in range(min_y, max_y):
-            if b.check_move(selection, (i, j)):
-                if token.get(board.TYPE) == board.SOLDIER:
-                    # encourage soldiers to take the enemy flag
-                    token_dist = board.get_distance(selection, flag)
-                    tile_dist = board.get_distance((i, j), flag)
-                    move_value = token_dist / (2 + tile_dist)
-                    expect_cube[i, j//2] = move_value
-                    total_value += move_value
-                else:
-                    move_value = 0.5
-                    expect_cube[i, j//2] = move_value
-                    total_value += move_value
-            if b.check_shoot(selection, (i, j)):
-                expect_cube[i, j//2] = 1
-                total_value += 1
-
-    if total_value == 0:
+    if not expect_board.any():
         # dump the game board to find out why we have a state with no valid moves
         print(f'Warning! No valid moves for token {token_chars}')
         print(b.positions)
         return None
 
     # reshape when passing to train_on_batch
-    return expect_cube
+    return expect_board[COMPRESS_X, COMPRESS_Y]
 
 
 def make_coordinate(xp, yp):
@@ -215,36 +320,109 @@ def interpret_output(p):
     return make_coordinate(i, j)
 
 
-def move_token(b, m, train=True, flip=None):
-    # update token locations and status (HP)
-    # input_data is our output for experience learning later
-    input_data, token_list, opp_flag = scan_board(b)
+def generate_reward(state, move):
+    # reward map for the state we moved out of, marking the spot we moved to
+    to_x = move[board.COL]
+    to_y = move[board.ROW] // 2
+    if state[0, INP_COLOR, to_x, to_y] == 1:
+        # reward for attacking an opponent token
+        reward_value = 0.5
+    else:
+        # reward for moving to empty tile
+        reward_value = 0.25
+    state_reward = numpy.zeros((board.X_MAX, board.Y_MAX // 2))
+    state_reward[to_x, to_y] = reward_value
+    return state_reward
+
+
+def prepare_move(b, encoder=None):
+    # pick the token to play and work out where it may go, without changing the board
+    # returns input_data, execute_expected, frm or all None when the side has nothing left to play
+    # encoder is a BoardEncoder attached to b, to avoid scanning the whole board every move
+    if encoder is not None:
+        input_data, token_list, opp_flag = encoder.scan()
+    else:
+        input_data, token_list, opp_flag = scan_board(b)
 
     if len(token_list) == 0:
         # no tokens to move
-        b.finish_turn()
-        return None, None
+        return None, None, None
+
+    # legal actions for every token we might pick, in one pass
+    masks = b.legal_action_masks(b.turn)
 
     for frm in token_list:
         # sometimes tokens will be stuck behind friendly units so we have to skip them
         select_x, select_y = frm
         # remember we're on batch item 0 when marking our active token
         input_data[0, INP_COLOR, select_x, select_y // 2] = -1
-        execute_expected = generate_execute_expectation(b, frm, opp_flag)
+        execute_expected = generate_execute_expectation(b, frm, opp_flag, masks.get(frm))
         if execute_expected is not None:
             break
 
     if execute_expected is None:
         # last playable token has no legal moves
-        b.finish_turn()
-        return None, None
+        return None, None, None
+    return input_data, execute_expected, frm
+
+
+def select_move(b, m, model_key=None, encoder=None):
+    # ask the network where the next token goes, without changing the board
+    # returns input_data, execute_expected, frm, to or all None when the side has nothing left to play
+    # model_key names the weights in m, such as (model id, weight version), so predictions can be cached against the board hash
+    return select_moves([b], m, model_key, [encoder])[0]
+
+
+def select_moves(boards, m, model_key=None, encoders=None):
+    # select_move for several boards with a single predict call on the stacked input cubes
+    # m can be a model or anything else with its predict, such as an InferenceBatcher
+    if encoders is None:
+        encoders = [None] * len(boards)
+    moves = [prepare_move(b, encoder) for b, encoder in zip(boards, encoders)]
 
     # now trap the network in here until it puts the piece down on a legal tile
     # use expectation as a mask for prediction, so that illegal moves are never considered
-    execute_prediction = m.predict(input_data, verbose=0)
-    execute_prediction = execute_prediction.reshape(board.X_MAX, board.Y_MAX // 2)
-    masked_prediction = numpy.multiply(execute_prediction, execute_expected)
-    to = interpret_output(masked_prediction)
+    predictions = [None] * len(boards)
+    cache_keys = [None] * len(boards)
+    missing = []
+    for i, (b, move) in enumerate(zip(boards, moves)):
+        if move[0] is None:
+            continue
+        if model_key is not None:
+            # the input cube is a pure function of the board, so the hash stands in for it
+            cache_keys[i] = ('predict', model_key, b.hash)
+            predictions[i] = zobrist.TRANSPOSITIONS.get(cache_keys[i])
+        if predictions[i] is None:
+            missing.append(i)
+    if len(missing) > 0:
+        outputs = m.predict(numpy.concatenate([moves[i][0] for i in missing]), verbose=0)
+        for i, output in zip(missing, outputs):
+            predictions[i] = output.reshape(board.X_MAX, board.Y_MAX // 2)
+            if cache_keys[i] is not None:
+                zobrist.TRANSPOSITIONS.put(cache_keys[i], predictions[i])
+
+    results = []
+    for (input_data, execute_expected, frm), execute_prediction in zip(moves, predictions):
+        if input_data is None:
+            results.append((None, None, None, None))
+        else:
+            masked_prediction = numpy.multiply(execute_prediction, execute_expected)
+            results.append((input_data, execute_expected, frm, interpret_output(masked_prediction)))
+    return results
+
+
+def move_token(b, m, train=True, flip=None, model_key=None, encoder=None):
+    # update token locations and status (HP)
+    # input_data is our output for experience learning later
+    # weights change while training, so predictions are only cached when we aren't
+    if train:
+        model_key = None
+    input_data, execute_expected, frm, to = select_move(b, m, model_key, encoder)
+
+    if input_data is None:
+        # no token left that can act
+        b.finish_turn()
+        return None, None
 
     if train:
         # training uses the highest probability move and retrains on expectations if not legal
@@ -0,0 +1,142 @@
+import threading
+from collections import OrderedDict
+from agents import learningplayer
+
+# loaded models kept between /learningplayer/init calls, so switching models only pays for the first load
+# entries are keyed by model id and remember the weight version they were loaded at
+# a background poll reloads any cached model whose weights were saved again since
+CACHE_BYTES = 256 * 1024 * 1024
+POLL_INTERVAL = 10.0
+
+
+class ModelCache:
+    # b is only used to read models, give the cache its own board so the poll thread never shares a connection
+    # with request handling
+    def __init__(self, b, capacity=CACHE_BYTES, train=False):
+        self.board = b
+        self.capacity = capacity
+        self.train = train
+        # model id: (version, model, bytes)
+        self.entries = OrderedDict()
+        self.size = 0
+        # model id: InferenceBatcher shared by every player on that model
+        self.batchers = {}
+        self.lock = threading.Lock()
+        # one database user at a time, and no two threads loading the same model
+        self.io_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.poller = None
+
+    def get(self, model_id=None):
+        # returns (model_id, model), None model_id is the latest model
+        model_id, version, m = self.get_versioned(model_id)
+        return model_id, m
+
+    def get_versioned(self, model_id=None):
+        # returns (model_id, weight version, model), the version tells cached predictions from different weights apart
+        versions = None
+        if model_id is None:
+            versions = self.versions()
+            if len(versions) == 0:
+                return None, None, None
+            model_id = max(versions)
+        model_id = int(model_id)
+        with self.lock:
+            entry = self.entries.get(model_id)
+            if entry is not None:
+                self.entries.move_to_end(model_id)
+                return model_id, entry[0], entry[1]
+        if versions is None:
+            versions = self.versions()
+        version, m = self.load(model_id, versions.get(model_id, 0))
+        return model_id, version, m
+
+    def versions(self):
+        with self.io_lock:
+            versions = self.board.list_model_versions()
+        if versions is None:
+            return {}
+        return versions
+
+    def load(self, model_id, version):
+        with self.io_lock:
+            with self.lock:
+                # somebody else may have loaded it while we waited
+                entry = self.entries.get(model_id)
+                if entry is not None and entry[0] >= version:
+                    return entry[0], entry[1]
+            config, weights = self.board.load_model(model_id)
+            m = learningplayer.build_model(config, weights, self.train)
+        self.put(model_id, version, m)
+        return version, m
+
+    def put(self, model_id, version, m):
+        size = sum(w.nbytes for w in m.get_weights())
+        with self.lock:
+            old = self.entries.pop(model_id, None)
+            if old is not None:
+                self.size -= old[2]
+            self.entries[model_id] = (version, m, size)
+            self.size += size
+            # always keep the model we just loaded, even if it is bigger than the whole cache
+            closing = []
+            while self.size > self.capacity and len(self.entries) > 1:
+                evicted_id, evicted = self.entries.popitem(last=False)
+                self.size -= evicted[2]
+                if evicted_id in self.batchers:
+                    closing.append(self.batchers.pop(evicted_id))
+        for batcher in closing:
+            batcher.close()
+
+    def batcher(self, model_id, m):
+        # the shared batcher for model m, replaced when a refresh swaps in new weights
+        with self.lock:
+            shared = self.batchers.get(model_id)
+            if shared is not None and shared.m is m:
+                return shared
+            self.batchers[model_id] = learningplayer.make_batcher(m)
+            new = self.batchers[model_id]
+        if shared is not None:
+            # anything already queued on the old batcher is answered before it stops
+            shared.close()
+        return new
+
+    def version(self, model_id):
+        with self.lock:
+            entry = self.entries.get(int(model_id))
+        if entry is None:
+            return None
+        return entry[0]
+
+    def preload_latest(self):
+        return self.get(None)
+
+    def refresh(self):
+        # reload every cached model that has newer weights in the database, swapping it in once it's built
+        versions = self.versions()
+        with self.lock:
+            stale = [(model_id, versions[model_id]) for model_id, entry in self.entries.items()
+                     if versions.get(model_id, entry[0]) > entry[0]]
+        for model_id, version in stale:
+            self.load(model_id, version)
+        return [model_id for model_id, version in stale]
+
+    def start(self, interval=POLL_INTERVAL):
+        if self.poller is None:
+            self.stop_event.clear()
+            self.poller = threading.Thread(target=self.poll, args=(interval,), daemon=True)
+            self.poller.start()
+
+    def stop(self):
+        if self.poller is not None:
+            self.stop_event.set()
+            self.poller.join()
+            self.poller = None
+
+    def poll(self, interval):
+        while not self.stop_event.wait(interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                # keep serving the models we have, the next poll will try again
+                print(f'Model refresh failed: {e}')
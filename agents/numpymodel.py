@@ -0,0 +1,138 @@
+import json
+import numpy
+
+# inference-only runtime for the models generate_model builds, no tensorflow needed
+# reads the same model JSON and weight list keras saves, and runs the layers as numpy matmuls
+# layers keras might put in a saved Sequential stack that change nothing at inference time
+PASS_LAYERS = ('InputLayer', 'Dropout', 'GaussianNoise', 'GaussianDropout', 'ActivityRegularization')
+
+
+def relu(x, out):
+    return numpy.maximum(x, 0, out=out)
+
+
+def sigmoid(x, out):
+    # 1 / (1 + exp(-x)) written so every step reuses out
+    numpy.negative(x, out=out)
+    numpy.exp(out, out=out)
+    numpy.add(out, 1, out=out)
+    return numpy.reciprocal(out, out=out)
+
+
+def tanh(x, out):
+    return numpy.tanh(x, out=out)
+
+
+def linear(x, out):
+    if out is not x:
+        out[...] = x
+    return out
+
+
+def softmax(x, out):
+    numpy.subtract(x, x.max(axis=-1, keepdims=True), out=out)
+    numpy.exp(out, out=out)
+    return numpy.divide(out, out.sum(axis=-1, keepdims=True), out=out)
+
+
+ACTIVATIONS = {None: linear, 'linear': linear, 'relu': relu, 'sigmoid': sigmoid, 'tanh': tanh, 'softmax': softmax}
+
+
+def activation_name(activation):
+    # keras 3 can serialize an activation as a dict rather than a plain name
+    if isinstance(activation, dict):
+        config = activation.get('config')
+        if isinstance(config, str):
+            return config
+        return activation.get('class_name')
+    return activation
+
+
+class NumpyModel:
+    # compiled from a keras model JSON config and its get_weights() list
+    # predict() has the keras signature, so this can stand in for the model anywhere we only infer
+    # work buffers are kept per batch size and reused, only the returned prediction is a new array
+    def __init__(self, config_json, weights, dtype=numpy.float32):
+        self.dtype = dtype
+        self.steps = []
+        self.buffers = {}
+        config = config_json
+        if isinstance(config, (str, bytes, bytearray)):
+            config = json.loads(config)
+        layers = config['config']['layers']
+        for layer in layers:
+            name = layer['class_name']
+            layer_config = layer.get('config', {})
+            if name in PASS_LAYERS:
+                continue
+            elif name == 'Flatten':
+                self.steps.append(('flatten', layer_config.get('data_format') == 'channels_first'))
+            elif name == 'Dense':
+                self.steps.append(('dense', layer_config.get('use_bias', True),
+                                   ACTIVATIONS[activation_name(layer_config.get('activation'))]))
+            elif name == 'Activation':
+                self.steps.append(('activation', ACTIVATIONS[activation_name(layer_config.get('activation'))]))
+            elif name == 'ReLU':
+                self.steps.append(('activation', relu))
+            else:
+                raise ValueError(f'NumpyModel has no {name} layer')
+        self.kernels = []
+        self.biases = []
+        self.set_weights(weights)
+
+    def set_weights(self, weights):
+        # weights in keras get_weights() order: kernel then bias for every Dense layer
+        self.kernels = []
+        self.biases = []
+        weight_list = list(weights)
+        for step in self.steps:
+            if step[0] == 'dense':
+                self.kernels.append(numpy.ascontiguousarray(weight_list.pop(0), dtype=self.dtype))
+                if step[1]:
+                    self.biases.append(numpy.asarray(weight_list.pop(0), dtype=self.dtype))
+                else:
+                    self.biases.append(None)
+        if len(weight_list) > 0:
+            raise ValueError(f'{len(weight_list)} weight arrays left over after the last layer')
+        self.buffers = {}
+
+    def get_weights(self):
+        weights = []
+        for kernel, bias in zip(self.kernels, self.biases):
+            weights.append(kernel)
+            if bias is not None:
+                weights.append(bias)
+        return weights
+
+    def work_buffers(self, rows):
+        # one output array per dense layer for this batch size
+        buffers = self.buffers.get(rows)
+        if buffers is None:
+            buffers = [numpy.empty((rows, kernel.shape[1]), dtype=self.dtype) for kernel in self.kernels]
+            self.buffers[rows] = buffers
+        return buffers
+
+    def predict(self, inputs, verbose=0):
+        x = numpy.asarray(inputs, dtype=self.dtype)
+        buffers = self.work_buffers(len(x))
+        dense = 0
+        for step in self.steps:
+            if step[0] == 'flatten':
+                if step[1] and x.ndim > 2:
+                    # keras flattens channels_first inputs in channels_last order
+                    x = numpy.moveaxis(x, 1, -1)
+                x = x.reshape(len(x), -1)
+            elif step[0] == 'dense':
+                out = buffers[dense]
+                numpy.matmul(x, self.kernels[dense], out=out)
+                if self.biases[dense] is not None:
+                    numpy.add(out, self.biases[dense], out=out)
+                x = step[2](out, out)
+                dense += 1
+            elif dense > 0 and x is buffers[dense - 1]:
+                x = step[1](x, x)
+            else:
+                # activation straight on the inputs, which belong to the caller
+                x = step[1](x, numpy.empty_like(x))
+        # callers keep predictions around, so never hand out a work buffer
+        return numpy.array(x)
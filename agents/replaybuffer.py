@@ -0,0 +1,79 @@
+import os
+import numpy
+from numpy.lib import format as npy
+
+# fixed capacity store of (state, reward) experience, oldest entries are overwritten once full
+# arrays are allocated once up front, so recording a move is a copy into the next free row
+REPLAY_SIZE = 20000
+# meta rows for a spilled buffer
+META_LENGTH = 0
+META_NEXT = 1
+
+
+class ReplayBuffer:
+    # state_shape is one input cube, e.g. (INP_CHANNELS, X_MAX, Y_MAX // 2), rewards are flat rows of reward_size
+    # with a path the arrays live in memory-mapped .npy files, and an existing buffer at that path is reopened
+    def __init__(self, state_shape, reward_size, capacity=REPLAY_SIZE, path=None, dtype=numpy.float32):
+        self.capacity = capacity
+        self.path = path
+        if path is None:
+            self.inputs = numpy.zeros((capacity,) + tuple(state_shape), dtype=dtype)
+            self.rewards = numpy.zeros((capacity, reward_size), dtype=dtype)
+            self.meta = numpy.zeros(2, dtype=numpy.int64)
+        elif os.path.exists(path + '.meta.npy'):
+            self.inputs = npy.open_memmap(path + '.inputs.npy', mode='r+')
+            self.rewards = npy.open_memmap(path + '.rewards.npy', mode='r+')
+            self.meta = npy.open_memmap(path + '.meta.npy', mode='r+')
+            self.capacity = self.inputs.shape[0]
+        else:
+            self.inputs = npy.open_memmap(path + '.inputs.npy', mode='w+', dtype=dtype,
+                                          shape=(capacity,) + tuple(state_shape))
+            self.rewards = npy.open_memmap(path + '.rewards.npy', mode='w+', dtype=dtype,
+                                           shape=(capacity, reward_size))
+            self.meta = npy.open_memmap(path + '.meta.npy', mode='w+', dtype=numpy.int64, shape=(2,))
+
+    def __len__(self):
+        return int(self.meta[META_LENGTH])
+
+    def append(self, state, reward):
+        # state may carry the leading batch axis of 1 that scan_board returns
+        row = int(self.meta[META_NEXT])
+        self.inputs[row] = state.reshape(self.inputs.shape[1:])
+        self.rewards[row] = reward.reshape(self.rewards.shape[1])
+        self.meta[META_NEXT] = (row + 1) % self.capacity
+        self.meta[META_LENGTH] = min(self.capacity, self.meta[META_LENGTH] + 1)
+
+    def recent(self, count):
+        # row indexes of the last count entries, oldest first
+        count = min(count, len(self))
+        return (self.meta[META_NEXT] - count + numpy.arange(count)) % self.capacity
+
+    def flip_rewards(self, count=None):
+        # negate rewards in place, for the last count entries or the whole buffer
+        if count is None or count >= len(self):
+            numpy.negative(self.rewards[:len(self)], out=self.rewards[:len(self)])
+        else:
+            rows = self.recent(count)
+            self.rewards[rows] = numpy.negative(self.rewards[rows])
+
+    def contents(self):
+        # every stored entry as (inputs, rewards) views, in storage order rather than time order
+        return self.inputs[:len(self)], self.rewards[:len(self)]
+
+    def sample(self, batch_size, rng=None):
+        # uniform random minibatch, with replacement so small buffers still fill a batch
+        if rng is None:
+            rng = numpy.random.default_rng()
+        rows = rng.integers(0, len(self), batch_size)
+        return self.inputs[rows], self.rewards[rows]
+
+    def clear(self):
+        self.meta[META_LENGTH] = 0
+        self.meta[META_NEXT] = 0
+
+    def flush(self):
+        # write a spilled buffer out to disk, nothing to do for one held in memory
+        if self.path is not None:
+            self.inputs.flush()
+            self.rewards.flush()
+            self.meta.flush()
@@ -0,0 +1,159 @@
+import multiprocessing
+import os
+import queue
+import time
+import numpy
+from server import board
+
+# self-play farm: worker processes play LearningPlayer games against themselves on offline boards
+# and stream (state, expectation, reward) samples to the trainer, which fits and broadcasts new weights
+# workers only ever read weights, the trainer process is the only one that calls fit
+FIT_EVERY = 2048
+MAX_MOVES = 2000
+# games each worker plays side by side, sharing one predict call per step
+LOCKSTEP_GAMES = 16
+SAMPLE_QUEUE_SIZE = 256
+
+
+def play_game(b, m, model_key):
+    # one game against itself, returns stacked states, expectations and rewards for every move made
+    return play_games([b], m, model_key)[0]
+
+
+def play_games(boards, m, model_key):
+    # play every board to the end in lockstep, so each step asks the network about all live games at once
+    # rewards flip sign at every end of turn just like LearningPlayer.play_token does
+    from agents import learningplayer
+    states = [[] for b in boards]
+    expectations = [[] for b in boards]
+    rewards = [[] for b in boards]
+    encoders = [learningplayer.BoardEncoder(b) for b in boards]
+    while True:
+        live = [i for i, b in enumerate(boards) if b.victory is None and len(states[i]) < MAX_MOVES]
+        if len(live) == 0:
+            break
+        selected = learningplayer.select_moves(
+            [boards[i] for i in live], m, model_key, [encoders[i] for i in live])
+        for i, (input_data, expected, frm, to) in zip(live, selected):
+            b = boards[i]
+            if input_data is not None and b.resolve_action(frm, to):
+                states[i].append(input_data[0])
+                expectations[i].append(expected)
+                rewards[i].append(learningplayer.generate_reward(input_data, to))
+            else:
+                # nothing left to play (or the network found nothing legal), so the turn passes
+                b.finish_turn()
+                for reward in rewards[i]:
+                    numpy.negative(reward, out=reward)
+
+    games = []
+    for i in range(len(boards)):
+        encoders[i].detach()
+        if len(states[i]) == 0:
+            games.append(None)
+        else:
+            games.append((numpy.stack(states[i]), numpy.stack(expectations[i]), numpy.stack(rewards[i])))
+    return games
+
+
+def worker(worker_id, template, config_json, weights, version, weight_queue, sample_queue, stop):
+    # workers only predict, so they run the numpy model and never import tensorflow
+    from agents import learningplayer
+    m = learningplayer.build_model(config_json, weights, train=False)
+    while not stop.is_set():
+        # pick up the newest weights the trainer has broadcast, skipping any we missed
+        new_weights = None
+        try:
+            while True:
+                version, new_weights = weight_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if new_weights is not None:
+            m.set_weights(new_weights)
+
+        boards = [template.clone() for i in range(LOCKSTEP_GAMES)]
+        for b, game in zip(boards, play_games(boards, m, ('selfplay', version))):
+            if game is not None:
+                sample_queue.put((worker_id, version, b.victory) + game)
+
+
+def train(template, model_id, workers=None, games=1000, fit_every=FIT_EVERY):
+    # run self-play on `workers` processes until `games` games have come back, fitting as samples arrive
+    from agents import learningplayer
+    if workers is None:
+        workers = os.cpu_count()
+    model_id, m = learningplayer.load_model(template, model_id)
+    config_json = m.to_json()
+    offline = template.clone()
+
+    # spawn so workers don't inherit the trainer's tensorflow state
+    # and keep every worker to one BLAS thread so K workers use K cores, numpy reads this as it loads
+    context = multiprocessing.get_context('spawn')
+    for variable in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+        os.environ[variable] = '1'
+    sample_queue = context.Queue(SAMPLE_QUEUE_SIZE)
+    stop = context.Event()
+    weight_queues = []
+    processes = []
+    for i in range(workers):
+        weight_queue = context.Queue()
+        process = context.Process(target=worker, daemon=True, args=(
+            i, offline, config_json, m.get_weights(), 0, weight_queue, sample_queue, stop))
+        process.start()
+        weight_queues.append(weight_queue)
+        processes.append(process)
+
+    version = 0
+    finished = 0
+    total_moves = 0
+    pending = []
+    start = time.perf_counter()
+    while finished < games:
+        worker_id, played_version, victory, states, expectations, rewards = sample_queue.get()
+        finished += 1
+        total_moves += len(states)
+        pending.append((states, expectations, rewards))
+        if sum(len(p[0]) for p in pending) >= fit_every or finished == games:
+            train_inputs = numpy.concatenate([p[0] for p in pending])
+            train_expected = numpy.concatenate([p[1] for p in pending]).reshape(-1, learningplayer.LAYER_SIZE)
+            # add 0.5 to total rewards so training values are 0 or 1, like play_token
+            train_rewards = numpy.add(numpy.concatenate([p[2] for p in pending]), 0.5)
+            m.fit(train_inputs, train_expected, verbose=0)
+            m.fit(train_inputs, train_rewards.reshape(-1, learningplayer.LAYER_SIZE), verbose=0)
+            pending = []
+            version += 1
+            new_weights = m.get_weights()
+            for weight_queue in weight_queues:
+                weight_queue.put((version, new_weights))
+            duration = time.perf_counter() - start
+            print(f'weights v{version}: {finished} games, {total_moves} moves, {total_moves / duration:.0f} moves/s')
+
+    stop.set()
+    for process in processes:
+        process.join(timeout=10)
+        if process.is_alive():
+            process.terminate()
+    save_model_id = learningplayer.save_model(m, template, model_id)
+    return save_model_id, m
+
+
+if __name__ == '__main__':
+    game_board = board.Board()
+    print(f'Available player models: {game_board.list_models()}')
+    model_input = input('Enter model number to train [LATEST]:')
+    model_number = None
+    if len(model_input) > 0:
+        model_number = model_input
+    print(f'Available configurations: {game_board.list_configs()}')
+    config_input = input('Enter configuration number [ENTER for none]:')
+    if len(config_input) > 0:
+        game_board.load_config(config_input)
+    worker_input = input(f'Enter number of worker processes [{os.cpu_count()}]:')
+    worker_count = os.cpu_count()
+    if len(worker_input) > 0:
+        worker_count = int(worker_input)
+    game_input = input('Enter number of games to play [1000]:')
+    game_count = 1000
+    if len(game_input) > 0:
+        game_count = int(game_input)
+    train(game_board, model_number, worker_count, game_count)
@@ -1,11 +1,12 @@
+import numpy
 from server import board
 
 
-def play_turn(b):
+def play_turn(b, acted=None):
+    # acted() is called after every action, so the server can send each one to watchers as it happens
     # these structures are going to contain coordinate:unit status
     # we'll use functions built for the REST API
     tokens = {}
-    targets = {}
     
     # basis for movement actions
     flag = None
@@ -26,9 +27,9 @@ def play_turn(b):
                         # enemy flag is necessary for movement
                         flag = (i, j)
                         print(f'Target flag: {token_status} at {flag}')
-                    else:
-                        # all the enemy in a list, minus the flag
-                        targets[board.make_coord_num((i, j))] = token_status
+
+    # shoot masks for all of our tokens in one pass over the board
+    masks = b.legal_action_masks(b.turn)
 
     # go over the lists and see if any of our tokens can shoot an enemy
     # otherwise move towards the flag co-ordinates identified previously
@@ -37,13 +38,12 @@ def play_turn(b):
         token_coord = board.make_coord_tuple(int(tok))
         action_coord = None
 
-        # check if you can shoot any enemy
-        for tgt in targets:
-            target_status = targets.get(tgt)
-            target_coord = board.make_coord_tuple(int(tgt))
-            dist = board.get_distance(token_coord, target_coord)
-            if dist <= token_status[board.RNG] and target_status[board.TYPE] != board.FLAG:
-                action_coord = target_coord
+        # check if you can shoot any enemy, last target found wins like it always has
+        if token_coord in masks:
+            move_mask, shoot_mask = masks[token_coord]
+            targets = numpy.argwhere(shoot_mask)
+            if len(targets) > 0:
+                action_coord = (int(targets[-1][board.COL]), int(targets[-1][board.ROW]))
 
         # follow a path to the enemy flag, there is zero strategy to this logic
         if action_coord is None:
@@ -55,6 +55,8 @@ def play_turn(b):
         if action_coord is not None:
             print(f'{token_coord} to {action_coord}')
             b.resolve_action(token_coord, action_coord)
+            if acted is not None:
+                acted()
 
 
 if __name__ == '__main__':
@@ -174,6 +174,13 @@ def draw_to_screen():
     screen.blit(token_surface, (0, 0))
 
 
+def refresh(state=None):
+    # one /board/state call for everything that changes during play, a 304 when nothing did
+    if state is None:
+        state = restclient.get_state()
+    return state['turn'], state['victory'], state['positions'], state['units'], state['acted']
+
+
 def play_loop():
     clock = pg.time.Clock()
     pg.display.set_caption("hexbattle")
@@ -184,11 +191,10 @@ def play_loop():
     controls = {}
 
     # get all of our initial state
-    terrain = restclient.get_terrain()
-    positions = restclient.get_positions()
-    tokens = restclient.get_units()
-    acted = restclient.get_acted()
-    turn = restclient.get_turn()
+    terrain = restclient.get_state()['terrain']
+    turn, win, positions, tokens, acted = refresh(restclient.current_state())
+    # moves by other players and the AI arrive as events, changed is set when there's something to redraw
+    changed = restclient.watch_state()
 
     tiles = draw_board(terrain)
     draw_state_text(win, state)
@@ -226,6 +232,11 @@ def play_loop():
             background.blit(end_turn_text, end_turn_pos)
 
         clock.tick(60)
+        if changed.is_set():
+            changed.clear()
+            turn, win, positions, tokens, acted = refresh(restclient.current_state())
+            draw_state_text(win, state)
+            draw_tokens(positions, tokens, acted)
         for event in pg.event.get():
             if event.type == pg.MOUSEBUTTONDOWN:
                 tile_clicked = pg.Rect(pg.mouse.get_pos(), (1, 1)).collidedict(tiles)
@@ -233,34 +244,24 @@ def play_loop():
                 if control_clicked is not None:
                     if control_clicked[1] == END:
                         state = SELECT
-                        turn = restclient.post_turn(turn)
-                        win = restclient.get_victory()
-                        acted = restclient.get_acted()
+                        restclient.post_turn(turn)
+                        turn, win, positions, tokens, acted = refresh()
                         draw_tokens(positions, tokens, acted)
                     elif control_clicked[1] == RESTART:
                         state = SELECT
                         draw_state_text(win, state)
                         restclient.init_board()
-                        turn = restclient.get_turn()
-                        positions = restclient.get_positions()
-                        acted = restclient.get_acted()
-                        tokens = restclient.get_units()
+                        turn, win, positions, tokens, acted = refresh()
                         draw_tokens(positions, tokens, acted)
                     elif control_clicked[1] == AUTO:
                         state = SELECT
-                        turn = restclient.auto_turn()
-                        win = restclient.get_victory()
-                        positions = restclient.get_positions()
-                        acted = restclient.get_acted()
-                        tokens = restclient.get_units()
+                        restclient.auto_turn()
+                        turn, win, positions, tokens, acted = refresh()
                         draw_tokens(positions, tokens, acted)
                     elif control_clicked[1] == AI:
                         state = SELECT
-                        turn = restclient.ai_turn()
-                        win = restclient.get_victory()
-                        positions = restclient.get_positions()
-                        acted = restclient.get_acted()
-                        tokens = restclient.get_units()
+                        restclient.ai_turn()
+                        turn, win, positions, tokens, acted = refresh()
                         draw_tokens(positions, tokens, acted)
                 if tile_clicked is None:
                     state = SELECT
@@ -273,9 +274,8 @@ def play_loop():
                     token_xy = token_tile[1]
                     action_xy = action_tile[1]
                     # use the refactored "do the thing" method here
-                    positions = restclient.post_position(list(token_xy), list(action_xy))
-                    tokens = restclient.get_units()
-                    acted = restclient.get_acted()
+                    restclient.post_position(list(token_xy), list(action_xy))
+                    turn, win, positions, tokens, acted = refresh()
                     draw_tokens(positions, tokens, acted)
                     token_tile = None
                     action_tile = None
@@ -304,6 +304,7 @@ def play_loop():
         if state == CONFIRM:
             screen.blit(overlay_surface, (0, 0))
     # exit game to session launcher
+    restclient.stop_watching()
     clear()
 
 
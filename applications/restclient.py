@@ -1,12 +1,18 @@
+import asyncio
+import gzip
 import json
+import threading
 import time
 import numpy
 import requests
+from requests.adapters import HTTPAdapter
 from server import board
 
 URL = 'http://localhost:5000'
 # URL = 'http://hexbattle-env.eba-c7dstjkp.us-east-1.elasticbeanstalk.com'
 DIMENSIONS_PATH = '/board/dimensions'
+STATE_PATH = '/board/state'
+EVENTS_PATH = '/board/events'
 TERRAIN_PATH = '/board/terrain'
 RESTART_PATH = '/board/reset'
 TURN_PATH = '/player/turn'
@@ -14,12 +20,15 @@ VICTORY_PATH = '/player/victory'
 ACTED_PATH = '/tokens/acted'
 ACTIONS_PATH = '/token/actions'
 POSITIONS_PATH = '/tokens/positions'
+BATCH_PATH = '/tokens/batch'
 STATUS_PATH = '/tokens/status'
 
 SIMPLEPLAYER_PATH = '/simpleplayer/turn'
 LEARNINGPLAYER_TURN_PATH = '/learningplayer/turn'
 LEARNINGPLAYER_MODELS = '/learningplayer/list'
 LEARNINGPLAYER_INIT = '/learningplayer/init'
+LEARNINGPLAYER_START_PATH = '/learningplayer/turn/start'
+JOB_PATH = '/jobs/'
 
 SAVE_TERRAIN_PATH = '/edit/terrain'
 SAVE_POSITIONS_PATH = '/edit/positions'
@@ -32,6 +41,14 @@ SESSION_CREATE_PATH = '/session/create'
 BOARD_LIST_PATH = '/board/list'
 BOARD_LOAD_PATH = '/board/load'
 
+# connections kept open to the server, also how many requests an AsyncRestClient has in flight at once
+POOL_SIZE = 8
+TIMEOUT = 30
+# request bodies at least this big are gzipped when a client has gzip on
+GZIP_MIN = 1024
+# tells the server the body is plain JSON, older clients sent a JSON string holding the JSON
+JSON_ONCE_HEADER = 'X-Json-Once'
+
 
 def _fill_terrain(terrain_data):
     new_terrain = numpy.zeros((board.X_MAX, board.Y_MAX))
@@ -50,151 +67,446 @@ def _fill_positions(position_data):
     return new_positions
 
 
-def _get(path):
-    print(path)
-    start = time.perf_counter()
-    response = requests.get(URL+path)
-    duration = time.perf_counter() - start
-    print(f'duration {duration}')
-    return response.json()
+def apply_diff(state, version, diff):
+    # bring a get_state() state up to an event's version, diffs older than the state are skipped
+    if version <= state['version']:
+        return False
+    for key, unit_id in diff.get('positions', {}).items():
+        coordinates = board.make_coord_tuple(int(key))
+        state['positions'][coordinates[board.COL], coordinates[board.ROW]] = unit_id.encode('UTF-8')
+    for unit_id, stats in diff.get('units', {}).items():
+        state['units'].setdefault(unit_id, {}).update(stats)
+    for key in ('acted', 'turn', 'victory'):
+        if key in diff:
+            state[key] = diff[key]
+    state['version'] = version
+    return True
+
+
+def _read_events(response):
+    # (event, id, data) for every server-sent event in a streaming response
+    kind = 'message'
+    event_id = None
+    data = []
+    for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+        if line == '':
+            if data:
+                yield kind, event_id, '\n'.join(data)
+            kind = 'message'
+            data = []
+        elif not line.startswith(':'):
+            field, _, value = line.partition(':')
+            if value.startswith(' '):
+                value = value[1:]
+            if field == 'event':
+                kind = value
+            elif field == 'id':
+                event_id = value
+            elif field == 'data':
+                data.append(value)
+
+
+def print_metrics(method, path, status, duration):
+    # metrics hook that logs like the client used to
+    print(f'{method} {path} {status} duration {duration}')
+
+
+class RestClient:
+    # one game server, over a keep-alive connection pool so a click doesn't pay for a new TCP connection
+    # metrics is called as metrics(method, path, status, seconds) after every request
+    # use_gzip compresses large request bodies, responses are compressed whenever the server chooses to
+    def __init__(self, url=URL, session_id=None, use_gzip=False, metrics=None, timeout=TIMEOUT):
+        self.url = url
+        # the game session this client plays, sent as ?session= on every request
+        # None plays on the server's default board
+        self.session_id = session_id
+        self.use_gzip = use_gzip
+        self.metrics = metrics
+        self.timeout = timeout
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        self.http.headers['Accept-Encoding'] = 'gzip'
+        # the last /board/state and its ETag, an unchanged board comes back as a 304 and this is reused
+        self.state = None
+        self.state_etag = None
+        self.state_lock = threading.Lock()
+        # (thread, stop event) following /board/events, see watch_state
+        self.watcher = None
+
+    def close(self):
+        self.stop_watching()
+        self.http.close()
+
+    def session_params(self, params=None):
+        if self.session_id is None:
+            return params
+        out = {'session': self.session_id}
+        if params is not None:
+            out.update(params)
+        return out
+
+    def request(self, method, path, data=None, params=None, headers=None, **kwargs):
+        # the raw response, data is sent as a JSON body
+        send_headers = {}
+        if headers is not None:
+            send_headers.update(headers)
+        body = None
+        if data is not None:
+            body = json.dumps(data).encode('UTF-8')
+            send_headers['Content-Type'] = 'application/json'
+            send_headers[JSON_ONCE_HEADER] = '1'
+            if self.use_gzip and len(body) >= GZIP_MIN:
+                body = gzip.compress(body)
+                send_headers['Content-Encoding'] = 'gzip'
+        start = time.perf_counter()
+        response = self.http.request(method, self.url+path, data=body, params=self.session_params(params),
+                                     headers=send_headers, timeout=kwargs.pop('timeout', self.timeout), **kwargs)
+        if self.metrics is not None:
+            self.metrics(method, path, response.status_code, time.perf_counter() - start)
+        return response
+
+    def get(self, path, params=None):
+        return self.request('GET', path, params=params).json()
+
+    def post(self, path, data):
+        return self.request('POST', path, data).json()
+
+    def get_state(self):
+        # the whole board in one request, as
+        # {'version', 'terrain': array, 'positions': array, 'units', 'acted', 'turn', 'victory'}
+        headers = {}
+        if self.state is not None and self.state['session'] == self.session_id:
+            headers['If-None-Match'] = self.state_etag
+        response = self.request('GET', STATE_PATH, headers=headers)
+        if response.status_code == 304:
+            return self.state
+        data = response.json()
+        with self.state_lock:
+            self.state = {'session': self.session_id, 'version': data['version'],
+                          'terrain': _fill_terrain(data['terrain']), 'positions': _fill_positions(data['positions']),
+                          'units': data['units'], 'acted': data['acted'], 'turn': data['turn'],
+                          'victory': data['victory']}
+            self.state_etag = response.headers.get('ETag')
+        return self.state
+
+    def current_state(self):
+        # the state as of the last get_state or event, without asking the server
+        return self.state
+
+    def follow_events(self, session_id, changed, stop):
+        while not stop.is_set():
+            headers = {}
+            if self.state is not None and self.state['session'] == session_id and self.state_etag is not None:
+                headers['Last-Event-ID'] = self.state_etag.strip('"')
+            try:
+                # events get a connection of their own, the stream would hold a pooled one for good
+                with requests.get(self.url+EVENTS_PATH, params=self.session_params(), headers=headers, stream=True,
+                                  timeout=(5, 60)) as response:
+                    for kind, event_id, data in _read_events(response):
+                        if stop.is_set():
+                            return
+                        if kind == 'reset':
+                            self.get_state()
+                        elif kind == 'diff':
+                            version = int(event_id.rpartition('-')[2])
+                            with self.state_lock:
+                                if apply_diff(self.state, version, json.loads(data)):
+                                    self.state_etag = f'"{event_id}"'
+                        changed.set()
+            except requests.RequestException as e:
+                # the next connection picks up from the last event we applied
+                print(f'events {e}')
+                stop.wait(1)
+
+    def watch_state(self):
+        # keep the get_state() state current from /board/events on a background thread
+        # returns a threading.Event that is set whenever the state changed, clear it once you've redrawn
+        self.stop_watching()
+        changed = threading.Event()
+        stop = threading.Event()
+        thread = threading.Thread(target=self.follow_events, args=(self.session_id, changed, stop), daemon=True)
+        self.watcher = (thread, stop)
+        thread.start()
+        return changed
+
+    def stop_watching(self):
+        # the thread notices at its next event or keepalive
+        if self.watcher is not None:
+            self.watcher[1].set()
+            self.watcher = None
+
+    def init_board(self):
+        return self.get(RESTART_PATH)
+
+    def get_dimensions(self):
+        return self.get(DIMENSIONS_PATH)
+
+    def get_terrain(self):
+        terrain_data = self.get(TERRAIN_PATH)
+        return _fill_terrain(terrain_data)
+
+    def get_turn(self):
+        return self.get(TURN_PATH)
+
+    def get_victory(self):
+        color = None
+        win = self.get(VICTORY_PATH)
+        if win != 'None':
+            color = win
+        return color
+
+    def post_turn(self, color):
+        update = {'side': color}
+        return self.post(TURN_PATH, update)
+
+    def auto_turn(self):
+        return self.get(SIMPLEPLAYER_PATH)
+
+    def ai_turn(self):
+        # this forces an init of learning player model if not explicitly set up
+        return self.get(LEARNINGPLAYER_TURN_PATH)
+
+    def ai_turn_start(self):
+        # start the AI turn without waiting for it, returns the job to poll with get_job
+        return self.get(LEARNINGPLAYER_START_PATH)
+
+    def get_job(self, job_id, wait=0):
+        # job status, waiting up to wait seconds for it to finish
+        # {'status': 'done', 'result': side to play next, ...} once the AI turn is over
+        return self.request('GET', f'{JOB_PATH}{job_id}', params={'wait': wait}, timeout=self.timeout + wait).json()
+
+    def ai_models(self):
+        # list models to load into player
+        return self.get(LEARNINGPLAYER_MODELS)
+
+    def ai_init(self, model_id):
+        return self.post(LEARNINGPLAYER_INIT, model_id)
+
+    def get_acted(self):
+        return self.get(ACTED_PATH)
+
+    def get_positions(self):
+        # map coordinates and token keys
+        position_data = self.get(POSITIONS_PATH)
+        return _fill_positions(position_data)
+
+    def post_position(self, frm, to):
+        coordinates = {board.make_coord_num(frm): board.make_coord_num(to)}
+        position_data = self.post(POSITIONS_PATH, coordinates)
+        return _fill_positions(position_data)
+
+    def post_actions(self, actions, end_turn=False, atomic=True):
+        # take a list of (frm, to) coordinate pairs in order, and end the turn after them if end_turn
+        # returns {'results': [True/False per action], 'applied', 'version', 'turn', 'diff'}
+        # see apply_diff for bringing a get_state() state up to date with the diff
+        data = {'actions': [[int(board.make_coord_num(frm)), int(board.make_coord_num(to))] for frm, to in actions],
+                'end_turn': end_turn, 'atomic': atomic}
+        return self.post(BATCH_PATH, data)
+
+    def get_actions(self, frm):
+        frm_num = board.make_coord_num(frm)
+        return self.post(ACTIONS_PATH, {'hex': frm_num})
+
+    def get_units(self):
+        # token keys and attributes
+        return self.get(STATUS_PATH)
+
+    def save_terrain(self, terrain):
+        data = {}
+        for x in range(board.X_MAX):
+            for y in range(board.Y_MAX):
+                if terrain[x, y] != 0:
+                    hex_id = board.make_coord_num((x, y))
+                    data[hex_id] = terrain[x, y]
+        terrain_data = self.post(SAVE_TERRAIN_PATH, data)
+        return _fill_terrain(terrain_data)
+
+    def save_positions(self, positions):
+        data = {}
+        for x in range(board.X_MAX):
+            for y in range(board.Y_MAX):
+                if positions[x, y] != b'':
+                    hex_id = board.make_coord_num((x, y))
+                    data[hex_id] = positions[x, y].decode('UTF-8')
+        position_data = self.post(SAVE_POSITIONS_PATH, data)
+        return _fill_positions(position_data)
+
+    def save_status(self, status):
+        return self.post(SAVE_STATUS_PATH, status)
+
+    def save_commit(self):
+        return self.get(SAVE_COMMIT)
+
+    def get_sessions(self, player_id):
+        if len(player_id) > 0:
+            return self.post(SESSION_LIST_PATH, player_id)
+        else:
+            return self.get(SESSION_LIST_PATH)
+
+    def join_session(self, session_id):
+        # join a numerical id, later requests go to that session's game
+        joined = self.post(SESSION_JOIN_PATH, session_id)
+        if joined:
+            self.session_id = session_id
+        return joined
+
+    def start_session(self, player_id):
+        # start a new session using your player_id, later requests go to that session's game
+        new_session = self.post(SESSION_CREATE_PATH, player_id)
+        if new_session is not None:
+            self.session_id = new_session
+        return new_session
+
+    def get_configs(self):
+        return self.get(BOARD_LIST_PATH)
+
+    def load_config(self, board_id):
+        return self.post(BOARD_LOAD_PATH, board_id)
+
+
+class AsyncRestClient:
+    # asyncio front for a RestClient, every method is a coroutine that runs the request on a worker thread
+    # the connection pool keeps POOL_SIZE requests going at once, so gather() over many games doesn't queue
+    def __init__(self, client=None, **kwargs):
+        if client is None:
+            client = RestClient(**kwargs)
+        self.client = client
+
+    def __getattr__(self, name):
+        attribute = getattr(self.client, name)
+        if not callable(attribute):
+            return attribute
+
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(attribute, *args, **kwargs)
+        return call
+
+
+# the UI modules play through one shared client with the functions below
+client = RestClient()
 
 
-def _post(path, data):
-    print(path)
-    start = time.perf_counter()
-    response = requests.post(URL+path, json=json.dumps(data))
-    duration = time.perf_counter() - start
-    print(f'duration {duration}')
-    return response.json()
+def get_state():
+    return client.get_state()
+
+
+def current_state():
+    return client.current_state()
+
+
+def watch_state():
+    return client.watch_state()
+
+
+def stop_watching():
+    client.stop_watching()
 
 
 def init_board():
-    return _get(RESTART_PATH)
-    
-    
+    return client.init_board()
+
+
 def get_dimensions():
-    return _get(DIMENSIONS_PATH)
+    return client.get_dimensions()
 
 
 def get_terrain():
-    terrain_data = _get(TERRAIN_PATH)
-    return _fill_terrain(terrain_data)
+    return client.get_terrain()
 
 
 def get_turn():
-    return _get(TURN_PATH)
+    return client.get_turn()
 
 
 def get_victory():
-    color = None
-    win = _get(VICTORY_PATH)
-    if win != 'None':
-        color = win
-    return color
+    return client.get_victory()
 
 
 def post_turn(color):
-    update = {'side': color}
-    return _post(TURN_PATH, update)
+    return client.post_turn(color)
 
 
 def auto_turn():
-    return _get(SIMPLEPLAYER_PATH)
+    return client.auto_turn()
 
 
 def ai_turn():
-    # this forces an init of learning player model if not explicitly set up
-    return _get(LEARNINGPLAYER_TURN_PATH)
+    return client.ai_turn()
+
+
+def ai_turn_start():
+    return client.ai_turn_start()
+
+
+def get_job(job_id, wait=0):
+    return client.get_job(job_id, wait)
 
 
 def ai_models():
-    # list models to load into player
-    return _get(LEARNINGPLAYER_MODELS)
+    return client.ai_models()
 
 
 def ai_init(model_id):
-    return _post(LEARNINGPLAYER_INIT, model_id)
+    return client.ai_init(model_id)
 
 
 def get_acted():
-    new_acted = _get(ACTED_PATH)
-    return new_acted
+    return client.get_acted()
 
 
 def get_positions():
-    # map coordinates and token keys
-    position_data = _get(POSITIONS_PATH)
-    return _fill_positions(position_data)
+    return client.get_positions()
 
 
 def post_position(frm, to):
-    coordinates = {board.make_coord_num(frm): board.make_coord_num(to)}
-    position_data = _post(POSITIONS_PATH, coordinates)
-    return _fill_positions(position_data)
+    return client.post_position(frm, to)
+
+
+def post_actions(actions, end_turn=False, atomic=True):
+    return client.post_actions(actions, end_turn, atomic)
 
 
 def get_actions(frm):
-    frm_num = board.make_coord_num(frm)
-    action_list = _post(ACTIONS_PATH, {'hex': frm_num})
-    return action_list
+    return client.get_actions(frm)
 
 
 def get_units():
-    # token keys and attributes
-    return _get(STATUS_PATH)
+    return client.get_units()
 
 
 def save_terrain(terrain):
-    data = {}
-    for x in range(board.X_MAX):
-        for y in range(board.Y_MAX):
-            if terrain[x, y] != 0:
-                hex_id = board.make_coord_num((x, y))
-                data[hex_id] = terrain[x, y]
-    terrain_data = _post(SAVE_TERRAIN_PATH, data)
-    return _fill_terrain(terrain_data)
+    return client.save_terrain(terrain)
 
 
 def save_positions(positions):
-    data = {}
-    for x in range(board.X_MAX):
-        for y in range(board.Y_MAX):
-            if positions[x, y] != b'':
-                hex_id = board.make_coord_num((x, y))
-                data[hex_id] = positions[x, y].decode('UTF-8')
-    position_data = _post(SAVE_POSITIONS_PATH, data)
-    return _fill_positions(position_data)
+    return client.save_positions(positions)
 
 
 def save_status(status):
-    return _post(SAVE_STATUS_PATH, status)
+    return client.save_status(status)
 
 
 def save_commit():
-    return _get(SAVE_COMMIT)
+    return client.save_commit()
 
 
 def get_sessions(player_id):
-    if len(player_id) > 0:
-        return _post(SESSION_LIST_PATH, player_id)
-    else:
-        return _get(SESSION_LIST_PATH)
+    return client.get_sessions(player_id)
 
 
 def join_session(session_id):
-    # join a numerical id
-    return _post(SESSION_JOIN_PATH, session_id)
+    return client.join_session(session_id)
 
 
 def start_session(player_id):
-    # start a new session using your player_id
-    return _post(SESSION_CREATE_PATH, player_id)
+    return client.start_session(player_id)
 
 
 def get_configs():
-    return _get(BOARD_LIST_PATH)
+    return client.get_configs()
 
 
 def load_config(board_id):
-    config_data = _post(BOARD_LOAD_PATH, board_id)
-    return config_data
+    return client.load_config(board_id)
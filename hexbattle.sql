@@ -60,6 +60,8 @@ CREATE TABLE `game_model` (
   `ID` int unsigned NOT NULL AUTO_INCREMENT,
   `model` json DEFAULT NULL,
   `weights` json DEFAULT NULL,
+  `weights_blob` longblob,
+  `version` int unsigned NOT NULL DEFAULT '0',
   PRIMARY KEY (`ID`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -112,7 +114,11 @@ CREATE TABLE `game_turn` (
   `action` json DEFAULT NULL,
   `positions` json DEFAULT NULL,
   `status` json DEFAULT NULL,
-  PRIMARY KEY (`ID`)
+  `turn` int unsigned DEFAULT NULL,
+  `keyframe` tinyint(1) NOT NULL DEFAULT '1',
+  `side` varchar(8) DEFAULT NULL,
+  PRIMARY KEY (`ID`),
+  KEY `session_turn` (`session_id`,`turn`)
 ) ENGINE=InnoDB AUTO_INCREMENT=60 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -122,7 +128,7 @@ CREATE TABLE `game_turn` (
 
 LOCK TABLES `game_turn` WRITE;
 /*!40000 ALTER TABLE `game_turn` DISABLE KEYS */;
-INSERT INTO `game_turn` VALUES (1,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505]]','{\"103\": \"RF1\", \"307\": \"R3\", \"404\": \"R2\", \"406\": \"R1\", \"505\": \"RT1\", \"711\": \"B1\", \"713\": \"B3\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(2,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612]]','{\"103\": \"RF1\", \"307\": \"R3\", \"404\": \"R2\", \"406\": \"R1\", \"505\": \"RT1\", \"612\": \"BT1\", \"709\": \"B1\", \"711\": \"B3\", \"808\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(3,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406]]','{\"103\": \"RF1\", \"406\": \"R2\", \"408\": \"R3\", \"505\": \"RT1\", \"507\": \"R1\", \"612\": \"BT1\", \"709\": \"B1\", \"711\": \"B3\", \"808\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(4,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610]]','{\"103\": \"RF1\", \"406\": \"R2\", \"408\": \"R3\", \"505\": \"RT1\", \"507\": \"R1\", \"610\": \"B3\", \"614\": \"BT1\", \"707\": \"B2\", \"709\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(5,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610]]','{\"103\": \"RF1\", \"406\": \"R2\", \"408\": \"R3\", \"505\": \"RT1\", \"507\": \"R1\", \"614\": \"BT1\", \"707\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(6,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610], [707, 507], [614, 408]]','{\"103\": \"RF1\", \"406\": \"R2\", \"505\": \"RT1\", \"614\": \"BT1\", \"707\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(7,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610], [707, 507], [614, 408], [505, 511]]','{\"103\": \"RF1\", \"406\": \"R2\", \"511\": \"RT1\", \"614\": \"BT1\", \"707\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(8,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610], [707, 507], [614, 408], [505, 511], [614, 511], [707, 606]]','{\"103\": \"RF1\", \"406\": \"R2\", \"511\": \"RT1\", \"606\": \"B2\", \"614\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(9,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610], [707, 507], [614, 408], [505, 511], [614, 511], [707, 606], [511, 614], [406, 606]]','{\"103\": \"RF1\", \"406\": \"R2\", \"511\": \"RT1\", \"606\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(10,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610], [707, 507], [614, 408], [505, 511], [614, 511], [707, 606], [511, 614], [406, 606], [606, 406]]','{\"103\": \"RF1\", \"406\": \"R2\", \"511\": \"RT1\", \"606\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(11,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208]]','{\"103\": \"RF1\", \"208\": \"R3\", \"210\": \"R4\", \"309\": \"RT1\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"501\": \"R8\", \"503\": \"R7\", \"505\": \"R6\", \"610\": \"B6\", \"612\": \"B5\", \"614\": \"B4\", \"709\": \"B7\", \"711\": \"B1\", \"713\": \"B3\", \"808\": \"B8\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(12,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614]]','{\"103\": \"RF1\", \"208\": \"R3\", \"210\": \"R4\", \"309\": \"RT1\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"501\": \"R8\", \"503\": \"R7\", \"505\": \"R6\", \"511\": \"B5\", \"513\": \"B4\", \"610\": \"BT1\", \"612\": \"B6\", \"614\": \"B3\", \"707\": \"B7\", \"709\": \"B1\", \"806\": \"B8\", \"808\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(13,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707]]','{\"103\": \"RF1\", \"210\": \"R3\", \"309\": \"RT1\", \"311\": \"R4\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"503\": \"R8\", \"505\": \"R6\", \"511\": \"B5\", \"513\": \"B4\", \"602\": \"R7\", \"610\": \"BT1\", \"612\": \"B6\", \"614\": \"B3\", \"707\": \"B7\", \"709\": \"B1\", \"806\": \"B8\", \"808\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(14,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515]]','{\"103\": \"RF1\", \"210\": \"R3\", \"309\": \"RT1\", \"311\": \"R4\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"503\": \"R8\", \"505\": \"R6\", \"511\": \"B5\", \"513\": \"B4\", \"515\": \"B3\", \"602\": \"R7\", \"610\": \"BT1\", \"612\": \"B6\", \"707\": \"B7\", \"804\": \"B8\", \"806\": \"B2\", \"808\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(15,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604]]','{\"103\": \"RF1\", \"107\": \"RT1\", \"212\": \"R3\", \"311\": \"R4\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"505\": \"R6\", \"511\": \"B5\", \"513\": \"B4\", \"515\": \"B3\", \"602\": \"R7\", \"604\": \"R8\", \"610\": \"BT1\", \"612\": \"B6\", \"804\": \"B8\", \"806\": \"B2\", \"808\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(16,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711]]','{\"103\": \"RF1\", \"107\": \"RT1\", \"212\": \"R3\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"505\": \"R6\", \"511\": \"B5\", \"513\": \"B4\", \"515\": \"B3\", \"610\": \"BT1\", \"709\": \"B1\", \"711\": \"B6\", \"804\": \"B8\", \"806\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(17,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505]]','{\"103\": \"RF1\", \"107\": \"RT1\", \"210\": \"R3\", \"404\": \"R6\", \"501\": \"R2\", \"503\": \"R1\", \"505\": \"R5\", \"513\": \"B4\", \"515\": \"B3\", \"610\": \"BT1\", \"709\": \"B1\", \"711\": \"B6\", \"804\": \"B8\", \"806\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(18,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709]]','{\"103\": \"RF1\", \"107\": \"RT1\", \"210\": \"R3\", \"404\": \"R6\", \"414\": \"B3\", \"501\": \"R2\", \"505\": \"R5\", \"513\": \"B4\", \"610\": \"BT1\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"B6\", \"804\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(19,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305]]','{\"103\": \"RF1\", \"208\": \"R3\", \"305\": \"RT1\", \"404\": \"R6\", \"414\": \"B3\", \"501\": \"R2\", \"505\": \"R5\", \"513\": \"B4\", \"610\": \"BT1\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"B6\", \"804\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(20,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305]]','{\"103\": \"RF1\", \"208\": \"R3\", \"313\": \"B3\", \"404\": \"R6\", \"412\": \"B4\", \"501\": \"R2\", \"610\": \"BT1\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"B6\", \"804\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": -1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(21,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"208\": \"R4\", \"303\": \"R2\", \"307\": \"R3\", \"313\": \"B3\", \"404\": \"R1\", \"406\": \"R5\", \"412\": \"B4\", \"501\": \"R8\", \"503\": \"R7\", \"505\": \"R6\", \"600\": \"R2\", \"610\": \"B6\", \"612\": \"B5\", \"614\": \"B4\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"B7\", \"711\": \"B1\", \"713\": \"B3\", \"804\": \"B8\", \"808\": \"B8\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(22,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"208\": \"R4\", \"303\": \"R2\", \"307\": \"R3\", \"313\": \"B3\", \"404\": \"R1\", \"406\": \"R5\", \"412\": \"B4\", \"501\": \"R8\", \"503\": \"R7\", \"511\": \"B6\", \"513\": \"B5\", \"515\": \"B4\", \"600\": \"R2\", \"614\": \"B3\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"806\": \"B8\", \"808\": \"B7\", \"810\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(23,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"208\": \"R3\", \"210\": \"R4\", \"303\": \"R2\", \"307\": \"R5\", \"412\": \"B4\", \"503\": \"R7\", \"505\": \"R1\", \"511\": \"B6\", \"513\": \"B5\", \"515\": \"B4\", \"602\": \"R8\", \"614\": \"B3\", \"701\": \"R2\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"806\": \"B8\", \"808\": \"B7\", \"810\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(24,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"208\": \"R3\", \"210\": \"R4\", \"303\": \"R2\", \"307\": \"R5\", \"412\": \"B4\", \"414\": \"B5\", \"511\": \"B6\", \"515\": \"B4\", \"602\": \"R8\", \"614\": \"B3\", \"701\": \"R2\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"BT1\", \"711\": \"B1\", \"806\": \"B8\", \"808\": \"B7\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(25,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"210\": \"R3\", \"212\": \"R4\", \"303\": \"R2\", \"309\": \"R5\", \"414\": \"B5\", \"511\": \"B6\", \"515\": \"B4\", \"602\": \"R8\", \"614\": \"B3\", \"701\": \"R2\", \"707\": \"B1\", \"709\": \"BT1\", \"711\": \"B1\", \"806\": \"B8\", \"808\": \"B7\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(26,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"210\": \"R3\", \"303\": \"R2\", \"414\": \"B5\", \"511\": \"B6\", \"513\": \"B4\", \"602\": \"R8\", \"614\": \"B3\", \"701\": \"R2\", \"705\": \"B1\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"806\": \"B7\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(27,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"210\": \"R3\", \"303\": \"R2\", \"414\": \"B5\", \"513\": \"B4\", \"602\": \"R8\", \"614\": \"B3\", \"701\": \"R2\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"806\": \"B7\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(28,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"210\": \"R3\", \"303\": \"R2\", \"313\": \"B5\", \"412\": \"B4\", \"513\": \"B3\", \"701\": \"R2\", \"705\": \"B7\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(29,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"311\": \"R3\", \"402\": \"R2\", \"412\": \"B4\", \"513\": \"B3\", \"701\": \"R2\", \"705\": \"B7\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(30,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"311\": \"R3\", \"402\": \"R2\", \"412\": \"B4\", \"513\": \"B3\", \"705\": \"B7\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(31,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701], [311, 313], [402, 501], [206, 311]]','{\"103\": \"RF1\", \"311\": \"RT1\", \"313\": \"R3\", \"412\": \"B4\", \"501\": \"R2\", \"513\": \"B3\", \"705\": \"B7\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(32,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701], [311, 313], [402, 501], [206, 311], [709, 311], [705, 604], [804, 703]]','{\"103\": \"RF1\", \"311\": \"RT1\", \"313\": \"R3\", \"412\": \"B4\", \"501\": \"R2\", \"513\": \"B3\", \"604\": \"B7\", \"703\": \"B8\", \"709\": \"BT1\", \"711\": \"B1\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(33,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701], [311, 313], [402, 501], [206, 311], [709, 311], [705, 604], [804, 703], [311, 709], [313, 412]]','{\"103\": \"RF1\", \"311\": \"RT1\", \"412\": \"R3\", \"501\": \"R2\", \"513\": \"B3\", \"604\": \"B7\", \"703\": \"B8\", \"709\": \"BT1\", \"711\": \"B1\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(34,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701], [311, 313], [402, 501], [206, 311], [709, 311], [705, 604], [804, 703], [311, 709], [313, 412], [604, 503], [709, 311]]','{\"103\": \"RF1\", \"412\": \"R3\", \"501\": \"R2\", \"503\": \"B7\", \"513\": \"B3\", \"703\": \"B8\", \"709\": \"BT1\", \"711\": \"B1\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(35,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701], [311, 313], [402, 501], [206, 311], [709, 311], [705, 604], [804, 703], [311, 709], [313, 412], [604, 503], [709, 311], [412, 511]]','{\"103\": \"RF1\", \"501\": \"R2\", \"503\": \"B7\", \"511\": \"R3\", \"513\": \"B3\", \"703\": \"B8\", \"709\": \"BT1\", \"711\": \"B1\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(36,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404]]','{\"103\": \"RF1\", \"208\": \"R3\", \"210\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"404\": \"R2\", \"406\": \"RT1\", \"501\": \"R8\", \"503\": \"R7\", \"505\": \"R6\", \"610\": \"B6\", \"612\": \"B5\", \"614\": \"B4\", \"709\": \"B7\", \"711\": \"B1\", \"713\": \"B3\", \"808\": \"B8\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(37,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614]]','{\"103\": \"RF1\", \"208\": \"R3\", \"210\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"404\": \"R2\", \"406\": \"RT1\", \"501\": \"R8\", \"503\": \"R7\", \"505\": \"R6\", \"511\": \"B6\", \"513\": \"B5\", \"515\": \"B4\", \"612\": \"B1\", \"614\": \"B3\", \"707\": \"B7\", \"806\": \"B8\", \"808\": \"B2\", \"907\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(38,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"402\": \"R2\", \"404\": \"R6\", \"406\": \"RT1\", \"501\": \"R7\", \"511\": \"B6\", \"513\": \"B5\", \"515\": \"B4\", \"600\": \"R8\", \"612\": \"B1\", \"614\": \"B3\", \"806\": \"B8\", \"808\": \"B2\", \"907\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(39,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"402\": \"R2\", \"404\": \"R6\", \"406\": \"RT1\", \"414\": \"B4\", \"501\": \"R7\", \"511\": \"B6\", \"513\": \"B5\", \"515\": \"B3\", \"600\": \"R8\", \"612\": \"B1\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(40,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"406\": \"RT1\", \"414\": \"B4\", \"501\": \"R2\", \"503\": \"R6\", \"515\": \"B3\", \"602\": \"R7\", \"612\": \"B1\", \"701\": \"R8\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(41,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"406\": \"RT1\", \"414\": \"B4\", \"416\": \"B3\", \"501\": \"R2\", \"503\": \"R6\", \"513\": \"B1\", \"701\": \"R8\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(42,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"309\": \"R1\", \"311\": \"R5\", \"406\": \"RT1\", \"416\": \"B3\", \"602\": \"R2\", \"604\": \"R6\", \"802\": \"R8\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(43,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"309\": \"R1\", \"311\": \"R5\", \"406\": \"RT1\", \"416\": \"B3\", \"602\": \"R2\", \"604\": \"R6\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(44,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604]]','{\"103\": \"RF1\", \"212\": \"R3\", \"311\": \"R1\", \"313\": \"R4\", \"412\": \"R5\", \"416\": \"B3\", \"604\": \"RT1\", \"703\": \"R2\", \"705\": \"R6\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(45,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604], [905, 705], [907, 705], [903, 604], [416, 313]]','{\"103\": \"RF1\", \"212\": \"R3\", \"311\": \"R1\", \"412\": \"R5\", \"416\": \"B3\", \"604\": \"RT1\", \"703\": \"R2\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(46,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604], [905, 705], [907, 705], [903, 604], [416, 313], [412, 416], [311, 313], [212, 214], [703, 804], [604, 903]]','{\"103\": \"RF1\", \"214\": \"R3\", \"313\": \"R1\", \"412\": \"R5\", \"416\": \"B3\", \"604\": \"RT1\", \"804\": \"R2\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(47,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604], [905, 705], [907, 705], [903, 604], [416, 313], [412, 416], [311, 313], [212, 214], [703, 804], [604, 903], [905, 804], [907, 806], [903, 604], [416, 412]]','{\"103\": \"RF1\", \"214\": \"R3\", \"313\": \"R1\", \"416\": \"B3\", \"804\": \"B8\", \"806\": \"B2\", \"903\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(48,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604], [905, 705], [907, 705], [903, 604], [416, 313], [412, 416], [311, 313], [212, 214], [703, 804], [604, 903], [905, 804], [907, 806], [903, 604], [416, 412], [313, 416], [214, 315]]','{\"103\": \"RF1\", \"313\": \"R1\", \"315\": \"R3\", \"804\": \"B8\", \"806\": \"B2\", \"903\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(49,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604], [905, 705], [907, 705], [903, 604], [416, 313], [412, 416], [311, 313], [212, 214], [703, 804], [604, 903], [905, 804], [907, 806], [903, 604], [416, 412], [313, 416], [214, 315], [806, 705], [804, 703], [903, 909]]','{\"103\": \"RF1\", \"313\": \"R1\", \"315\": \"R3\", \"703\": \"B8\", \"705\": \"B2\", \"909\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(50,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307]]','{\"103\": \"RF1\", \"305\": \"R3\", \"307\": \"RT1\", \"402\": \"R2\", \"404\": \"R1\", \"711\": \"B1\", \"713\": \"B3\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(51,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509]]','{\"103\": \"RF1\", \"305\": \"R3\", \"307\": \"RT1\", \"402\": \"R2\", \"404\": \"R1\", \"509\": \"BT1\", \"610\": \"B1\", \"612\": \"B3\", \"709\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(52,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"406\": \"R3\", \"503\": \"R2\", \"505\": \"R1\", \"509\": \"BT1\", \"610\": \"B1\", \"612\": \"B3\", \"709\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(53,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503], [509, 505], [612, 511], [709, 608]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"406\": \"R3\", \"503\": \"R2\", \"509\": \"BT1\", \"511\": \"B3\", \"608\": \"B2\", \"610\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(54,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503], [509, 505], [612, 511], [709, 608], [307, 509], [406, 608], [503, 505]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"406\": \"R3\", \"505\": \"R2\", \"511\": \"B3\", \"608\": \"B2\", \"610\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(55,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503], [509, 505], [612, 511], [709, 608], [307, 509], [406, 608], [503, 505], [511, 410], [608, 507], [610, 509]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"406\": \"R3\", \"410\": \"B3\", \"505\": \"R2\", \"507\": \"B2\", \"509\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(56,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503], [509, 505], [612, 511], [709, 608], [307, 509], [406, 608], [503, 505], [511, 410], [608, 507], [610, 509], [505, 507], [307, 509], [406, 410]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"406\": \"R3\", \"410\": \"B3\", \"507\": \"R2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(57,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503], [509, 505], [612, 511], [709, 608], [307, 509], [406, 608], [503, 505], [511, 410], [608, 507], [610, 509], [505, 507], [307, 509], [406, 410], [410, 309]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"309\": \"B3\", \"406\": \"R3\", \"507\": \"R2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(58,NULL,'[[204, 507], [206, 307], [303, 404], [305, 406]]','{\"103\": \"RF1\", \"307\": \"R3\", \"404\": \"R2\", \"406\": \"R1\", \"507\": \"RT1\", \"711\": \"B1\", \"713\": \"B3\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(59,NULL,'[[204, 507], [206, 307], [303, 404], [305, 406], [711, 610], [713, 612], [810, 709], [812, 509]]','{\"103\": \"RF1\", \"307\": \"R3\", \"404\": \"R2\", \"406\": \"R1\", \"507\": \"RT1\", \"509\": \"BT1\", \"610\": \"B1\", \"612\": \"B3\", \"709\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}');
+INSERT INTO `game_turn` (`ID`, `session_id`, `action`, `positions`, `status`) VALUES (1,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505]]','{\"103\": \"RF1\", \"307\": \"R3\", \"404\": \"R2\", \"406\": \"R1\", \"505\": \"RT1\", \"711\": \"B1\", \"713\": \"B3\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(2,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612]]','{\"103\": \"RF1\", \"307\": \"R3\", \"404\": \"R2\", \"406\": \"R1\", \"505\": \"RT1\", \"612\": \"BT1\", \"709\": \"B1\", \"711\": \"B3\", \"808\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(3,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406]]','{\"103\": \"RF1\", \"406\": \"R2\", \"408\": \"R3\", \"505\": \"RT1\", \"507\": \"R1\", \"612\": \"BT1\", \"709\": \"B1\", \"711\": \"B3\", \"808\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(4,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610]]','{\"103\": \"RF1\", \"406\": \"R2\", \"408\": \"R3\", \"505\": \"RT1\", \"507\": \"R1\", \"610\": \"B3\", \"614\": \"BT1\", \"707\": \"B2\", \"709\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(5,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610]]','{\"103\": \"RF1\", \"406\": \"R2\", \"408\": \"R3\", \"505\": \"RT1\", \"507\": \"R1\", \"614\": \"BT1\", \"707\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(6,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610], [707, 507], [614, 408]]','{\"103\": \"RF1\", \"406\": \"R2\", \"505\": \"RT1\", \"614\": \"BT1\", \"707\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(7,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610], [707, 507], [614, 408], [505, 511]]','{\"103\": \"RF1\", \"406\": \"R2\", \"511\": \"RT1\", \"614\": \"BT1\", \"707\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(8,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610], [707, 507], [614, 408], [505, 511], [614, 511], [707, 606]]','{\"103\": \"RF1\", \"406\": \"R2\", \"511\": \"RT1\", \"606\": \"B2\", \"614\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(9,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610], [707, 507], [614, 408], [505, 511], [614, 511], [707, 606], [511, 614], [406, 606]]','{\"103\": \"RF1\", \"406\": \"R2\", \"511\": \"RT1\", \"606\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(10,NULL,'[[305, 406], [303, 404], [206, 307], [204, 505], [810, 808], [711, 709], [713, 711], [812, 612], [505, 612], [307, 408], [406, 507], [404, 406], [612, 614], [709, 507], [808, 707], [711, 610], [505, 709], [408, 610], [507, 610], [707, 507], [614, 408], [505, 511], [614, 511], [707, 606], [511, 614], [406, 606], [606, 406]]','{\"103\": \"RF1\", \"406\": \"R2\", \"511\": \"RT1\", \"606\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(11,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208]]','{\"103\": \"RF1\", \"208\": \"R3\", \"210\": \"R4\", \"309\": \"RT1\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"501\": \"R8\", \"503\": \"R7\", \"505\": \"R6\", \"610\": \"B6\", \"612\": \"B5\", \"614\": \"B4\", \"709\": \"B7\", \"711\": \"B1\", \"713\": \"B3\", \"808\": \"B8\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(12,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614]]','{\"103\": \"RF1\", \"208\": \"R3\", \"210\": \"R4\", \"309\": \"RT1\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"501\": \"R8\", \"503\": \"R7\", \"505\": \"R6\", \"511\": \"B5\", \"513\": \"B4\", \"610\": \"BT1\", \"612\": \"B6\", \"614\": \"B3\", \"707\": \"B7\", \"709\": \"B1\", \"806\": \"B8\", \"808\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(13,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707]]','{\"103\": \"RF1\", \"210\": \"R3\", \"309\": \"RT1\", \"311\": \"R4\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"503\": \"R8\", \"505\": \"R6\", \"511\": \"B5\", \"513\": \"B4\", \"602\": \"R7\", \"610\": \"BT1\", \"612\": \"B6\", \"614\": \"B3\", \"707\": \"B7\", \"709\": \"B1\", \"806\": \"B8\", \"808\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(14,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515]]','{\"103\": \"RF1\", \"210\": \"R3\", \"309\": \"RT1\", \"311\": \"R4\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"503\": \"R8\", \"505\": \"R6\", \"511\": \"B5\", \"513\": \"B4\", \"515\": \"B3\", \"602\": \"R7\", \"610\": \"BT1\", \"612\": \"B6\", \"707\": \"B7\", \"804\": \"B8\", \"806\": \"B2\", \"808\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(15,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604]]','{\"103\": \"RF1\", \"107\": \"RT1\", \"212\": \"R3\", \"311\": \"R4\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"505\": \"R6\", \"511\": \"B5\", \"513\": \"B4\", \"515\": \"B3\", \"602\": \"R7\", \"604\": \"R8\", \"610\": \"BT1\", \"612\": \"B6\", \"804\": \"B8\", \"806\": \"B2\", \"808\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(16,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711]]','{\"103\": \"RF1\", \"107\": \"RT1\", \"212\": \"R3\", \"402\": \"R2\", \"404\": \"R1\", \"406\": \"R5\", \"505\": \"R6\", \"511\": \"B5\", \"513\": \"B4\", \"515\": \"B3\", \"610\": \"BT1\", \"709\": \"B1\", \"711\": \"B6\", \"804\": \"B8\", \"806\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(17,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505]]','{\"103\": \"RF1\", \"107\": \"RT1\", \"210\": \"R3\", \"404\": \"R6\", \"501\": \"R2\", \"503\": \"R1\", \"505\": \"R5\", \"513\": \"B4\", \"515\": \"B3\", \"610\": \"BT1\", \"709\": \"B1\", \"711\": \"B6\", \"804\": \"B8\", \"806\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(18,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709]]','{\"103\": \"RF1\", \"107\": \"RT1\", \"210\": \"R3\", \"404\": \"R6\", \"414\": \"B3\", \"501\": \"R2\", \"505\": \"R5\", \"513\": \"B4\", \"610\": \"BT1\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"B6\", \"804\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(19,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305]]','{\"103\": \"RF1\", \"208\": \"R3\", \"305\": \"RT1\", \"404\": \"R6\", \"414\": \"B3\", \"501\": \"R2\", \"505\": \"R5\", \"513\": \"B4\", \"610\": \"BT1\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"B6\", \"804\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(20,2,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305]]','{\"103\": \"RF1\", \"208\": \"R3\", \"313\": \"B3\", \"404\": \"R6\", \"412\": \"B4\", \"501\": \"R2\", \"610\": \"BT1\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"B6\", \"804\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": -1, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(21,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"208\": \"R4\", \"303\": \"R2\", \"307\": \"R3\", \"313\": \"B3\", \"404\": \"R1\", \"406\": \"R5\", \"412\": \"B4\", \"501\": \"R8\", \"503\": \"R7\", \"505\": \"R6\", \"600\": \"R2\", \"610\": \"B6\", \"612\": \"B5\", \"614\": \"B4\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"B7\", \"711\": \"B1\", \"713\": \"B3\", \"804\": \"B8\", \"808\": \"B8\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(22,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"208\": \"R4\", \"303\": \"R2\", \"307\": \"R3\", \"313\": \"B3\", \"404\": \"R1\", \"406\": \"R5\", \"412\": \"B4\", \"501\": \"R8\", \"503\": \"R7\", \"511\": \"B6\", \"513\": \"B5\", \"515\": \"B4\", \"600\": \"R2\", \"614\": \"B3\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"806\": \"B8\", \"808\": \"B7\", \"810\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(23,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"208\": \"R3\", \"210\": \"R4\", \"303\": \"R2\", \"307\": \"R5\", \"412\": \"B4\", \"503\": \"R7\", \"505\": \"R1\", \"511\": \"B6\", \"513\": \"B5\", \"515\": \"B4\", \"602\": \"R8\", \"614\": \"B3\", \"701\": \"R2\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"806\": \"B8\", \"808\": \"B7\", \"810\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(24,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"208\": \"R3\", \"210\": \"R4\", \"303\": \"R2\", \"307\": \"R5\", \"412\": \"B4\", \"414\": \"B5\", \"511\": \"B6\", \"515\": \"B4\", \"602\": \"R8\", \"614\": \"B3\", \"701\": \"R2\", \"705\": \"B2\", \"707\": \"B1\", \"709\": \"BT1\", \"711\": \"B1\", \"806\": \"B8\", \"808\": \"B7\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(25,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"210\": \"R3\", \"212\": \"R4\", \"303\": \"R2\", \"309\": \"R5\", \"414\": \"B5\", \"511\": \"B6\", \"515\": \"B4\", \"602\": \"R8\", \"614\": \"B3\", \"701\": \"R2\", \"707\": \"B1\", \"709\": \"BT1\", \"711\": \"B1\", \"806\": \"B8\", \"808\": \"B7\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(26,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"210\": \"R3\", \"303\": \"R2\", \"414\": \"B5\", \"511\": \"B6\", \"513\": \"B4\", \"602\": \"R8\", \"614\": \"B3\", \"701\": \"R2\", \"705\": \"B1\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"806\": \"B7\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(27,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"210\": \"R3\", \"303\": \"R2\", \"414\": \"B5\", \"513\": \"B4\", \"602\": \"R8\", \"614\": \"B3\", \"701\": \"R2\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"806\": \"B7\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(28,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"210\": \"R3\", \"303\": \"R2\", \"313\": \"B5\", \"412\": \"B4\", \"513\": \"B3\", \"701\": \"R2\", \"705\": \"B7\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(29,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"311\": \"R3\", \"402\": \"R2\", \"412\": \"B4\", \"513\": \"B3\", \"701\": \"R2\", \"705\": \"B7\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(30,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701]]','{\"103\": \"RF1\", \"206\": \"RT1\", \"311\": \"R3\", \"402\": \"R2\", \"412\": \"B4\", \"513\": \"B3\", \"705\": \"B7\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(31,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701], [311, 313], [402, 501], [206, 311]]','{\"103\": \"RF1\", \"311\": \"RT1\", \"313\": \"R3\", \"412\": \"B4\", \"501\": \"R2\", \"513\": \"B3\", \"705\": \"B7\", \"709\": \"BT1\", \"711\": \"B1\", \"804\": \"B8\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(32,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701], [311, 313], [402, 501], [206, 311], [709, 311], [705, 604], [804, 703]]','{\"103\": \"RF1\", \"311\": \"RT1\", \"313\": \"R3\", \"412\": \"B4\", \"501\": \"R2\", \"513\": \"B3\", \"604\": \"B7\", \"703\": \"B8\", \"709\": \"BT1\", \"711\": \"B1\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(33,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701], [311, 313], [402, 501], [206, 311], [709, 311], [705, 604], [804, 703], [311, 709], [313, 412]]','{\"103\": \"RF1\", \"311\": \"RT1\", \"412\": \"R3\", \"501\": \"R2\", \"513\": \"B3\", \"604\": \"B7\", \"703\": \"B8\", \"709\": \"BT1\", \"711\": \"B1\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(34,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701], [311, 313], [402, 501], [206, 311], [709, 311], [705, 604], [804, 703], [311, 709], [313, 412], [604, 503], [709, 311]]','{\"103\": \"RF1\", \"412\": \"R3\", \"501\": \"R2\", \"503\": \"B7\", \"513\": \"B3\", \"703\": \"B8\", \"709\": \"BT1\", \"711\": \"B1\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(35,3,'[[406, 505], [404, 503], [402, 501], [303, 402], [305, 404], [307, 406], [204, 309], [208, 210], [206, 208], [612, 511], [614, 513], [610, 612], [812, 610], [709, 707], [808, 806], [810, 808], [711, 709], [713, 614], [309, 610], [210, 311], [208, 210], [503, 602], [501, 503], [505, 707], [806, 804], [808, 806], [707, 505], [709, 808], [511, 309], [610, 309], [513, 311], [614, 515], [309, 107], [311, 511], [210, 212], [602, 804], [505, 707], [503, 604], [610, 602], [511, 311], [804, 604], [806, 604], [808, 709], [612, 711], [107, 511], [212, 210], [402, 501], [404, 503], [505, 404], [406, 505], [610, 503], [709, 707], [806, 705], [515, 414], [711, 709], [505, 705], [210, 208], [107, 305], [513, 412], [414, 313], [705, 505], [707, 505], [610, 305], [501, 600], [402, 501], [404, 503], [406, 505], [305, 404], [307, 406], [206, 307], [204, 206], [705, 505], [707, 505], [808, 806], [610, 511], [709, 808], [812, 709], [614, 515], [713, 614], [612, 513], [206, 313], [503, 705], [600, 701], [501, 602], [404, 505], [208, 210], [307, 208], [406, 307], [412, 210], [709, 503], [707, 505], [705, 505], [804, 903], [513, 414], [602, 705], [701, 903], [206, 412], [210, 212], [208, 210], [307, 309], [511, 309], [414, 212], [515, 513], [709, 309], [707, 705], [806, 804], [808, 806], [206, 511], [602, 705], [701, 705], [804, 701], [806, 705], [709, 602], [414, 313], [513, 412], [614, 513], [206, 313], [210, 311], [303, 402], [709, 701], [311, 313], [402, 501], [206, 311], [709, 311], [705, 604], [804, 703], [311, 709], [313, 412], [604, 503], [709, 311], [412, 511]]','{\"103\": \"RF1\", \"501\": \"R2\", \"503\": \"B7\", \"511\": \"R3\", \"513\": \"B3\", \"703\": \"B8\", \"709\": \"BT1\", \"711\": \"B1\", \"810\": \"B2\", \"903\": \"B8\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": -1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(36,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404]]','{\"103\": \"RF1\", \"208\": \"R3\", \"210\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"404\": \"R2\", \"406\": \"RT1\", \"501\": \"R8\", \"503\": \"R7\", \"505\": \"R6\", \"610\": \"B6\", \"612\": \"B5\", \"614\": \"B4\", \"709\": \"B7\", \"711\": \"B1\", \"713\": \"B3\", \"808\": \"B8\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(37,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614]]','{\"103\": \"RF1\", \"208\": \"R3\", \"210\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"404\": \"R2\", \"406\": \"RT1\", \"501\": \"R8\", \"503\": \"R7\", \"505\": \"R6\", \"511\": \"B6\", \"513\": \"B5\", \"515\": \"B4\", \"612\": \"B1\", \"614\": \"B3\", \"707\": \"B7\", \"806\": \"B8\", \"808\": \"B2\", \"907\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(38,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"402\": \"R2\", \"404\": \"R6\", \"406\": \"RT1\", \"501\": \"R7\", \"511\": \"B6\", \"513\": \"B5\", \"515\": \"B4\", \"600\": \"R8\", \"612\": \"B1\", \"614\": \"B3\", \"806\": \"B8\", \"808\": \"B2\", \"907\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(39,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"402\": \"R2\", \"404\": \"R6\", \"406\": \"RT1\", \"414\": \"B4\", \"501\": \"R7\", \"511\": \"B6\", \"513\": \"B5\", \"515\": \"B3\", \"600\": \"R8\", \"612\": \"B1\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(40,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"406\": \"RT1\", \"414\": \"B4\", \"501\": \"R2\", \"503\": \"R6\", \"515\": \"B3\", \"602\": \"R7\", \"612\": \"B1\", \"701\": \"R8\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(41,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"307\": \"R1\", \"309\": \"R5\", \"406\": \"RT1\", \"414\": \"B4\", \"416\": \"B3\", \"501\": \"R2\", \"503\": \"R6\", \"513\": \"B1\", \"701\": \"R8\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(42,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"309\": \"R1\", \"311\": \"R5\", \"406\": \"RT1\", \"416\": \"B3\", \"602\": \"R2\", \"604\": \"R6\", \"802\": \"R8\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(43,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802]]','{\"103\": \"RF1\", \"210\": \"R3\", \"212\": \"R4\", \"309\": \"R1\", \"311\": \"R5\", \"406\": \"RT1\", \"416\": \"B3\", \"602\": \"R2\", \"604\": \"R6\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(44,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604]]','{\"103\": \"RF1\", \"212\": \"R3\", \"311\": \"R1\", \"313\": \"R4\", \"412\": \"R5\", \"416\": \"B3\", \"604\": \"RT1\", \"703\": \"R2\", \"705\": \"R6\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(45,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604], [905, 705], [907, 705], [903, 604], [416, 313]]','{\"103\": \"RF1\", \"212\": \"R3\", \"311\": \"R1\", \"412\": \"R5\", \"416\": \"B3\", \"604\": \"RT1\", \"703\": \"R2\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(46,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604], [905, 705], [907, 705], [903, 604], [416, 313], [412, 416], [311, 313], [212, 214], [703, 804], [604, 903]]','{\"103\": \"RF1\", \"214\": \"R3\", \"313\": \"R1\", \"412\": \"R5\", \"416\": \"B3\", \"604\": \"RT1\", \"804\": \"R2\", \"903\": \"BT1\", \"905\": \"B8\", \"907\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(47,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604], [905, 705], [907, 705], [903, 604], [416, 313], [412, 416], [311, 313], [212, 214], [703, 804], [604, 903], [905, 804], [907, 806], [903, 604], [416, 412]]','{\"103\": \"RF1\", \"214\": \"R3\", \"313\": \"R1\", \"416\": \"B3\", \"804\": \"B8\", \"806\": \"B2\", \"903\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(48,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604], [905, 705], [907, 705], [903, 604], [416, 313], [412, 416], [311, 313], [212, 214], [703, 804], [604, 903], [905, 804], [907, 806], [903, 604], [416, 412], [313, 416], [214, 315]]','{\"103\": \"RF1\", \"313\": \"R1\", \"315\": \"R3\", \"804\": \"B8\", \"806\": \"B2\", \"903\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(49,5,'[[406, 505], [404, 503], [402, 501], [204, 406], [307, 309], [208, 210], [206, 208], [305, 307], [303, 404], [709, 707], [808, 806], [810, 808], [812, 907], [610, 511], [612, 513], [614, 515], [711, 612], [713, 614], [406, 707], [501, 600], [404, 402], [505, 404], [503, 501], [309, 511], [210, 212], [208, 210], [511, 309], [515, 414], [614, 515], [907, 903], [806, 905], [808, 907], [309, 511], [212, 414], [406, 513], [600, 701], [501, 602], [402, 501], [404, 503], [414, 212], [515, 416], [612, 513], [903, 602], [701, 802], [501, 602], [503, 604], [406, 513], [212, 414], [309, 311], [307, 309], [903, 802], [311, 412], [212, 313], [309, 311], [210, 212], [604, 705], [602, 703], [406, 604], [905, 705], [907, 705], [903, 604], [416, 313], [412, 416], [311, 313], [212, 214], [703, 804], [604, 903], [905, 804], [907, 806], [903, 604], [416, 412], [313, 416], [214, 315], [806, 705], [804, 703], [903, 909]]','{\"103\": \"RF1\", \"313\": \"R1\", \"315\": \"R3\", \"703\": \"B8\", \"705\": \"B2\", \"909\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B8\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R4\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R5\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R6\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R7\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R8\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(50,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307]]','{\"103\": \"RF1\", \"305\": \"R3\", \"307\": \"RT1\", \"402\": \"R2\", \"404\": \"R1\", \"711\": \"B1\", \"713\": \"B3\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(51,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509]]','{\"103\": \"RF1\", \"305\": \"R3\", \"307\": \"RT1\", \"402\": \"R2\", \"404\": \"R1\", \"509\": \"BT1\", \"610\": \"B1\", \"612\": \"B3\", \"709\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(52,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"406\": \"R3\", \"503\": \"R2\", \"505\": \"R1\", \"509\": \"BT1\", \"610\": \"B1\", \"612\": \"B3\", \"709\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(53,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503], [509, 505], [612, 511], [709, 608]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"406\": \"R3\", \"503\": \"R2\", \"509\": \"BT1\", \"511\": \"B3\", \"608\": \"B2\", \"610\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 2, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(54,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503], [509, 505], [612, 511], [709, 608], [307, 509], [406, 608], [503, 505]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"406\": \"R3\", \"505\": \"R2\", \"511\": \"B3\", \"608\": \"B2\", \"610\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(55,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503], [509, 505], [612, 511], [709, 608], [307, 509], [406, 608], [503, 505], [511, 410], [608, 507], [610, 509]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"406\": \"R3\", \"410\": \"B3\", \"505\": \"R2\", \"507\": \"B2\", \"509\": \"B1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(56,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503], [509, 505], [612, 511], [709, 608], [307, 509], [406, 608], [503, 505], [511, 410], [608, 507], [610, 509], [505, 507], [307, 509], [406, 410]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"406\": \"R3\", \"410\": \"B3\", \"507\": \"R2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(57,NULL,'[[303, 402], [305, 404], [206, 305], [204, 307], [711, 610], [713, 612], [810, 709], [812, 509], [307, 509], [305, 406], [404, 505], [402, 503], [509, 505], [612, 511], [709, 608], [307, 509], [406, 608], [503, 505], [511, 410], [608, 507], [610, 509], [505, 507], [307, 509], [406, 410], [410, 309]]','{\"103\": \"RF1\", \"307\": \"RT1\", \"309\": \"B3\", \"406\": \"R3\", \"507\": \"R2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 1, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 0, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 0, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(58,NULL,'[[204, 507], [206, 307], [303, 404], [305, 406]]','{\"103\": \"RF1\", \"307\": \"R3\", \"404\": \"R2\", \"406\": \"R1\", \"507\": \"RT1\", \"711\": \"B1\", \"713\": \"B3\", \"810\": \"B2\", \"812\": \"BT1\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}'),(59,NULL,'[[204, 507], [206, 307], [303, 404], [305, 406], [711, 610], [713, 612], [810, 709], [812, 509]]','{\"103\": \"RF1\", \"307\": \"R3\", \"404\": \"R2\", \"406\": \"R1\", \"507\": \"RT1\", \"509\": \"BT1\", \"610\": \"B1\", \"612\": \"B3\", \"709\": \"B2\", \"913\": \"BF1\"}','{\"B1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"B3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Blue\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R1\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R2\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"R3\": {\"HP\": 2, \"MP\": 1, \"Side\": \"Red\", \"Type\": \"S\", \"Range\": 2, \"Attack\": 1}, \"BF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Blue\", \"Type\": \"F\"}, \"BT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Blue\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}, \"RF1\": {\"HP\": 0, \"MP\": 0, \"Side\": \"Red\", \"Type\": \"F\"}, \"RT1\": {\"HP\": 4, \"MP\": 3, \"Side\": \"Red\", \"Type\": \"T\", \"Range\": 4, \"Attack\": 2}}');
 /*!40000 ALTER TABLE `game_turn` ENABLE KEYS */;
 UNLOCK TABLES;
 SET @@SESSION.SQL_LOG_BIN = @MYSQLDUMP_TEMP_LOG_BIN;
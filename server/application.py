@@ -1,11 +1,117 @@
-from flask import Flask, request
+from flask import Flask, Response, abort, request
+from contextlib import contextmanager
+import gzip
 import json
+import uuid
 import board
-from agents import simpleplayer, learningplayer
+from server import boardevents, sessionregistry, turnjobs, turnjournal
+from agents import simpleplayer, learningplayer, modelcache
 
 application = Flask(__name__)
-b = board.Board()
-nn = learningplayer.LearningPlayer()
+# the model cache reads models through its own board so it never shares a connection with requests
+models = modelcache.ModelCache(board.Board())
+models.preload_latest()
+models.start()
+# every game in the process has its own board and AI player, each with its own session in the database
+sessions = sessionregistry.SessionRegistry(board.Board, lambda: learningplayer.LearningPlayer(models=models))
+# AI turns started with /learningplayer/turn/start run here instead of in the request
+jobs = turnjobs.TurnJobs()
+# board versions start over with the process, so ETags carry an id for this process as well
+INSTANCE = uuid.uuid4().hex[:8]
+# responses at least this big are gzipped for clients that accept it
+GZIP_MIN = 1024
+# a gzipped body is a different representation, so its ETag is the plain one with this on the end
+GZIP_ETAG = '-gz'
+# restclient sends this with a plain JSON body, without it the body is a JSON string holding the JSON
+JSON_ONCE_HEADER = 'X-Json-Once'
+
+
+def session_id():
+    # game routes take ?session=<id>, requests without one share the default board
+    value = request.args.get('session')
+    if value is None:
+        return None
+    if not value.isdigit():
+        raise sessionregistry.UnknownSession(value)
+    return int(value)
+
+
+def posted():
+    # the JSON a client posted, gzipped or not, a body that doesn't decode is a 400
+    try:
+        body = request.get_data()
+        if request.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        data = json.loads(body)
+        if request.headers.get(JSON_ONCE_HEADER) is None:
+            data = json.loads(data)
+    except (OSError, EOFError, TypeError, ValueError):
+        abort(400)
+    return data
+
+
+@application.after_request
+def compress(response):
+    # streams and small bodies go out as they are
+    if response.direct_passthrough or response.is_streamed or response.status_code != 200:
+        return response
+    if 'gzip' not in request.accept_encodings or 'Content-Encoding' in response.headers:
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=5))
+    response.headers['Content-Encoding'] = 'gzip'
+    tag, weak = response.get_etag()
+    if tag is not None:
+        response.set_etag(tag + GZIP_ETAG, weak)
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def game():
+    # with game() as g: the requested game, locked for the rest of the request
+    return sessions.session(session_id())
+
+
+@contextmanager
+def publishing(g):
+    # play on the game's board inside the block goes out to /board/events watchers
+    # gives a Publisher, call its step() after each action and before finish_turn so every one is a diff of its own
+    # whatever changed since the last step goes out when the block ends
+    publisher = boardevents.Publisher(g.board, g.events)
+    try:
+        yield publisher
+    finally:
+        publisher.step()
+
+
+def publish_reset(g):
+    # for changes a diff doesn't cover, like terrain edits, watchers fetch /board/state again
+    g.events.publish(g.board.version, boardevents.RESET)
+
+
+def chosen_model(g):
+    # the model picked with /learningplayer/init, carried over when the client moves to another session
+    if g.player is None:
+        return None
+    return g.player.model_id
+
+
+def use_model(g, model_id):
+    if model_id is not None:
+        sessions.player(g).model_id = model_id
+
+
+@application.errorhandler(sessionregistry.UnknownSession)
+def unknown_session(e):
+    return json.dumps(None)+'\n', 404
+
+
+@application.errorhandler(sessionregistry.SessionUnavailable)
+def session_unavailable(e):
+    # the database is behind on this game's turns, try again once it has caught up
+    return json.dumps(None)+'\n', 503, {'Retry-After': '5'}
 
 
 @application.route('/hexbattle')
@@ -15,7 +121,9 @@ def welcome_page():
 
 @application.route('/board/reset')
 def reset():
-    b.reset()
+    with game() as g:
+        g.board.reset()
+        publish_reset(g)
     return json.dumps('Reset')+'\n', 202
 
 
@@ -26,9 +134,46 @@ def get_dimensions():
     return json.dumps([board.X_MAX, board.Y_MAX]) + '\n', 200
 
 
+@application.route('/board/state')
+def get_state():
+    # terrain, positions, units, acted, turn and victory in one response
+    # send the ETag back as If-None-Match and an unchanged board answers 304 with no body, gzipped or not
+    with game() as g:
+        b = g.board
+        tag = f'{INSTANCE}-{b.version}'
+        for sent in (tag, tag + GZIP_ETAG):
+            if request.if_none_match.contains_weak(sent):
+                return '', 304, {'ETag': f'"{sent}"'}
+        if g.state is None or g.state[0] != b.version:
+            g.state = (b.version, b.output_state() + '\n')
+        return g.state[1], 200, {'ETag': f'"{tag}"', 'Content-Type': 'application/json'}
+
+
+@application.route('/board/events')
+def board_events():
+    # server-sent events with a diff after every action on this game
+    # resume with Last-Event-ID, or ?since=, set to an event id or the /board/state ETag
+    watching = session_id()
+    last_id = request.headers.get('Last-Event-ID', request.args.get('since'))
+    if last_id is not None:
+        # the ETag of a gzipped /board/state names the same version
+        last_id = last_id.strip('"').removesuffix(GZIP_ETAG)
+    # an unknown session fails here rather than in the stream
+    with sessions.hold(watching):
+        pass
+
+    def stream():
+        # watched games stay in memory for as long as somebody is watching
+        with sessions.hold(watching) as g:
+            yield from g.events.stream(INSTANCE, last_id)
+
+    return Response(stream(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
+
 @application.route('/board/terrain')
 def get_terrain():
-    return b.output_terrain() + '\n', 200
+    with game() as g:
+        return g.board.output_terrain() + '\n', 200
 
 
 @application.route('/player/turn', methods=['GET', 'POST'])
@@ -38,56 +183,107 @@ def end_turn():
     # obviously this is courtesy rather than security
     # TODO generate a one-time token the interface uses to validate /turn posts
     status = 200
-    if request.method == 'POST':
-        turn = json.loads(request.get_json())
-        if turn.get('side') == b.turn:
-            b.finish_turn()
-            status = 201
-    return json.dumps(b.turn)+'\n', status
+    with game() as g:
+        b = g.board
+        if request.method == 'POST':
+            turn = posted()
+            if turn.get('side') == b.turn:
+                with publishing(g):
+                    b.finish_turn()
+                status = 201
+        return json.dumps(b.turn)+'\n', status
 
 
 @application.route('/simpleplayer/turn')
 def simple_turn():
     status = 200
-    simpleplayer.play_turn(b)
-    b.finish_turn()
-    return json.dumps(b.turn)+'\n', status
+    with game() as g:
+        b = g.board
+        with publishing(g) as publisher:
+            simpleplayer.play_turn(b, publisher.step)
+            publisher.step()
+            b.finish_turn()
+        return json.dumps(b.turn)+'\n', status
 
 
 @application.route('/learningplayer/list')
 def model_list():
-    return json.dumps(b.list_models()), 200
+    with game() as g:
+        return json.dumps(g.board.list_models()), 200
 
 
 @application.route('/learningplayer/init', methods=['POST'])
 def learning_init():
-    model_id = json.loads(request.get_json())
-    nn.reset(b, model_id)
-    status = 201
-    return json.dumps(nn.model_id), status
+    model_id = posted()
+    with game() as g:
+        nn = sessions.player(g)
+        nn.reset(g.board, model_id)
+        status = 201
+        return json.dumps(nn.model_id), status
+
+
+def play_ai_turn(playing):
+    # AI moves just one token and ends turn if no more
+    # the game is locked one token at a time, so requests reading the board get in between moves
+    with sessions.hold(playing) as g:
+        with g.lock:
+            side = g.board.turn
+            nn = sessions.player(g)
+        # loading a model can take a while, so have it in the cache before locking the game for moves
+        nn.models.get(nn.model_id)
+        while True:
+            with g.lock:
+                b = g.board
+                if side != b.turn or b.victory is not None:
+                    return b.turn
+                with publishing(g):
+                    nn.play_token(b)
 
 
 @application.route('/learningplayer/turn')
 def learning_turn():
-    # AI moves just one token and ends turn if no more
-    side = b.turn
-    while side == b.turn and b.victory is None:
-        nn.play_token(b)
-    return json.dumps(b.turn)+'\n', 200
+    return json.dumps(play_ai_turn(session_id()))+'\n', 200
+
+
+@application.route('/learningplayer/turn/start', methods=['GET', 'POST'])
+def learning_turn_start():
+    # start the AI turn in the background, poll /jobs/<job> for the side to play next
+    playing = session_id()
+    # an unknown session fails here rather than in the job
+    with sessions.hold(playing):
+        pass
+    job = jobs.submit(playing, play_ai_turn, playing)
+    return json.dumps(job.output())+'\n', 202
+
+
+@application.route('/jobs/<int:job_id>')
+def job_status(job_id):
+    # ?wait=<seconds> holds the request until the job finishes or the time is up
+    wait = request.args.get('wait', 0, type=float)
+    job = jobs.get(job_id, wait)
+    if job is None:
+        return json.dumps(None)+'\n', 404
+    status = 200
+    if job.status == turnjobs.RUNNING:
+        status = 202
+    return json.dumps(job.output())+'\n', status
 
 
 @application.route('/player/victory')
 def get_victory():
-    if b.victory is not None:
-        out = json.dumps(b.victory)
-    else:
-        out = json.dumps('None')
-    return out+'\n', 200
+    with game() as g:
+        b = g.board
+        if b.victory is not None:
+            out = json.dumps(b.victory)
+        else:
+            out = json.dumps('None')
+        return out+'\n', 200
 
 
 @application.route('/tokens/status')
 def show_units():
-    return b.output_units() + '\n', 200
+    with game() as g:
+        return g.board.output_units() + '\n', 200
 
 
 @application.route('/tokens/acted')
@@ -95,8 +291,9 @@ def show_acted():
     # output list of units that have acted in the turn
     # convert unit key bytes to strings
     str_key_list = []
-    for key in b.acted:
-        str_key_list.append(key.decode("UTF-8"))
+    with game() as g:
+        for key in g.board.acted:
+            str_key_list.append(key.decode("UTF-8"))
     return json.dumps(str_key_list)+'\n', 200
 
 
@@ -104,14 +301,12 @@ def show_acted():
 def show_valid_moves():
     # previously display would iterate over all positions, asking board if a move was valid
     # we shouldn't be so inefficient with REST requests so this handler does the iteration
-    token = json.loads(request.get_json())
+    token = posted()
     frm = board.make_coord_tuple(token['hex'])
     moves = []
-    for x in range(board.X_MAX):
-        for y in range(board.Y_MAX):
-            to = (x, y)
-            if b.check_action(frm, to):
-                moves.append(board.make_coord_num(to))
+    with game() as g:
+        for to in g.board.list_actions(frm):
+            moves.append(board.make_coord_num(to))
     out = json.dumps(moves)
     return out+'\n', 200
 
@@ -121,35 +316,109 @@ def update_positions():
     # player posts a list of {'token_xxyy':action_xxyy, ...}
     # we try to take all of those actions in order
     status = 200
-    if request.method == 'POST':
-        moves = json.loads(request.get_json())
-        for hex_key in moves:
-            hex_num = int(hex_key)
-            b.resolve_action(board.make_coord_tuple(hex_num), board.make_coord_tuple(moves[hex_key]))
-        status = 201
-    return b.output_positions() + '\n', status
+    with game() as g:
+        b = g.board
+        if request.method == 'POST':
+            moves = posted()
+            with publishing(g) as publisher:
+                for hex_key in moves:
+                    hex_num = int(hex_key)
+                    b.resolve_action(board.make_coord_tuple(hex_num), board.make_coord_tuple(moves[hex_key]))
+                    publisher.step()
+            status = 201
+        return b.output_positions() + '\n', status
+
+
+@application.route('/tokens/batch', methods=['POST'])
+def batch_actions():
+    # player posts {"actions": [[token_xxyy, action_xxyy], ...], "end_turn": false, "atomic": true}
+    # actions are taken in list order, so one token can act more than once in a batch
+    # atomic batches are all or nothing, if any action is illegal every one before it is undone
+    # end_turn finishes the turn after the actions, unless an atomic batch was undone
+    batch = posted()
+    actions = batch_actions_posted(batch)
+    if actions is None:
+        return json.dumps(batch)+'\n', 400
+    atomic = batch.get('atomic', True)
+    with game() as g:
+        b = g.board
+        results = []
+        deltas = []
+        with publishing(g) as publisher:
+            for frm, to in actions:
+                frm = board.make_coord_tuple(frm)
+                to = board.make_coord_tuple(to)
+                delta = None
+                if board.check_pos(frm) and board.check_pos(to):
+                    delta = b.apply_action(frm, to)
+                results.append(delta is not None)
+                if delta is not None:
+                    deltas.append(delta)
+                elif atomic:
+                    break
+            applied = all(results) or not atomic
+            if not applied:
+                for delta in reversed(deltas):
+                    b.undo_action(delta)
+            # the batch's actions go out as one diff, before finish_turn empties turn_summary
+            publisher.step()
+            if applied and batch.get('end_turn', False):
+                b.finish_turn()
+                publisher.step()
+            # the response brings a client through every diff published at once
+            diff = boardevents.merge(publisher.diffs)
+        # anything after the action that failed was never tried
+        results += [False] * (len(actions) - len(results))
+        out = {'results': results, 'applied': applied, 'version': b.version, 'turn': b.turn, 'diff': diff}
+    status = 201
+    if not applied:
+        status = 409
+    return json.dumps(out)+'\n', status
+
+
+def batch_actions_posted(batch):
+    # [(token_xxyy, action_xxyy), ...] from a posted batch, None if it isn't shaped like one
+    if not isinstance(batch, dict) or not isinstance(batch.get('actions', []), list):
+        return None
+    actions = []
+    for action in batch.get('actions', []):
+        if not isinstance(action, list) or len(action) != 2:
+            return None
+        try:
+            actions.append((int(action[0]), int(action[1])))
+        except (TypeError, ValueError):
+            return None
+    return actions
 
 
 @application.route('/edit/terrain', methods=['POST'])
 def edit_terrain():
     # expect {'hex_num':elevation, ...}
-    terrains = json.loads(request.get_json())
-    for hex_key in terrains:
-        hex_num = int(hex_key)
-        x, y = board.make_coord_tuple(hex_num)
-        b.terrain[x, y] = terrains[hex_key]
-    return b.output_terrain() + '\n', 201
+    terrains = posted()
+    with game() as g:
+        b = g.board
+        for hex_key in terrains:
+            hex_num = int(hex_key)
+            x, y = board.make_coord_tuple(hex_num)
+            b.terrain[x, y] = terrains[hex_key]
+        b.rehash()
+        publish_reset(g)
+        return b.output_terrain() + '\n', 201
 
 
 @application.route('/edit/positions', methods=['POST'])
 def edit_positions():
     # expect {'hex_num':unit_id}, ...}
-    positions = json.loads(request.get_json())
-    for hex_key in positions:
-        hex_num = int(hex_key)
-        x, y = board.make_coord_tuple(hex_num)
-        b.positions[x, y] = positions[hex_key]
-    return b.output_positions() + '\n', 201
+    positions = posted()
+    with game() as g:
+        b = g.board
+        for hex_key in positions:
+            hex_num = int(hex_key)
+            x, y = board.make_coord_tuple(hex_num)
+            b.positions[x, y] = positions[hex_key]
+        b.rehash()
+        publish_reset(g)
+        return b.output_positions() + '\n', 201
 
 
 @application.route('/edit/status', methods=['POST'])
@@ -157,15 +426,20 @@ def edit_units():
     # expect {unit_id: {stat block}}
     # debate between adding / replacing units in default list, and replacing entire list
     # I like the thought of not having to re-specify the flags and tanks
-    units = json.loads(request.get_json())
-    for token in units:
-        b.tokens[token.encode('UTF-8')] = units[token]
-    return b.output_units() + '\n', 201
+    units = posted()
+    with game() as g:
+        b = g.board
+        for token in units:
+            b.tokens[token.encode('UTF-8')] = units[token]
+        b.rehash()
+        publish_reset(g)
+        return b.output_units() + '\n', 201
 
 
 @application.route('/edit/save')
 def commit_edit():
-    config_num = b.save_config()
+    with game() as g:
+        config_num = g.board.save_config()
     return json.dumps({'config': config_num})+'\n', 201
 
 
@@ -173,16 +447,22 @@ def commit_edit():
 def session_list():
     player_id = None
     if request.method == 'POST':
-        player_id = json.loads(request.get_json())
-    rows = b.list_sessions(player_id)
+        player_id = posted()
+    with game() as g:
+        rows = g.board.list_sessions(player_id)
     return json.dumps(rows)+'\n', 200
 
 
 @application.route('/session/join', methods=['POST'])
 def session_join():
-    # join a numbered session
-    session_id = json.loads(request.get_json())
-    b.join_session(session_id)
+    # join a numbered session, it's loaded here and then the client names it in ?session= from now on
+    joining = posted()
+    if not str(joining).isdigit():
+        raise sessionregistry.UnknownSession(joining)
+    with game() as g:
+        model_id = chosen_model(g)
+    with sessions.session(int(joining)) as joined:
+        use_model(joined, model_id)
     return json.dumps(True)+'\n', 201
 
 
@@ -190,27 +470,40 @@ def session_join():
 def session_create():
     # quick length limit on player ID, same as UI
     # strings have a built-in test for alphanumeric character content
-    player_id = json.loads(request.get_json())
+    # the new session starts from the configuration loaded on the requesting board, on a board of its own
+    player_id = posted()
     if player_id.isalnum():
-        session_id = b.create_session(player_id[:50])
-        return json.dumps(session_id)+'\n', 201
+        with game() as g:
+            config_id = g.board.config_id
+            model_id = chosen_model(g)
+        b = board.Board(config_id)
+        new_session = b.create_session(player_id[:50])
+        if new_session is not None:
+            created = sessions.add(new_session, b)
+            with created.lock:
+                use_model(created, model_id)
+        return json.dumps(new_session)+'\n', 201
     else:
         return json.dumps(player_id), 403
 
 
 @application.route('/board/list')
 def config_list():
-    rows = b.list_configs()
+    with game() as g:
+        rows = g.board.list_configs()
     return json.dumps(rows)+'\n', 200
 
 
 @application.route('/board/load', methods=['POST'])
 def config_load():
-    config_id = json.loads(request.get_json())
-    new_config = b.load_config(config_id)
+    config_id = posted()
+    with game() as g:
+        new_config = g.board.load_config(config_id)
+        publish_reset(g)
     return json.dumps(new_config)+'\n', 202
 
 
 if __name__ == '__main__':
+    # a WSGI host serving application has to start the journal itself, or turns are posted straight to MySQL
+    turnjournal.start()
     application.run()
-
@@ -0,0 +1,225 @@
+import time
+import numpy
+from server import board, tokentable
+
+# a batch of games played in lockstep on stacked arrays, following Board.resolve_action and finish_turn
+# hexes are flat indexes (x * Y_MAX + y) like board.DISTANCE_MATRIX, and -1 as an action means end turn
+END_TURN = -1
+NO_WINNER = -1
+DRAW = len(tokentable.SIDES)
+
+SOLDIER = tokentable.TYPES.index(board.SOLDIER)
+FLAG = tokentable.TYPES.index(board.FLAG)
+EMPTY = tokentable.EMPTY
+
+
+class BatchBoard:
+    # every game starts as a copy of the template board and shares its terrain
+    # per-game state is grid (N, X_MAX, Y_MAX) plus side/hp/acted columns (N, tokens)
+    # token type, MP, attack and range never change in play, so they are shared (tokens,) columns
+    def __init__(self, template, count):
+        self.count = count
+        self.template = tokentable.from_board(template)
+        self.type = self.template.type
+        self.mp = self.template.mp
+        self.attack = self.template.attack
+        self.range = self.template.range
+        self.first_turn = tokentable.SIDES.index(template.turn)
+        self.terrain = template.terrain.copy()
+
+        # steps between every pair of hexes, -1 where there is no path, from one flood fill per hex
+        neighbors = template.neighbor_table()
+        self.steps = numpy.full([board.HEX_COUNT, board.HEX_COUNT], -1, dtype=numpy.int16)
+        for x, y in neighbors:
+            self.steps[x * board.Y_MAX + y] = board.flood_fill(neighbors, (x, y)).reshape(board.HEX_COUNT)
+
+        self.grid = None
+        self.side = None
+        self.hp = None
+        self.acted = None
+        self.turn = None
+        self.victory = None
+        self.reset()
+
+    def reset(self, games=None):
+        # put games (all of them by default) back to the template's starting state
+        if games is None:
+            self.grid = numpy.repeat(self.template.grid.reshape(1, board.X_MAX, board.Y_MAX), self.count, axis=0)
+            self.side = numpy.repeat(self.template.side.reshape(1, -1), self.count, axis=0)
+            self.hp = numpy.repeat(self.template.hp.reshape(1, -1), self.count, axis=0)
+            self.acted = numpy.repeat(self.template.acted.reshape(1, -1) > 0, self.count, axis=0)
+            self.turn = numpy.full(self.count, self.first_turn, dtype=numpy.int8)
+            self.victory = numpy.full(self.count, NO_WINNER, dtype=numpy.int8)
+        else:
+            self.grid[games] = self.template.grid
+            self.side[games] = self.template.side
+            self.hp[games] = self.template.hp
+            self.acted[games] = self.template.acted > 0
+            self.turn[games] = self.first_turn
+            self.victory[games] = NO_WINNER
+
+    def flat_grid(self):
+        # (N, hexes) view of grid, writes go through to the (N, X_MAX, Y_MAX) array
+        return self.grid.reshape(self.count, board.HEX_COUNT)
+
+    def token_hexes(self):
+        # flat hex of every token in every game, -1 for tokens that are off the board
+        grid = self.flat_grid()
+        hexes = numpy.full(self.side.shape, -1, dtype=numpy.int16)
+        games, cells = numpy.nonzero(grid != EMPTY)
+        hexes[games, grid[games, cells]] = cells
+        return hexes
+
+    def legal_masks(self):
+        # (N, tokens, hexes) boolean map of every legal action, the batch version of Board.legal_action_masks
+        hexes = self.token_hexes()
+        grid = self.flat_grid()
+        games = numpy.arange(self.count).reshape(-1, 1)
+        # grid holds -1 on empty hexes, which indexes the last token, so always mask with occupied
+        occupied = (grid != EMPTY) & (self.type[grid] != EMPTY)
+        cell_side = numpy.where(occupied, self.side[games, grid], EMPTY)
+        cell_flag = occupied & (self.type[grid] == FLAG)
+        enemy = occupied[:, None, :] & (cell_side[:, None, :] != self.side[:, :, None])
+
+        ready = (hexes >= 0) & (self.type != EMPTY) & (self.side == self.turn.reshape(-1, 1)) & ~self.acted
+        ready &= (self.victory == NO_WINNER).reshape(-1, 1)
+        steps = self.steps[numpy.maximum(hexes, 0)]
+        move = (steps >= 0) & (steps <= self.mp.reshape(1, -1, 1))
+        move &= ~occupied[:, None, :] | (enemy & (self.type == SOLDIER).reshape(1, -1, 1))
+        distances = board.DISTANCE_MATRIX[numpy.maximum(hexes, 0)]
+        shoot = (distances < 2 * self.range.reshape(1, -1, 1) + 1) & enemy & ~cell_flag[:, None, :]
+        return (move | shoot) & ready[:, :, None]
+
+    def step(self, frm, to):
+        # apply one action per game, frm and to are (N,) flat hexes and frm == END_TURN ends that game's turn
+        # returns (legal, winners): which actions were applied and the result of any game that just finished
+        # finished games are reset to the template before returning, so every game is always live
+        frm = numpy.asarray(frm)
+        to = numpy.asarray(to)
+        games = numpy.arange(self.count)
+        live = self.victory == NO_WINNER
+        end = live & (frm == END_TURN)
+        act = live & ~end
+        frm = numpy.maximum(frm, 0)
+        to = numpy.maximum(to, 0)
+
+        grid = self.flat_grid()
+        frm_id = grid[games, frm]
+        to_id = grid[games, to]
+        frm_safe = numpy.maximum(frm_id, 0)
+        to_safe = numpy.maximum(to_id, 0)
+        frm_type = numpy.where(frm_id != EMPTY, self.type[frm_safe], EMPTY)
+        to_type = numpy.where(to_id != EMPTY, self.type[to_safe], EMPTY)
+        frm_side = self.side[games, frm_safe]
+        to_side = self.side[games, to_safe]
+
+        # choose a token on the acting side that has not acted yet
+        valid = act & (frm_type != EMPTY) & (frm_side == self.turn) & ~self.acted[games, frm_safe]
+        occupied = to_type != EMPTY
+        enemy = occupied & (to_side != frm_side)
+
+        # moves are tried first, like resolve_action, then shots
+        steps = self.steps[frm, to]
+        move = valid & (steps >= 0) & (steps <= self.mp[frm_safe])
+        move &= ~occupied | (enemy & (frm_type == SOLDIER))
+        in_range = board.DISTANCE_MATRIX[frm, to] < 2 * self.range[frm_safe] + 1
+        shoot = valid & ~move & enemy & (to_type != FLAG) & in_range
+
+        m = games[move]
+        grid[m, frm[move]] = EMPTY
+        grid[m, to[move]] = frm_id[move]
+        captured = move & occupied
+        c = games[captured]
+        self.hp[c, to_safe[captured]] = 0
+        # capturing a flag converts every token on that side to the captor
+        flagged = captured & (to_type == FLAG)
+        convert = flagged.reshape(-1, 1) & (self.side == to_side.reshape(-1, 1))
+        self.side = numpy.where(convert, frm_side.reshape(-1, 1), self.side)
+
+        s = games[shoot]
+        self.hp[s, to_safe[shoot]] = numpy.maximum(0, self.hp[s, to_safe[shoot]] - self.attack[frm_safe[shoot]])
+        killed = shoot.copy()
+        killed[shoot] = self.hp[s, to_safe[shoot]] <= 0
+        grid[games[killed], to[killed]] = EMPTY
+
+        legal = move | shoot
+        self.acted[games[legal], frm_safe[legal]] = True
+
+        self.finish_turn(end)
+        winners = numpy.where(end, self.victory, NO_WINNER)
+        finished = games[winners != NO_WINNER]
+        if len(finished) > 0:
+            self.reset(finished)
+        return legal | end, winners
+
+    def finish_turn(self, ending):
+        # pass the turn for games in ending, mirroring Board.finish_turn
+        totals = numpy.zeros([self.count, len(tokentable.SIDES)], dtype=numpy.int32)
+        for code in range(len(tokentable.SIDES)):
+            totals[:, code] = numpy.where(self.side == code, self.hp, 0).sum(axis=1)
+
+        # mutual destruction
+        draw = ending & (totals.sum(axis=1) == 0)
+        self.victory[draw] = DRAW
+        self.turn[draw] = EMPTY
+        ending = ending & ~draw
+
+        # next side in rotation with survivors, coming all the way around means the acting side won
+        next_turn = self.turn.copy()
+        found = numpy.zeros(self.count, dtype=bool)
+        for k in range(1, len(tokentable.SIDES) + 1):
+            candidate = (self.turn.astype(numpy.int32) + k) % len(tokentable.SIDES)
+            alive = ~found & (totals[numpy.arange(self.count), candidate] > 0)
+            next_turn[alive] = candidate[alive]
+            found |= alive
+        won = ending & (next_turn == self.turn)
+        self.victory[won] = self.turn[won]
+        self.turn[ending] = next_turn[ending]
+        self.acted[ending] = False
+
+    def to_board(self, game):
+        # one game of the batch as an offline Board, for debugging and display
+        table = self.template.copy()
+        table.grid = self.grid[game].copy()
+        table.side = self.side[game].copy()
+        table.hp = self.hp[game].copy()
+        table.acted = self.acted[game].astype(numpy.int16)
+        b = board.Board(offline=True)
+        b.terrain = self.terrain.copy()
+        table.apply_to(b)
+        if self.turn[game] != EMPTY:
+            b.turn = tokentable.SIDES[self.turn[game]]
+        else:
+            b.turn = None
+        b.rehash()
+        return b
+
+
+def random_actions(batch, rng, end_chance=0.05):
+    # pick a uniformly random legal action in every game, or end the turn if there are none
+    masks = batch.legal_masks().reshape(batch.count, -1)
+    scores = rng.random(masks.shape) * masks
+    choice = numpy.argmax(scores, axis=1)
+    tokens = choice // board.HEX_COUNT
+    to = choice % board.HEX_COUNT
+    frm = batch.token_hexes()[numpy.arange(batch.count), tokens]
+    end = ~masks.any(axis=1) | (rng.random(batch.count) < end_chance)
+    frm = numpy.where(end, END_TURN, frm)
+    return frm, to
+
+
+if __name__ == '__main__':
+    # random self-play throughput on the default board
+    game_count = 1024
+    step_count = 500
+    random_gen = numpy.random.default_rng(0)
+    batch = BatchBoard(board.Board(offline=True), game_count)
+    results = numpy.zeros(DRAW + 1, dtype=int)
+    start = time.perf_counter()
+    for i in range(step_count):
+        frm_hexes, to_hexes = random_actions(batch, random_gen)
+        applied, winners = batch.step(frm_hexes, to_hexes)
+        results += numpy.bincount(winners[winners != NO_WINNER], minlength=DRAW + 1)
+    duration = time.perf_counter() - start
+    print(f'{game_count * step_count / duration:.0f} actions per second over {game_count} games')
+    print(f'finished games {dict(zip(tokentable.SIDES + ["Draw"], results.tolist()))}')
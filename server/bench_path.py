@@ -0,0 +1,108 @@
+import json
+import os
+import re
+import time
+import numpy
+import board
+
+# time pathfinding between every pair of clear hexes
+# the recursive depth-first search get_path used to run is kept here as the reference to beat
+SQL_DUMP = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'hexbattle.sql')
+
+
+def legacy_get_path(b, frm, to):
+    # the original get_path, costs map plus recursion through legacy_path_step
+    if not b.check_clear(frm):
+        return None
+    if not b.check_clear(to):
+        return None
+    costs = numpy.ones([board.X_MAX, board.Y_MAX]) * 99
+    costs += b.terrain
+    costs[frm[board.COL], frm[board.ROW]] = 0
+    path = legacy_path_step(b, costs, [frm], to, 0)
+    if path is not None:
+        path.reverse()
+        return path[1:]
+    else:
+        return None
+
+
+def legacy_path_step(b, costs, explore_list, to, old_length):
+    for explore in explore_list:
+        if explore == to:
+            costs[to[board.COL], to[board.ROW]] = old_length
+            return [to]
+        length = old_length + 1
+        current_dist = board.get_distance(explore, to)
+        closer_list = []
+        equal_list = []
+        farther_list = []
+        for i, j in board.HEX_STEPS:
+            new_explore = (explore[board.COL] + i, explore[board.ROW] + j)
+            if b.check_clear(new_explore):
+                new_dist = board.get_distance(new_explore, to)
+                if costs[new_explore[board.COL], new_explore[board.ROW]] > length:
+                    costs[new_explore[board.COL], new_explore[board.ROW]] = length
+                    if current_dist > new_dist:
+                        closer_list.append(new_explore)
+                    elif current_dist == new_dist:
+                        equal_list.append(new_explore)
+                    else:
+                        farther_list.append(new_explore)
+        path = legacy_path_step(b, costs, closer_list, to, length)
+        if path is None:
+            path = legacy_path_step(b, costs, equal_list, to, length)
+        if path is None:
+            path = legacy_path_step(b, costs, farther_list, to, length)
+        if path is not None:
+            path.append(explore)
+            return path
+
+
+def dump_terrain():
+    # terrain of the first game_config row in the database dump
+    with open(SQL_DUMP) as dump:
+        for line in dump:
+            if line.startswith('INSERT INTO `game_config`'):
+                terrain_json = re.search(r"\(\d+,'(.*?)','", line).group(1)
+                return json.loads(terrain_json.replace('\\"', '"'))
+    return {}
+
+
+def run(b, label):
+    hexes = [(x, y) for x in range(board.X_MAX) for y in range(board.Y_MAX) if b.check_clear((x, y))]
+    pairs = [(frm, to) for frm in hexes for to in hexes]
+
+    start = time.perf_counter()
+    old_paths = [legacy_get_path(b, frm, to) for frm, to in pairs]
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new_paths = [b.get_path(frm, to) for frm, to in pairs]
+    new_time = time.perf_counter() - start
+
+    # the new search is shortest-path, the old one settled for the first path it stumbled on
+    shorter = 0
+    for old, new in zip(old_paths, new_paths):
+        if (old is None) != (new is None):
+            print(f'MISMATCH: legacy {old} new {new}')
+        elif old is not None and len(new) < len(old):
+            shorter += 1
+
+    print(f'{label}: {len(pairs)} paths')
+    print(f'  recursive {old_time:.3f}s  {1000000 * old_time / len(pairs):.1f}us per path')
+    print(f'  A*        {new_time:.3f}s  {1000000 * new_time / len(pairs):.1f}us per path')
+    print(f'  speedup {old_time / new_time:.1f}x, {shorter} paths shorter than before')
+
+
+if __name__ == '__main__':
+    game_board = board.Board()
+    run(game_board, 'default board')
+
+    game_board.terrain = numpy.zeros([board.X_MAX, board.Y_MAX])
+    for terrain_num, elevation in dump_terrain().items():
+        # the dump carries a few entries past the edge of the map
+        x, y = board.make_coord_tuple(int(terrain_num))
+        if board.check_pos((x, y)):
+            game_board.terrain[x, y] = elevation
+    run(game_board, 'hexbattle.sql config 1')
@@ -0,0 +1,233 @@
+import argparse
+import contextlib
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import numpy
+import board
+from applications import restclient
+
+# load test for the REST API: many simulated players hitting application.py at once
+# every player plays its own game the way display.py does, state reads, the action overlay for a token it picks,
+# moves, end turns and AI turns, and the harness reports throughput and latency per route
+# the server runs in this process, as a subprocess, or is any running server given by --url
+# by default every player creates a session, which needs hexbattle.sql loaded into MySQL on 127.0.0.1,
+# and turns go through the turn journal into game_turn like they do in production
+# --offline needs no database, the server it starts registers an offline board for each player instead
+# run from server/ with the repository root on PYTHONPATH, like test_board.py
+
+# relative weights of what a player does next
+MIX = {'state': 30, 'move': 30, 'end_turn': 10, 'auto_turn': 5, 'ai_turn': 5, 'terrain': 5, 'status': 5}
+# session ids of the --offline games, well clear of any a database hands out
+OFFLINE_SESSIONS = 1000000
+
+
+class Recorder:
+    # the metrics hook for every client, latencies by route
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+
+    def __call__(self, method, path, status, duration):
+        route = f'{method} {path}'
+        with self.lock:
+            self.latencies.setdefault(route, []).append(duration)
+            if status >= 500:
+                self.errors[route] = self.errors.get(route, 0) + 1
+
+    def error(self, route):
+        with self.lock:
+            self.errors[route] = self.errors.get(route, 0) + 1
+
+    def report(self, seconds):
+        total = sum(len(times) for times in self.latencies.values())
+        print(f'{total} requests in {seconds:.1f}s, {total / seconds:.0f} per second')
+        print(f'  {"route":32} {"count":>7} {"errors":>6} {"per s":>7} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8}')
+        for route in sorted(self.latencies, key=lambda r: -len(self.latencies[r])):
+            times = numpy.array(self.latencies[route]) * 1000
+            p50, p95, p99 = numpy.percentile(times, [50, 95, 99])
+            print(f'  {route:32} {len(times):7} {self.errors.get(route, 0):6} {len(times) / seconds:7.0f} '
+                  f'{p50:8.2f} {p95:8.2f} {p99:8.2f}')
+
+
+def start_session(client, game_number, offline=False):
+    # a session of its own per player, offline games were registered by serve() before the players started
+    if offline:
+        client.session_id = OFFLINE_SESSIONS + game_number
+        return
+    client.load_config(1)
+    if client.start_session(f'bench{game_number}') is None:
+        raise SystemExit('the server could not create a session, load hexbattle.sql into MySQL or run with --offline')
+
+
+def play(client, recorder, stop, ai, rng):
+    choices = list(MIX)
+    weights = [MIX[choice] if choice != 'ai_turn' or ai else 0 for choice in choices]
+    state = client.get_state()
+    while not stop.is_set():
+        choice = rng.choices(choices, weights)[0]
+        try:
+            if state['victory'] is not None:
+                client.init_board()
+                state = client.get_state()
+            elif choice == 'state':
+                state = client.get_state()
+            elif choice == 'move':
+                # pick a token like a player would, see where it can go, then send it somewhere
+                tokens = [(x, y) for x, y in numpy.argwhere(state['positions'] != b'')
+                          if state['units'][state['positions'][x, y].decode('UTF-8')][board.SIDE] == state['turn']]
+                if tokens:
+                    frm = tokens[rng.randrange(len(tokens))]
+                    actions = client.get_actions((int(frm[0]), int(frm[1])))
+                    if actions:
+                        to = board.make_coord_tuple(rng.choice(actions))
+                        client.post_position((int(frm[0]), int(frm[1])), to)
+                        state = client.get_state()
+            elif choice == 'end_turn':
+                client.post_turn(state['turn'])
+                state = client.get_state()
+            elif choice == 'auto_turn':
+                client.auto_turn()
+                state = client.get_state()
+            elif choice == 'ai_turn':
+                client.ai_turn()
+                state = client.get_state()
+            elif choice == 'terrain':
+                client.get_terrain()
+            elif choice == 'status':
+                client.get_units()
+        except Exception as e:
+            # a failed request shows up in the error column, the player carries on from a fresh state
+            recorder.error(f'client {type(e).__name__}')
+            try:
+                state = client.get_state()
+            except Exception:
+                time.sleep(0.1)
+
+
+def run(url, clients, seconds, seed=0, offline=False):
+    recorder = Recorder()
+    setup = restclient.RestClient(url)
+    models = setup.ai_models()
+    ai = bool(models)
+    players = []
+    for i in range(clients):
+        client = restclient.RestClient(url, metrics=recorder)
+        start_session(client, i, offline)
+        players.append(client)
+    # setup traffic isn't part of the measurement
+    recorder.latencies = {}
+    recorder.errors = {}
+
+    stop = threading.Event()
+    threads = [threading.Thread(target=play, args=(client, recorder, stop, ai, random.Random(seed + i)), daemon=True)
+               for i, client in enumerate(players)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    for client in players:
+        client.close()
+    return recorder, elapsed, ai
+
+
+def report(url, clients, recorder, elapsed, ai):
+    print(f'{clients} clients against {url}')
+    if not ai:
+        print('no models to load, AI turns were left out of the mix')
+    recorder.report(elapsed)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_for(port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def serve(port, offline_games=0):
+    # the flask app on a threaded server, like the development server application.run() starts
+    # offline_games > 0 keeps the server off the database and registers that many games for the players
+    from werkzeug.serving import make_server
+    import application
+    from server import turnjournal
+    if offline_games > 0:
+        registry = application.sessions
+        registry.make_board = lambda: board.Board(offline=True)
+        registry.capacity = max(registry.capacity, offline_games + 1)
+        for i in range(offline_games):
+            registry.add(OFFLINE_SESSIONS + i, board.Board(offline=True))
+    else:
+        turnjournal.start()
+    # a line per request would drown the report
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    server = make_server('127.0.0.1', port, application.application, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='REST load test for application.py')
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--url', help='test a running server instead of starting one')
+    parser.add_argument('--subprocess', action='store_true', help='start the server in its own process')
+    parser.add_argument('--offline', action='store_true', help='start a server with offline boards, no MySQL needed')
+    parser.add_argument('--serve', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.offline and args.url is not None:
+        parser.error('--offline games are registered by the server the bench starts, it can\'t be used with --url')
+    offline_games = args.clients if args.offline else 0
+
+    if args.serve is not None:
+        # the --subprocess server
+        serve(args.serve, offline_games)
+        threading.Event().wait()
+    elif args.url is not None:
+        report(args.url, args.clients, *run(args.url, args.clients, args.seconds, args.seed))
+    elif args.subprocess:
+        port = free_port()
+        command = [sys.executable, __file__, '--serve', str(port), '--clients', str(args.clients)]
+        if args.offline:
+            command.append('--offline')
+        server_process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+        try:
+            if wait_for(port):
+                url = f'http://127.0.0.1:{port}'
+                report(url, args.clients, *run(url, args.clients, args.seconds, args.seed, args.offline))
+            else:
+                print('server did not start')
+        finally:
+            server_process.terminate()
+            server_process.wait()
+    else:
+        port = free_port()
+        url = f'http://127.0.0.1:{port}'
+        # the players share this process with the server, whose game code prints as it plays
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            flask_server = serve(port, offline_games)
+            results = run(url, args.clients, args.seconds, args.seed, args.offline)
+            flask_server.shutdown()
+        report(url, args.clients, *results)
@@ -1,4 +1,7 @@
-from server import dbconnect
+from server import dbconnect, weightblob, zobrist
+import heapq
+from collections import deque
+import itertools
 import json
 import numpy
 
@@ -23,6 +26,12 @@ MV = 'MP'
 RNG = 'Range'
 ATK = 'Attack'
 
+# game_turn rows carry the whole board every KEYFRAME_INTERVAL turns, and only what changed in between
+KEYFRAME_INTERVAL = 10
+
+# board versions come from one counter, so a version is never reused, even by a board built after another was dropped
+VERSIONS = itertools.count(1)
+
 # token templates
 # copying a dict like a tank definition and adding an attribute for color is extra lines of code
 # as it is these have to be set in unit list with .copy() to avoid corrupting original value
@@ -38,9 +47,32 @@ X_MAX = 11
 Y_MAX = 16
 TURNS = [RED, BLUE]
 
+# single hex steps, see check_1move
+HEX_STEPS = ((-1, -1), (-1, +1), (+1, -1), (+1, +1), (0, -2), (0, +2))
+
+# lookup tables for the coordinate helpers at the bottom of this file, built once at import
+# flat hex index i covers coordinate (i // Y_MAX, i % Y_MAX)
+HEX_COUNT = X_MAX * Y_MAX
+COORD_TUPLES = numpy.argwhere(numpy.ones([X_MAX, Y_MAX], dtype=bool))
+COORD_NUMS = (COORD_TUPLES[:, COL] * 100 + COORD_TUPLES[:, ROW]).reshape(X_MAX, Y_MAX)
+VALID_HEXES = (COORD_TUPLES[:, COL] % 2 == COORD_TUPLES[:, ROW] % 2).reshape(X_MAX, Y_MAX)
+
+# get_distance between every pair of coordinates, indexed [frm_x, frm_y, to_x, to_y]
+# DISTANCE_MATRIX is the same data indexed [frm hex index, to hex index]
+_X_DIST = abs(numpy.arange(X_MAX).reshape(X_MAX, 1, 1, 1) - numpy.arange(X_MAX).reshape(1, 1, X_MAX, 1))
+_Y_DIST = abs(numpy.arange(Y_MAX).reshape(1, Y_MAX, 1, 1) - numpy.arange(Y_MAX).reshape(1, 1, 1, Y_MAX))
+DISTANCES = _X_DIST + numpy.maximum(_X_DIST, _Y_DIST)
+DISTANCE_MATRIX = DISTANCES.reshape(HEX_COUNT, HEX_COUNT)
+
+# plain python copies for scalar lookups, indexing nested lists is several times quicker than numpy
+# only index these with on-board coordinates, negative values will quietly wrap around
+DISTANCE_LOOKUP = DISTANCES.tolist()
+VALID_LOOKUP = VALID_HEXES.tolist()
+NUM_TUPLES = [(num // 100, num % 100) for num in range(X_MAX * 100)]
+
 
 class Board:
-    def __init__(self, config=0):
+    def __init__(self, config=0, offline=False):
         self.terrain = None
         self.positions = None
         self.tokens = {}
@@ -48,12 +80,55 @@ class Board:
         self.acted = []
         self.turn_summary = []
         self.victory = None
+        # turns posted in the current session, and the board as it was at the last post for working out deltas
+        self.turn_number = 0
+        self.posted_positions = None
+        self.posted_tokens = None
+        # zobrist hash of terrain, positions, token HP and side, acted and turn
+        # kept current by the play methods, anything else that edits the board has to call rehash()
+        self.hash = 0
+        # goes up on every change to the board, clients compare it to skip fetching a board they already have
+        self.version = next(VERSIONS)
+        # pathfinding graph for the current terrain, see neighbor_table()
+        self.layout = None
+        self.neighbors = None
+        self.terrain_hash = 0
+        # callables told which hexes play changed, see touch()
+        self.listeners = []
         # time to connect to data
         # only the database connection knows about session_id
+        # offline boards skip the database entirely and always start from the default layout
         self.config_id = config
-        self.database = dbconnect.DBConnection()
+        self.database = dbconnect.DBConnection(enable=not offline)
         self.reset()
 
+    def clone(self):
+        # database-free copy of the game for lookahead, no MySQL and no deep copy of the terrain
+        # terrain and the pathfinding caches are shared because play never changes them
+        other = Board.__new__(Board)
+        other.terrain = self.terrain
+        other.positions = self.positions.copy()
+        other.tokens = {}
+        for key, stats in self.tokens.items():
+            other.tokens[key] = stats.copy()
+        other.turn = self.turn
+        other.acted = self.acted.copy()
+        other.turn_summary = self.turn_summary.copy()
+        other.victory = self.victory
+        # the posted snapshots are replaced rather than changed, so they can be shared
+        other.turn_number = self.turn_number
+        other.posted_positions = self.posted_positions
+        other.posted_tokens = self.posted_tokens
+        other.hash = self.hash
+        other.version = self.version
+        other.layout = self.layout
+        other.neighbors = self.neighbors
+        other.terrain_hash = self.terrain_hash
+        other.listeners = []
+        other.config_id = self.config_id
+        other.database = dbconnect.DBConnection(enable=False)
+        return other
+
     def reset(self):
         # use 1 array for each token type, effectively a one-hot encoding of tokens
         # initialize co-ords [0,0] to [X_MAX,Y_MAX]
@@ -88,6 +163,7 @@ class Board:
             self.turn_summary.pop(0)
         self.turn_summary
         self.victory = None
+        self.rehash()
 
     # todo fix the mess I made by building a facade for self.database in board
     # unfortunately there are a couple of database methods that do a lot of internal state
@@ -114,6 +190,10 @@ class Board:
         if self.database.enable:
             config = self.database.load_board(config_id)
             if config is not None:
+                # a configuration is the whole board, so nothing from the last one carries over
+                self.terrain = numpy.zeros([X_MAX, Y_MAX])
+                self.positions = numpy.full([X_MAX, Y_MAX], '', dtype='S3')
+                self.tokens = {}
                 terrain_config = json.loads(config[0])
                 position_config = json.loads(config[1])
                 token_config = json.loads(config[2])
@@ -127,6 +207,7 @@ class Board:
                     self.tokens[token_id.encode("UTF-8")] = token_stats
                 load = True
                 self.config_id = config_id
+                self.rehash()
         return load
 
     def delete_config(self):
@@ -141,27 +222,90 @@ class Board:
 
     def join_session(self, session_id):
         # only the db connection knows session_id values
+        # returns the session's config ID, None leaves the board as it was when there's no open session by that ID
         if self.database.enable:
-            self.config_id = self.database.join_session(session_id)
-            self.load_config(self.config_id)
+            config_id = self.database.join_session(session_id)
+            if config_id is not None:
+                self.config_id = config_id
+                # pick up where the last posted turn left off
+                self.replay(session_id)
+            return config_id
+        return None
+
+    def replay(self, session_id, turn=None):
+        # put the board in the state it was in after the given turn of a session, the latest turn by default
+        # starts from the session's configuration and then the nearest keyframe, applying deltas from there
+        # returns the turn number the board is at, None before any turn was posted
+        if not self.database.enable:
+            return None
+        config_id = self.database.session_config(session_id)
+        if config_id is None or not self.load_config(config_id):
+            return None
+        last_turn = None
+        for row in self.database.load_turns(session_id, turn):
+            last_turn = self.apply_turn_row(row)
+        self.start_turns(last_turn)
+        return last_turn
+
+    def replay_turns(self, session_id):
+        # walk a whole session turn by turn, for rebuilding training data from history
+        # yields (turn number, actions taken that turn) with the board in its state after that turn
+        if not self.database.enable:
+            return
+        config_id = self.database.session_config(session_id)
+        if config_id is None or not self.load_config(config_id):
+            return
+        for row in self.database.load_turns(session_id, None, from_start=True):
+            turn_number = self.apply_turn_row(row)
+            self.start_turns(turn_number)
+            yield turn_number, json.loads(row[3])
+
+    def apply_turn_row(self, row):
+        # row is (turn, keyframe, side, actions, positions, status) from game_turn
+        turn_number, keyframe, side, actions, positions_json, status_json = row
+        if keyframe:
+            self.positions = numpy.full([X_MAX, Y_MAX], '', dtype='S3')
+            self.tokens = {}
+        for position_num, token_id in json.loads(positions_json).items():
+            position_coords = make_coord_tuple(int(position_num))
+            self.positions[position_coords[COL], position_coords[ROW]] = token_id.encode('UTF-8')
+        for token_id, token_stats in json.loads(status_json).items():
+            if token_stats is None:
+                self.tokens.pop(token_id.encode('UTF-8'), None)
+            else:
+                self.tokens[token_id.encode('UTF-8')] = token_stats
+        if side is not None:
+            self.turn = side
+        return turn_number
+
+    def start_turns(self, last_turn):
+        # the board now matches the last posted turn, so play carries on from there
+        self.acted = []
+        self.turn_summary = []
+        self.victory = None
+        self.rehash()
+        if last_turn is None:
+            self.turn_number = 0
+            self.posted_positions = None
+            self.posted_tokens = None
+        else:
+            self.turn_number = last_turn + 1
+            self.mark_posted()
 
     def create_session(self, player_id):
         # inserts session record and sets session_id value in the db connection
         # we've already loaded the related ID
         if self.database.enable:
             if self.config_id > 0 and player_id is not None:
+                self.turn_number = 0
+                self.posted_positions = None
+                self.posted_tokens = None
                 return self.database.create_session(self.config_id, player_id)
 
     def save_model(self, config_json, model_weights, model_id=None):
         if self.database.enable:
-            # weird that keras will dump model configuration directly to JSON
-            # but weights are just kicked out as a list of numpy arrays and I have to handle them
-            weight_list = []
-            for layer_weights in model_weights:
-                # don't know why I have to dumps each list
-                weight_list.append(json.dumps(layer_weights.tolist()))
-            json_weights = json.dumps(weight_list)
-            return self.database.save_model(config_json, json_weights, model_id)
+            # keras dumps model configuration directly to JSON, weights are packed as float32 binary
+            return self.database.save_model(config_json, weightblob.pack(model_weights), model_id)
 
     def list_models(self):
         if self.database.enable:
@@ -169,18 +313,33 @@ class Board:
         else:
             return None
 
+    def list_model_versions(self):
+        # {model id: weight version}, the version goes up every time a model is saved over
+        if self.database.enable:
+            versions = {}
+            for model_id, version in self.database.list_model_versions():
+                versions[model_id] = version
+            return versions
+        else:
+            return None
+
     def load_model(self, model_id):
-        # jump through all the serialization hoops here
         if self.database.enable:
             model_rows = self.database.load_model(model_id)
             model_config = model_rows[0]
             model_weights = None
-            if model_rows[1] is not None:
+            if model_rows[2] is not None:
+                model_weights = weightblob.unpack(model_rows[2])
+            elif model_rows[1] is not None:
+                # older rows hold a JSON list of JSON strings, one per weight array
+                # move them over to the binary column the first time they are read
                 weight_list = json.loads(model_rows[1])
                 model_weights = []
                 for w in weight_list:
-                    w_array = numpy.array(json.loads(w))
-                    model_weights.append(w_array)
+                    model_weights.append(numpy.array(json.loads(w)))
+                blob = weightblob.pack(model_weights)
+                self.database.save_weights(model_id, blob)
+                model_weights = weightblob.unpack(blob)
             return model_config, model_weights
         else:
             return None, None
@@ -196,7 +355,7 @@ class Board:
             eliminated = list(totals.values()).count(0)
             if eliminated == len(TURNS):
                 self.victory = 'Draw'
-                self.turn = None
+                self.set_turn(None)
                 return self.turn
 
             # turn goes to the next side in rotation with surviving units
@@ -216,14 +375,51 @@ class Board:
                 if self.database.enable:
                     self.database.close_session()
             else:
-                self.turn = next_turn
+                self.set_turn(next_turn)
                 if self.database.enable:
-                    self.database.post_turn(self.output_turn_actions(), self.output_positions(), self.output_units())
+                    self.post_turn()
+            # turn_summary holds the actions of one turn
+            self.turn_summary = []
 
+            for key in self.acted:
+                self.hash ^= zobrist.acted_key(key)
             self.acted = []
+            self.version = next(VERSIONS)
+            if self.listeners:
+                self.touch(self.token_cells())
             return self.turn
         return None
 
+    def post_turn(self):
+        # a full keyframe every KEYFRAME_INTERVAL turns, otherwise the hexes and units that changed since the last post
+        # emptied hexes are posted as "" and removed units as null
+        keyframe = self.posted_tokens is None or self.turn_number % KEYFRAME_INTERVAL == 0
+        if keyframe:
+            positions = self.output_positions()
+            units = self.output_units()
+        else:
+            changed_positions = {}
+            for x, y in numpy.argwhere(self.positions != self.posted_positions):
+                changed_positions[make_coord_num((int(x), int(y)))] = self.positions[x, y].decode('UTF-8')
+            changed_units = {}
+            for key, stats in self.tokens.items():
+                if self.posted_tokens.get(key) != stats:
+                    changed_units[key.decode('UTF-8')] = stats
+            for key in self.posted_tokens:
+                if key not in self.tokens:
+                    changed_units[key.decode('UTF-8')] = None
+            positions = json.dumps(changed_positions)
+            units = json.dumps(changed_units)
+        self.database.post_turn(self.output_turn_actions(), positions, units, self.turn_number, keyframe, self.turn)
+        self.turn_number += 1
+        self.mark_posted()
+
+    def mark_posted(self):
+        self.posted_positions = self.positions.copy()
+        self.posted_tokens = {}
+        for key, stats in self.tokens.items():
+            self.posted_tokens[key] = stats.copy()
+
     def color_totals(self):
         # assign tokens to lists for each side for easy counting
         # this will help for figuring out turn values in learningplayer
@@ -246,11 +442,12 @@ class Board:
         frm_token = self.tokens.get(frm_key)
         to_key = self.positions[to[COL], to[ROW]]
         to_token = self.tokens.get(to_key)
-        if frm_token is not None:
-            path = self.get_path(frm, to)
-            if path is None:
+        if frm_token is not None and check_pos(to):
+            # one flood fill per origin answers the path length question for every destination
+            steps = self.reachable_from(frm)[to[COL], to[ROW]]
+            if steps < 0:
                 return False
-            check_dist = frm_token[MV] >= len(path)
+            check_dist = frm_token[MV] >= steps
             if to_token is None:
                 return check_dist
             elif frm_token[TYPE] == SOLDIER:
@@ -265,7 +462,7 @@ class Board:
         frm_token = self.tokens.get(frm_key)
         to_token = self.tokens.get(to_key)
         if frm_token is not None and to_token is not None:
-            check_range = 2 * frm_token[RNG] + 1 > get_distance(frm, to)
+            check_range = 2 * frm_token[RNG] + 1 > DISTANCE_LOOKUP[frm[COL]][frm[ROW]][to[COL]][to[ROW]]
             check_oppo = frm_token[SIDE] != to_token[SIDE] and to_token[TYPE] != FLAG
             return check_range and check_oppo
         return False
@@ -274,6 +471,62 @@ class Board:
         # test to see if a game input is some kind of legal action
         return self.check_move(frm, to) or self.check_shoot(frm, to)
 
+    def list_actions(self, frm):
+        # every hex the token at frm can act on
+        move_mask, shoot_mask = self.action_masks(frm)
+        actions = []
+        for x, y in numpy.argwhere(move_mask | shoot_mask):
+            actions.append((int(x), int(y)))
+        return actions
+
+    def legal_action_masks(self, side):
+        # move and shoot masks for every token on side that hasn't acted yet, as {(x, y): (move, shoot)}
+        # occupant grids are shared so each token only costs a few array operations
+        occupants = self.occupant_grids()
+        masks = {}
+        for x, y in numpy.argwhere(occupants[0] != ''):
+            token_chars = self.positions[x, y]
+            token = self.tokens.get(token_chars)
+            if token[SIDE] == side and self.acted.count(token_chars) == 0:
+                masks[(int(x), int(y))] = self.action_masks((x, y), occupants)
+        return masks
+
+    def action_masks(self, frm, occupants=None):
+        # boolean maps of the hexes check_move and check_shoot would accept for the token at frm
+        move_mask = numpy.zeros([X_MAX, Y_MAX], dtype=bool)
+        shoot_mask = numpy.zeros([X_MAX, Y_MAX], dtype=bool)
+        frm_token = self.tokens.get(self.positions[frm[COL], frm[ROW]])
+        if frm_token is None:
+            return move_mask, shoot_mask
+        if occupants is None:
+            occupants = self.occupant_grids()
+        sides, flags = occupants
+        enemy = (sides != '') & (sides != frm_token[SIDE])
+
+        # walk onto empty hexes, soldiers can also walk onto the enemy to capture
+        steps = self.reachable_from(frm, frm_token[MV])
+        move_mask = steps >= 0
+        if frm_token[TYPE] == SOLDIER:
+            move_mask &= (sides == '') | enemy
+        else:
+            move_mask &= sides == ''
+
+        # shoot any enemy but a flag within range
+        shoot_mask = DISTANCES[frm[COL], frm[ROW]] < 2 * frm_token[RNG] + 1
+        shoot_mask &= enemy & ~flags
+        return move_mask, shoot_mask
+
+    def occupant_grids(self):
+        # which side holds each hex ('' for nobody), and where the flags are
+        sides = numpy.full([X_MAX, Y_MAX], '', dtype='U8')
+        flags = numpy.zeros([X_MAX, Y_MAX], dtype=bool)
+        for x, y in numpy.argwhere(self.positions != b''):
+            token = self.tokens.get(self.positions[x, y])
+            if token is not None:
+                sides[x, y] = token[SIDE]
+                flags[x, y] = token[TYPE] == FLAG
+        return sides, flags
+
     def resolve_action(self, frm, to):
         # execute on a game input
         frm_key = self.positions[frm[COL], frm[ROW]]
@@ -295,12 +548,12 @@ class Board:
             return False
 
         if self.check_move(frm, to):
-            self.positions[frm[COL], frm[ROW]] = ''
-            self.positions[to[COL], to[ROW]] = frm_key
+            self.place(frm, b'')
+            self.place(to, frm_key)
             if frm_token[TYPE] == SOLDIER:
                 # destroy the captured unit for purpose of counting playable tokens by HP
                 if to_token is not None:
-                    to_token[HP] = 0
+                    self.set_stat(to_key, HP, 0)
 
                     # capturing flag converts all units for that side to their captor
                     if to_token[TYPE] == FLAG:
@@ -308,26 +561,144 @@ class Board:
                         for key in self.tokens:
                             unit = self.tokens[key]
                             if unit[SIDE] == captured_side:
-                                unit[SIDE] = frm_token[SIDE]
-            self.acted.append(frm_key)
+                                self.set_stat(key, SIDE, frm_token[SIDE])
+            self.mark_acted(frm_key)
             self.turn_summary.append([int(make_coord_num(frm)), int(make_coord_num(to))])
             return True
 
         if self.check_shoot(frm, to):
-            to_token[HP] -= frm_token[ATK]
+            # eliminate overkill, we're prone to checking for exactly 0
+            self.set_stat(to_key, HP, max(0, to_token[HP] - frm_token[ATK]))
             if to_token[HP] <= 0:
-                # eliminate overkill, we're prone to checking for exactly 0
-                to_token[HP] = 0
-                self.positions[to[COL], to[ROW]] = ''
-            self.acted.append(frm_key)
+                self.place(to, b'')
+            self.mark_acted(frm_key)
             self.turn_summary.append([int(make_coord_num(frm)), int(make_coord_num(to))])
             return True
 
         return False
 
+    # every change play makes to the board goes through these, so the hash is updated as we go
+    def place(self, coord, token_chars):
+        x = coord[COL]
+        y = coord[ROW]
+        self.hash ^= zobrist.cell_key(self.positions[x, y], x, y) ^ zobrist.cell_key(token_chars, x, y)
+        self.positions[x, y] = token_chars
+        self.version = next(VERSIONS)
+        if self.listeners:
+            self.touch([(x, y)])
+
+    def set_stat(self, token_chars, stat, value):
+        # only HP and Side change during play, editing the other stats needs a rehash()
+        token = self.tokens[token_chars]
+        if stat == HP:
+            self.hash ^= zobrist.hp_key(token_chars, token.get(HP)) ^ zobrist.hp_key(token_chars, value)
+        elif stat == SIDE:
+            self.hash ^= zobrist.side_key(token_chars, token.get(SIDE)) ^ zobrist.side_key(token_chars, value)
+        token[stat] = value
+        self.version = next(VERSIONS)
+        if self.listeners:
+            self.touch(self.token_cells(token_chars))
+
+    def mark_acted(self, token_chars):
+        self.hash ^= zobrist.acted_key(token_chars)
+        self.acted.append(token_chars)
+        self.version = next(VERSIONS)
+        if self.listeners:
+            self.touch(self.token_cells(token_chars))
+
+    def set_turn(self, turn):
+        self.hash ^= zobrist.turn_key(self.turn) ^ zobrist.turn_key(turn)
+        self.turn = turn
+        self.version = next(VERSIONS)
+        if self.listeners:
+            # whose turn it is changes how every token is seen
+            self.touch(self.token_cells())
+
+    def touch(self, cells):
+        # tell listeners which hexes changed, a list of (x, y) or None when anything may have
+        for listener in self.listeners:
+            listener(cells)
+
+    def token_cells(self, token_chars=None):
+        # hexes holding token_chars, or every occupied hex by default
+        if token_chars is None:
+            found = numpy.argwhere(self.positions != b'')
+        else:
+            found = numpy.argwhere(self.positions == token_chars)
+        return [(int(x), int(y)) for x, y in found]
+
+    def rehash(self):
+        # recompute the hash from scratch, for after the board was reset, loaded or edited
+        self.hash = zobrist.terrain_key(self.terrain) ^ zobrist.turn_key(self.turn)
+        for x, y in numpy.argwhere(self.positions != b''):
+            self.hash ^= zobrist.cell_key(self.positions[x, y], x, y)
+        for key, token in self.tokens.items():
+            self.hash ^= zobrist.hp_key(key, token.get(HP)) ^ zobrist.side_key(key, token.get(SIDE))
+            self.hash ^= zobrist.stats_key(key, (token.get(TYPE), token.get(MV), token.get(ATK), token.get(RNG)))
+        for key in self.acted:
+            self.hash ^= zobrist.acted_key(key)
+        self.version = next(VERSIONS)
+        self.touch(None)
+
+    def apply_action(self, frm, to):
+        # resolve_action that remembers what it changed, returns a delta for undo_action or None if illegal
+        # everything resolve_action can touch is recorded: both hexes, the target's HP,
+        # tokens a flag capture converts, and the lengths of acted and turn_summary
+        frm_key = self.positions[frm[COL], frm[ROW]]
+        to_key = self.positions[to[COL], to[ROW]]
+        to_token = self.tokens.get(to_key)
+        delta = {'frm': (frm[COL], frm[ROW]), 'to': (to[COL], to[ROW]), 'frm_key': frm_key, 'to_key': to_key,
+                 'hp': None, 'side': None, 'converted': [],
+                 'acted': len(self.acted), 'summary': len(self.turn_summary), 'hash': self.hash}
+        if to_token is not None:
+            delta['hp'] = to_token[HP]
+            if to_token[TYPE] == FLAG:
+                delta['side'] = to_token[SIDE]
+                for key in self.tokens:
+                    if self.tokens[key][SIDE] == to_token[SIDE]:
+                        delta['converted'].append(key)
+        if not self.resolve_action(frm, to):
+            return None
+        return delta
+
+    def apply_finish(self):
+        # finish_turn that can be taken back with undo_action
+        delta = {'turn': self.turn, 'acted': self.acted.copy(), 'victory': self.victory, 'hash': self.hash,
+                 'summary': self.turn_summary.copy()}
+        self.finish_turn()
+        return delta
+
+    def undo_action(self, delta):
+        # put back whatever apply_action or apply_finish changed, undo in reverse order of applying
+        self.hash = delta['hash']
+        self.version = next(VERSIONS)
+        if 'turn' in delta:
+            self.turn = delta['turn']
+            self.acted = delta['acted']
+            self.victory = delta['victory']
+            self.turn_summary = delta['summary']
+            if self.listeners:
+                self.touch(self.token_cells())
+            return
+        frm = delta['frm']
+        to = delta['to']
+        self.positions[frm[COL], frm[ROW]] = delta['frm_key']
+        self.positions[to[COL], to[ROW]] = delta['to_key']
+        to_token = self.tokens.get(delta['to_key'])
+        if to_token is not None:
+            to_token[HP] = delta['hp']
+        for key in delta['converted']:
+            self.tokens[key][SIDE] = delta['side']
+        del self.acted[delta['acted']:]
+        del self.turn_summary[delta['summary']:]
+        if self.listeners:
+            self.touch([frm, to])
+            if delta['converted']:
+                self.touch(self.token_cells())
+
     def get_path(self, frm, to):
         # find and report the path frm->to
-        # it's dijkstra time
+        # A* over the hex neighbor table, every step costs 1 so get_distance / 2 never overestimates
 
         # check for invalid input
         if not self.check_clear(frm):
@@ -335,82 +706,66 @@ class Board:
         if not self.check_clear(to):
             return None
 
-        # we want to evaluate all paths frm->to
-        # create another map, filling in the lowest score we've found to reach each hex in between
-        # add terrain map just to illustrate impassible tiles as 100s
-        costs = numpy.ones([X_MAX, Y_MAX]) * 99
-        costs += self.terrain
-        costs[frm[COL], frm[ROW]] = 0
+        # neighbor table is keyed by tuples, callers sometimes hand us lists
+        frm = (int(frm[COL]), int(frm[ROW]))
+        to = (int(to[COL]), int(to[ROW]))
+        neighbors = self.neighbor_table()
+
+        # queue entries are (steps + estimate, estimate, tie breaker, hex)
+        # the tie breaker keeps the heap from ever comparing hexes and makes results repeatable
+        to_distance = DISTANCE_LOOKUP[to[COL]][to[ROW]]
+        came_from = {frm: None}
+        steps = {frm: 0}
+        queue = [(to_distance[frm[COL]][frm[ROW]] // 2, to_distance[frm[COL]][frm[ROW]] // 2, 0, frm)]
+        pushed = 0
+        while len(queue) > 0:
+            explore = heapq.heappop(queue)[3]
+            if explore == to:
+                # walk back to the start, trimming initial position off of results
+                path = []
+                while explore != frm:
+                    path.append(explore)
+                    explore = came_from[explore]
+                path.reverse()
+                return path
+
+            length = steps[explore] + 1
+            for new_explore in neighbors[explore]:
+                if length < steps.get(new_explore, X_MAX * Y_MAX):
+                    steps[new_explore] = length
+                    came_from[new_explore] = explore
+                    estimate = to_distance[new_explore[COL]][new_explore[ROW]] // 2
+                    pushed += 1
+                    heapq.heappush(queue, (length + estimate, estimate, pushed, new_explore))
 
-        # recursive bit for depth-first traversal
-        # trim initial position off of results
         # result will be None if no path was found
-        path = self.path_step(costs, [frm], to, 0)
-        # don't print costs, we can visualize moves now
-        if path is not None:
-            path.reverse()
-            return path[1:]
-        else:
-            return None
+        return None
 
-    def path_step(self, costs, explore_list, to, old_length):
-        # recursive part of get_path algo
-        for explore in explore_list:
-            # quickly detect exit conditions
-            if explore == to:
-                # found it
-                costs[to[COL], to[ROW]] = old_length
-                return [to]
-            elif explore_list is None:
-                return None
-            elif len(explore_list) == 0:
-                return None
-
-            # set up iteration parameters
-            length = old_length + 1
-            current_dist = get_distance(explore, to)
-            closer_list = []
-            equal_list = []
-            farther_list = []
-
-            # add every hex around the current exploration point to the exploration list
-            # those closer to the destination than the start point are given priority
-            # because we step one hex at a time all steps are either closer by one, equal, or farther by one
-            for i in [-1, +1]:
-                for j in [-1, +1]:
-                    new_explore = (explore[COL] + i, explore[ROW] + j)
-                    if self.check_clear(new_explore):
-                        new_dist = get_distance(new_explore, to)
-                        if costs[new_explore[COL], new_explore[ROW]] > length:
-                            costs[new_explore[COL], new_explore[ROW]] = length
-                            if current_dist > new_dist:
-                                closer_list.append(new_explore)
-                            elif current_dist == new_dist:
-                                equal_list.append(new_explore)
-                            else:
-                                farther_list.append(new_explore)
-            for k in [-2, +2]:
-                new_explore = (explore[COL], explore[ROW] + k)
-                if self.check_clear(new_explore):
-                    new_dist = get_distance(new_explore, to)
-                    if costs[new_explore[COL], new_explore[ROW]] > length:
-                        costs[new_explore[COL], new_explore[ROW]] = length
-                        if current_dist > new_dist:
-                            closer_list.append(new_explore)
-                        elif current_dist == new_dist:
-                            equal_list.append(new_explore)
-                        else:
-                            farther_list.append(new_explore)
-
-            # sets of lists are specific to explore instance so this must be in the outer iteration
-            path = self.path_step(costs, closer_list, to, length)
-            if path is None:
-                path = self.path_step(costs, equal_list, to, length)
-            if path is None:
-                path = self.path_step(costs, farther_list, to, length)
-            if path is not None:
-                path.append(explore)
-                return path
+    def reachable_from(self, frm, max_steps=None):
+        # map of how many steps it takes to reach every hex from frm, -1 where we can't get to
+        # tokens don't block movement, so a map only depends on terrain and frm
+        # maps go in the shared transposition cache, so boards with the same terrain share them
+        frm = (int(frm[COL]), int(frm[ROW]))
+        neighbors = self.neighbor_table()
+        cache_key = ('reach', self.terrain_hash, frm)
+        steps = zobrist.TRANSPOSITIONS.get(cache_key)
+        if steps is None:
+            steps = flood_fill(neighbors, frm)
+            # cached maps are shared between callers
+            steps.flags.writeable = False
+            zobrist.TRANSPOSITIONS.put(cache_key, steps)
+        if max_steps is not None:
+            steps = numpy.where(steps > max_steps, -1, steps)
+        return steps
+
+    def neighbor_table(self):
+        # movement only depends on terrain, so the table is rebuilt only after the terrain has been edited
+        layout = self.terrain.tobytes()
+        if layout != self.layout:
+            self.layout = layout
+            self.neighbors = make_neighbor_table(self.terrain)
+            self.terrain_hash = zobrist.terrain_key(self.terrain)
+        return self.neighbors
 
     def check_1move(self, frm, to):
         # to simplify hexagon movement, we only use every second Y position
@@ -465,6 +820,13 @@ class Board:
             str_key_dict[str_key] = self.tokens[key]
         return json.dumps(str_key_dict)
 
+    def output_state(self):
+        # everything a client draws in one document, tagged with the version it was taken at
+        acted = [key.decode("UTF-8") for key in self.acted]
+        return '{"version": %d, "terrain": %s, "positions": %s, "units": %s, "acted": %s, "turn": %s, "victory": %s}' % (
+            self.version, self.output_terrain(), self.output_positions(), self.output_units(),
+            json.dumps(acted), json.dumps(self.turn), json.dumps(self.victory))
+
     def output_turn_actions(self):
         # serialize which actions were taken in the player turn
         return json.dumps(self.turn_summary)
@@ -475,6 +837,8 @@ def make_coord_num(tpl):
 
 
 def make_coord_tuple(num):
+    if 0 <= num < len(NUM_TUPLES):
+        return NUM_TUPLES[num]
     y = num % 100
     x = num//100
     return tuple([x, y])
@@ -485,9 +849,7 @@ def check_pos(coord):
     bounds = -1 < coord[COL] < X_MAX and -1 < coord[ROW] < Y_MAX
 
     # is coordinate part of hex system?
-    parity = coord[COL] % 2 == coord[ROW] % 2
-
-    return bounds and parity
+    return bounds and VALID_LOOKUP[coord[COL]][coord[ROW]]
 
 
 def get_distance(frm, to):
@@ -496,7 +858,69 @@ def get_distance(frm, to):
     # so for mostly-horizontal distances the distance is twice the travel on the X-axis
     x_dist = abs(to[COL] - frm[COL])
     y_dist = abs(to[ROW] - frm[ROW])
-    return x_dist + max({x_dist, y_dist})
+    return x_dist + max(x_dist, y_dist)
+
+
+# array versions of the helpers above, coordinates come in as arrays shaped (..., 2)
+def make_coord_nums(coords):
+    coords = numpy.asarray(coords)
+    return coords[..., COL] * 100 + coords[..., ROW]
+
+
+def make_coord_tuples(nums):
+    nums = numpy.asarray(nums)
+    return numpy.stack([nums // 100, nums % 100], axis=-1)
+
+
+def check_positions(coords):
+    coords = numpy.asarray(coords)
+    x = coords[..., COL]
+    y = coords[..., ROW]
+    bounds = (x > -1) & (x < X_MAX) & (y > -1) & (y < Y_MAX)
+    return bounds & (x % 2 == y % 2)
+
+
+def get_distances(frm, to):
+    frm = numpy.asarray(frm)
+    to = numpy.asarray(to)
+    x_dist = abs(to[..., COL] - frm[..., COL])
+    y_dist = abs(to[..., ROW] - frm[..., ROW])
+    return x_dist + numpy.maximum(x_dist, y_dist)
+
+
+def make_neighbor_table(terrain):
+    # map every clear hex to the clear hexes one step away
+    # built once per terrain layout so pathfinding never has to re-check bounds or elevation
+    neighbors = {}
+    for x in range(X_MAX):
+        for y in range(Y_MAX):
+            if check_pos((x, y)) and terrain[x, y] == 0:
+                adjacent = []
+                for i, j in HEX_STEPS:
+                    step = (x + i, y + j)
+                    if check_pos(step) and terrain[step[COL], step[ROW]] == 0:
+                        adjacent.append(step)
+                neighbors[(x, y)] = tuple(adjacent)
+    return neighbors
+
+
+def flood_fill(neighbors, frm):
+    # breadth first search out from frm, recording the step count to every hex on the way
+    steps = numpy.full([X_MAX, Y_MAX], -1, dtype=int)
+    if frm not in neighbors:
+        return steps
+    found = {frm: 0}
+    queue = deque([frm])
+    while len(queue) > 0:
+        explore = queue.popleft()
+        length = found[explore] + 1
+        for new_explore in neighbors[explore]:
+            if new_explore not in found:
+                found[new_explore] = length
+                queue.append(new_explore)
+    for (x, y), length in found.items():
+        steps[x, y] = length
+    return steps
 
 
 def next_color(color):
@@ -0,0 +1,150 @@
+import json
+import threading
+from collections import deque
+import numpy
+from server import board
+
+# what changed on a board, pushed to clients watching /board/events instead of them polling /board/state
+# an event carries the board version it brings a client to, and is sent with the id "<instance>-<version>",
+# the same value as the /board/state ETag, so a client resumes from either with Last-Event-ID
+# diffs hold the new values rather than changes to them, so applying one twice does no harm
+EVENT_BACKLOG = 256
+# seconds between keepalive comments on an idle stream
+KEEPALIVE = 15.0
+
+DIFF = 'diff'
+# the log can't bring a client up to date, fetch /board/state and carry on from its version
+RESET = 'reset'
+
+
+class Snapshot:
+    # the parts of a board play changes, taken before an action to work out the diff after it
+    def __init__(self, b):
+        self.version = b.version
+        self.positions = b.positions.copy()
+        self.units = {key: (token.get(board.HP), token.get(board.SIDE)) for key, token in b.tokens.items()}
+        self.summary = len(b.turn_summary)
+        self.acted = list(b.acted)
+        self.turn = b.turn
+        self.victory = b.victory
+
+    def diff(self, b):
+        # {'actions': [[frm, to], ...], 'positions': {xxyy: unit_id or ""}, 'units': {unit_id: {HP, Side}},
+        #  'acted': [...], 'turn': ..., 'victory': ...} with only the keys that changed
+        out = {}
+        # finish_turn empties turn_summary, so a Publisher has to step() before it to send the turn's actions
+        if len(b.turn_summary) > self.summary:
+            out['actions'] = b.turn_summary[self.summary:]
+        positions = {}
+        for x, y in numpy.argwhere(b.positions != self.positions):
+            positions[board.make_coord_num((int(x), int(y)))] = b.positions[x, y].decode('UTF-8')
+        if positions:
+            out['positions'] = positions
+        units = {}
+        for key, token in b.tokens.items():
+            stats = (token.get(board.HP), token.get(board.SIDE))
+            if self.units.get(key) != stats:
+                units[key.decode('UTF-8')] = {board.HP: stats[0], board.SIDE: stats[1]}
+        if units:
+            out['units'] = units
+        if b.acted != self.acted:
+            out['acted'] = [key.decode('UTF-8') for key in b.acted]
+        if b.turn != self.turn:
+            out['turn'] = b.turn
+        if b.victory != self.victory:
+            out['victory'] = b.victory
+        return out
+
+
+class Publisher:
+    # sends play on a board to its event log a step at a time, a diff for each action and one for the end of turn
+    def __init__(self, b, events):
+        self.board = b
+        self.events = events
+        self.before = Snapshot(b)
+        # every diff published, in order
+        self.diffs = []
+
+    def step(self):
+        # publish what changed since the last step as one diff, returns it, None if nothing did
+        b = self.board
+        if b.version == self.before.version:
+            return None
+        diff = self.before.diff(b)
+        self.events.publish(b.version, DIFF, diff)
+        self.diffs.append(diff)
+        self.before = Snapshot(b)
+        return diff
+
+
+def merge(diffs):
+    # one diff with the same effect as applying diffs in order, keeping the actions of every one
+    out = {}
+    for diff in diffs:
+        for key, value in diff.items():
+            if key == 'actions':
+                out.setdefault(key, []).extend(value)
+            elif key in ('positions', 'units'):
+                out.setdefault(key, {}).update(value)
+            else:
+                out[key] = value
+    return out
+
+
+class EventLog:
+    # the last EVENT_BACKLOG events of one game
+    # it covers every change after version start, older clients are sent a reset
+    def __init__(self, start, backlog=EVENT_BACKLOG):
+        self.start = start
+        # (version, kind, data JSON)
+        self.events = deque()
+        self.backlog = backlog
+        self.condition = threading.Condition()
+
+    def publish(self, version, kind, data=None):
+        with self.condition:
+            self.events.append((version, kind, json.dumps(data)))
+            while len(self.events) > self.backlog:
+                self.start = self.events.popleft()[0]
+            self.condition.notify_all()
+
+    def since(self, version):
+        # events after version, None if some of them are no longer in the log
+        # call with self.condition held
+        if version < self.start:
+            return None
+        return [event for event in self.events if event[0] > version]
+
+    def latest(self):
+        if self.events:
+            return self.events[-1][0]
+        return self.start
+
+    def stream(self, instance, last_id=None, keepalive=KEEPALIVE):
+        # text/event-stream lines, forever, starting after last_id
+        # no last_id, or one from another process, starts with a reset
+        # sent straight away so the response starts before the first event, and tells clients to reconnect quickly
+        yield 'retry: 1000\n\n'
+        version = None
+        if last_id is not None:
+            last_instance, _, last_version = last_id.strip('"').rpartition('-')
+            if last_instance == instance and last_version.isdigit():
+                version = int(last_version)
+        while True:
+            with self.condition:
+                events = None
+                if version is not None:
+                    events = self.since(version)
+                if events is None:
+                    version = self.latest()
+                    events = [(version, RESET, 'null')]
+                elif not events:
+                    self.condition.wait(keepalive)
+                    events = self.since(version)
+                    if events is None:
+                        continue
+            if not events:
+                yield ': keepalive\n\n'
+            for event_version, kind, data in events:
+                version = event_version
+                yield f'id: {instance}-{event_version}\nevent: {kind}\ndata: {data}\n\n'
@@ -1,6 +1,8 @@
 import mysql.connector
 import mysql.connector.errors as err
 import os
+import threading
+import time
 
 if 'RDS_HOSTNAME' in os.environ:
     DATABASES = {
@@ -23,179 +25,308 @@ else:
     }
 
 
+# connections are shared by every DBConnection in the process, so concurrent requests don't queue on one socket
+POOL_SIZE = int(os.environ.get('HEXBATTLE_POOL_SIZE', 8))
+# allegedly MySQL closes connections after 5 minutes
+# so a connection that sat idle longer than this is pinged, and reopened if needed, before it's handed out
+IDLE_CHECK = 60.0
+
+# statements that run on every turn or board load are prepared once per connection and reused
+# prepared cursors recognise a statement by identity, so these have to be the same string objects every time
+SAVE_BOARD_SQL = 'INSERT INTO game_config (terrain, positions, units) VALUES (%s, %s, %s)'
+LOAD_BOARD_SQL = 'SELECT TERRAIN, POSITIONS, UNITS FROM game_config WHERE ID = %s'
+POST_TURN_SQL = 'INSERT INTO game_turn (session_id, action, positions, status, turn, keyframe, side) ' \
+                'VALUES (%s, %s, %s, %s, %s, %s, %s)'
+# the turns from the last keyframe at or before a turn, up to that turn
+LOAD_TURNS_SQL = 'SELECT turn, keyframe, side, action, positions, status FROM game_turn ' \
+                 'WHERE session_id = %s AND turn <= %s AND turn >= (' \
+                 'SELECT MAX(turn) FROM game_turn WHERE session_id = %s AND keyframe = 1 AND turn <= %s) ' \
+                 'ORDER BY turn'
+LOAD_ALL_TURNS_SQL = 'SELECT turn, keyframe, side, action, positions, status FROM game_turn ' \
+                     'WHERE session_id = %s AND turn IS NOT NULL ORDER BY turn'
+# larger than any turn number, for replaying to the latest turn
+LAST_TURN = 2 ** 31
+LOAD_MODEL_SQL = 'SELECT model, weights, weights_blob FROM game_model WHERE ID = %s'
+
+
+def open_connection():
+    settings = DATABASES['default']
+    kwargs = {'user': settings.get('USER'), 'password': settings.get('PASSWORD'),
+              'host': settings.get('HOST'), 'database': settings.get('NAME'),
+              # every method is a single statement, and autocommit keeps pooled readers from holding old snapshots
+              'autocommit': True}
+    if settings.get('PORT') is not None:
+        kwargs['port'] = settings.get('PORT')
+    return mysql.connector.connect(**kwargs)
+
+
+class PooledConnection:
+    def __init__(self, cnx):
+        self.cnx = cnx
+        # prepared cursors by statement
+        self.statements = {}
+        self.last_used = time.monotonic()
+
+    def cursor(self, sql, prepared):
+        if not prepared:
+            return self.cnx.cursor()
+        cursor = self.statements.get(sql)
+        if cursor is None:
+            cursor = self.cnx.cursor(prepared=True)
+            self.statements[sql] = cursor
+        return cursor
+
+    def check(self):
+        # only connections that have been idle get a round trip to the server
+        if time.monotonic() - self.last_used > IDLE_CHECK and not self.cnx.is_connected():
+            self.statements = {}
+            self.cnx.reconnect()
+
+    def close(self):
+        try:
+            self.cnx.close()
+        except err.Error:
+            pass
+
+
+class ConnectionPool:
+    # at most size connections, opened as they're needed, a checkout waits when they're all in use
+    def __init__(self, size=POOL_SIZE):
+        self.size = size
+        # last in first out, so a quiet server keeps reusing its freshest connections
+        self.idle = []
+        self.created = 0
+        # notified whenever a connection is checked in or a slot frees up for a new one
+        self.available = threading.Condition()
+
+    def checkout(self):
+        with self.available:
+            while not self.idle and self.created >= self.size:
+                self.available.wait()
+            if self.idle:
+                connection = self.idle.pop()
+            else:
+                connection = None
+                self.created += 1
+        if connection is None:
+            try:
+                return PooledConnection(open_connection())
+            except err.Error:
+                self.release_slot()
+                raise
+        try:
+            connection.check()
+        except err.Error:
+            self.discard(connection)
+            raise
+        return connection
+
+    def checkin(self, connection):
+        connection.last_used = time.monotonic()
+        with self.available:
+            self.idle.append(connection)
+            self.available.notify()
+
+    def discard(self, connection):
+        connection.close()
+        self.release_slot()
+
+    def release_slot(self):
+        # a connection is gone for good, so a waiting checkout can open a new one
+        with self.available:
+            self.created -= 1
+            self.available.notify()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+# set by turnjournal.start, post_turn hands turns to it instead of waiting on an insert
+turn_journal = None
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+        return _pool
+
+
 class DBConnection:
-    # maintain a database connection, and re-open it whenever it times out
+    # run statements on connections from the shared pool
     # maintain a game session ID when playing, so we can post turns to the database
-    def __init__(self):
-        self._cnx = None
+    def __init__(self, enable=True):
+        # enable=False gives a connection that never touches MySQL, for simulations and clones
         self._session_id = None
-        self.enable = True
+        self.enable = enable
 
-    def _connect(self):
+    def _execute(self, sql, binds=None, fetch=None, prepared=False):
+        # one statement on a pooled connection, fetch is None, 'one' or 'all'
+        # returns (rows, lastrowid), or (None, None) if we can't reach the database
+        # connect failure disables database functionality
+        # game will revert to default board, no session, no turn saving
+        pool = get_pool()
         try:
-            if self._cnx is None or self._cnx.is_connected() is not True:
-                user = DATABASES['default'].get('USER')
-                password = DATABASES['default'].get('PASSWORD')
-                host = DATABASES['default'].get('HOST')
-                port = DATABASES['default'].get('PORT')
-                name = DATABASES['default'].get('NAME')
-                if port is not None:
-                    self._cnx = mysql.connector.connect(
-                        user=user, password=password, host=host, port=port, database=name)
-                else:
-                    self._cnx = mysql.connector.connect(
-                        user=user, password=password, host=host, database=name)
-                self.enable = True
-        except err.DatabaseError:
-            self._cnx = None
+            connection = pool.checkout()
+        except err.Error:
             self.enable = False
-        return self._cnx
+            return None, None
+        self.enable = True
+        try:
+            cursor = connection.cursor(sql, prepared)
+            cursor.execute(sql, binds)
+            rows = None
+            if fetch is not None or cursor.with_rows:
+                # prepared cursors are reused, so always read everything
+                rows = cursor.fetchall()
+            if fetch == 'one':
+                rows = rows[0] if rows else None
+            lastrowid = cursor.lastrowid
+            if not prepared:
+                cursor.close()
+        except (err.InterfaceError, err.OperationalError):
+            # the connection is in an unknown state, so don't give it to anyone else
+            pool.discard(connection)
+            raise
+        except err.Error:
+            pool.checkin(connection)
+            raise
+        pool.checkin(connection)
+        return rows, lastrowid
 
     def save_board(self, terrain_json, positions_json, units_json):
-        # allegedly MySQL closes connections after 5 minutes
-        # edit sessions might take longer than that, so we need to surround operations with open/close
-        cnx = self._connect()
-        cursor = cnx.cursor()
-        sql = 'INSERT INTO game_config (terrain, positions, units) VALUES (%s, %s, %s)'
         binds = (terrain_json, positions_json, units_json)
-        cursor.execute(sql, binds)
-        board_id = cursor.lastrowid
-        cursor.close()
-        cnx.commit()
+        rows, board_id = self._execute(SAVE_BOARD_SQL, binds, prepared=True)
         return board_id
 
     def list_boards(self):
-        cnx = self._connect()
-        cursor = cnx.cursor()
         sql = 'SELECT ID FROM game_config'
-        cursor.execute(sql)
-        rows = cursor.fetchall()
-        cursor.close()
+        rows, lastrowid = self._execute(sql, fetch='all')
         return rows
 
     def load_board(self, config_id):
-        cnx = self._connect()
-        # connect failure disables database functionality
-        # game will revert to default board, no session, no turn saving
-        if self.enable:
-            cursor = cnx.cursor()
-            sql = 'SELECT TERRAIN, POSITIONS, UNITS FROM game_config WHERE ID = %s'
-            binds = (config_id,)
-            cursor.execute(sql, binds)
-    
-            # there can be only one
-            row = cursor.fetchone()
-            cursor.close()
-            if row is not None:
-                return row
-        return None
+        # there can be only one
+        binds = (config_id,)
+        row, lastrowid = self._execute(LOAD_BOARD_SQL, binds, fetch='one', prepared=True)
+        return row
 
     def delete_board(self, config_id):
-        cnx = self._connect()
-        cursor = cnx.cursor()
         sql = 'DELETE FROM game_config WHERE ID=%s'
         binds = (config_id,)
-        cursor.execute(sql, binds)
-        cursor.close()
-        cnx.commit()
+        self._execute(sql, binds)
 
     def create_session(self, config_id, player_id):
         # config is a number matching game_config.ID
         # player is some kind of string unique to the player
-        cnx = self._connect()
-        cursor = cnx.cursor()
         sql = 'INSERT INTO game_session (config_id, player_id, status) VALUES (%s, %s, %s)'
         binds = (config_id, player_id, 'OPEN')
-        cursor.execute(sql, binds)
-        self._session_id = cursor.lastrowid
-        cursor.close()
-        cnx.commit()
+        rows, self._session_id = self._execute(sql, binds)
         return self._session_id
 
     def list_sessions(self, player_id=None):
-        cnx = self._connect()
-        cursor = cnx.cursor()
         if player_id is None:
             sql = "SELECT ID, player_id FROM game_session WHERE status = 'OPEN'"
-            cursor.execute(sql)
+            rows, lastrowid = self._execute(sql, fetch='all')
         else:
             sql = "SELECT ID FROM game_session WHERE status = 'OPEN' AND player_id = %s"
             binds = (player_id,)
-            cursor.execute(sql, binds)
-        rows = cursor.fetchall()
-        cursor.close()
+            rows, lastrowid = self._execute(sql, binds, fetch='all')
         return rows
 
     def join_session(self, session_id):
         # choosing not to bake too much logic into this one function: if it doesn't join a session it returns None
-        cnx = self._connect()
-        cursor = cnx.cursor()
-        sql = "SELECT config_id FROM game_session WHERE STATUS = 'OPEN' AND ID = %s"
+        sql = "SELECT ID, config_id FROM game_session WHERE STATUS = 'OPEN' AND ID = %s"
         binds = (session_id,)
-        cursor.execute(sql, binds)
-        row = cursor.fetchone()
+        row, lastrowid = self._execute(sql, binds, fetch='one')
         config = None
         self._session_id = None
         if row is not None:
             self._session_id = row[0]
             config = row[1]
-        cursor.close()
         return config
 
+    def session_config(self, session_id):
+        # configuration a session started from, open or closed
+        sql = "SELECT config_id FROM game_session WHERE ID = %s"
+        binds = (session_id,)
+        row, lastrowid = self._execute(sql, binds, fetch='one')
+        if row is None:
+            return None
+        return row[0]
+
+    def load_turns(self, session_id, turn=None, from_start=False):
+        # rows to rebuild a session up to turn (the latest by default), starting at the nearest keyframe
+        # from_start gives every turn of the session instead
+        if from_start:
+            binds = (session_id,)
+            rows, lastrowid = self._execute(LOAD_ALL_TURNS_SQL, binds, fetch='all')
+        else:
+            if turn is None:
+                turn = LAST_TURN
+            binds = (session_id, turn, session_id, turn)
+            rows, lastrowid = self._execute(LOAD_TURNS_SQL, binds, fetch='all', prepared=True)
+        if rows is None:
+            return []
+        return rows
+
     def close_session(self):
-        cnx = self._connect()
-        cursor = cnx.cursor()
         sql = "UPDATE game_session SET status = 'CLOSED' WHERE ID = %s"
         binds = (self._session_id,)
-        cursor.execute(sql, binds)
-        cursor.close()
-        cnx.commit()
+        self._execute(sql, binds)
         self._session_id = None
 
-    def post_turn(self, actions, positions, status):
-        # store the moves and final board state for every turn, so we can immediately pick up a session
+    def post_turn(self, actions, positions, status, turn=None, keyframe=True, side=None):
+        # store the moves and board state for every turn, so we can immediately pick up a session
         # or train the AI on before/after pairs without constructing entire games
-        cnx = self._connect()
-        cursor = cnx.cursor()
-        sql = 'INSERT INTO game_turn (session_id, action, positions, status) VALUES (%s, %s, %s, %s)'
-        binds = (self._session_id, actions, positions, status)
-        cursor.execute(sql, binds)
-        turn_id = cursor.lastrowid
-        cursor.close()
-        cnx.commit()
+        # keyframe rows hold the whole board, others only what changed since the turn before
+        # with a turn journal running the row is written later, so there is no turn ID to return
+        if turn_journal is not None:
+            turn_journal.append(self._session_id, actions, positions, status, turn, keyframe, side)
+            return None
+        binds = (self._session_id, actions, positions, status, turn, int(keyframe), side)
+        rows, turn_id = self._execute(POST_TURN_SQL, binds, prepared=True)
         return turn_id
 
-    def save_model(self, model_json, weights_json, model_id=None):
-        cnx = self._connect()
-        cursor = cnx.cursor()
+    def post_turns(self, turns):
+        # many (session_id, actions, positions, status, turn, keyframe, side) rows in one insert
+        # returns the number of rows, None if the database couldn't be reached
+        sql = 'INSERT INTO game_turn (session_id, action, positions, status, turn, keyframe, side) VALUES ' + \
+              ', '.join(['(%s, %s, %s, %s, %s, %s, %s)'] * len(turns))
+        binds = [value for turn in turns for value in turn]
+        rows, lastrowid = self._execute(sql, binds)
+        if lastrowid is None:
+            return None
+        return len(turns)
+
+    def save_model(self, model_json, weights_blob, model_id=None):
         if model_id:
-            sql = 'UPDATE game_model SET model = %s, weights = %s WHERE ID = %s'
-            binds = (model_json, weights_json, model_id)
+            sql = 'UPDATE game_model SET model = %s, weights = NULL, weights_blob = %s, version = version + 1 ' \
+                  'WHERE ID = %s'
+            binds = (model_json, weights_blob, model_id)
+            self._execute(sql, binds)
         else:
-            sql = 'INSERT INTO game_model (model, weights) values (%s, %s)'
-            binds = (model_json, weights_json)
-        cursor.execute(sql, binds)
-        model_id = cursor.lastrowid
-        cursor.close()
-        cnx.commit()
+            sql = 'INSERT INTO game_model (model, weights_blob) values (%s, %s)'
+            binds = (model_json, weights_blob)
+            rows, model_id = self._execute(sql, binds)
         return model_id
 
+    def save_weights(self, model_id, weights_blob):
+        # replaces JSON weights with the binary form
+        sql = 'UPDATE game_model SET weights = NULL, weights_blob = %s WHERE ID = %s'
+        binds = (weights_blob, model_id)
+        self._execute(sql, binds)
+
     def list_models(self):
-        cnx = self._connect()
-        cursor = cnx.cursor()
         sql = "SELECT ID FROM game_model"
-        binds = None
-        cursor.execute(sql, binds)
-        rows = cursor.fetchall()
-        cursor.close()
+        rows, lastrowid = self._execute(sql, fetch='all')
+        return rows
+
+    def list_model_versions(self):
+        sql = "SELECT ID, version FROM game_model"
+        rows, lastrowid = self._execute(sql, fetch='all')
         return rows
 
     def load_model(self, model_id):
-        cnx = self._connect()
-        cursor = cnx.cursor()
-        sql = "SELECT model, weights FROM game_model WHERE ID = %s"
         binds = (model_id,)
-        cursor.execute(sql, binds)
-        row = cursor.fetchone()
-        cursor.close()
+        row, lastrowid = self._execute(LOAD_MODEL_SQL, binds, fetch='one', prepared=True)
         return row
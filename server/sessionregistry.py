@@ -0,0 +1,158 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from server import boardevents, turnjournal
+
+# live games for the flask app, keyed by session id, so one process hosts many games instead of one shared board
+# every turn is in the turn journal by the time it ends, and reaches game_turn behind play,
+# so an idle game can be dropped from memory and rebuilt with join_session the next time a request names it,
+# after waiting for the journal to post that session's turns, a game it can't catch up on is refused for now
+# only actions taken in a turn that hasn't ended yet are lost when a game is evicted
+# without a database there is nothing to rebuild from, so only the None session exists
+# the None session is the board clients use before they create or join a session, it is never evicted
+MAX_SESSIONS = int(os.environ.get('HEXBATTLE_MAX_SESSIONS', 256))
+IDLE_TIMEOUT = 30 * 60
+
+
+class UnknownSession(KeyError):
+    # no open session with that id
+    pass
+
+
+class SessionUnavailable(Exception):
+    # the session's latest turns are still in the turn journal, it can't be rebuilt until they're posted
+    pass
+
+
+class GameSession:
+    def __init__(self, session_id, b):
+        self.session_id = session_id
+        self.board = b
+        # the AI player for this game, made the first time it's asked for
+        self.player = None
+        # (board version, body) of the last /board/state, so polling an unchanged game serializes nothing
+        self.state = None
+        # changes to the board for /board/events watchers
+        self.events = boardevents.EventLog(b.version)
+        # one request at a time per game, games never wait on each other
+        self.lock = threading.RLock()
+        # requests holding this game, it can't be evicted while there are any
+        self.users = 0
+        self.last_used = time.monotonic()
+
+
+class SessionRegistry:
+    # make_board() gives a new Board, make_player() a new LearningPlayer
+    def __init__(self, make_board, make_player=None, capacity=MAX_SESSIONS, idle_timeout=IDLE_TIMEOUT):
+        self.make_board = make_board
+        self.make_player = make_player
+        self.capacity = capacity
+        self.idle_timeout = idle_timeout
+        # session id: GameSession, least recently used first
+        self.sessions = OrderedDict()
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def session(self, session_id=None):
+        # with registry.session(session_id) as game: the game is locked to this thread until the block ends
+        with self.hold(session_id) as game:
+            with game.lock:
+                yield game
+
+    @contextmanager
+    def hold(self, session_id=None):
+        # keeps the game in memory without locking it, for work that takes game.lock a step at a time
+        game = self.checkout(session_id)
+        try:
+            yield game
+        finally:
+            self.checkin(game)
+
+    def checkout(self, session_id):
+        with self.lock:
+            game = self.sessions.get(session_id)
+            if game is not None:
+                self.sessions.move_to_end(session_id)
+                game.users += 1
+                return game
+        # rebuilding from the database is slow, so other games carry on while it happens
+        loaded = self.load(session_id)
+        with self.lock:
+            # two requests can load the same game at once, the first one registered wins
+            game = self.sessions.get(session_id)
+            if game is None:
+                game = loaded
+                self.sessions[session_id] = game
+            self.sessions.move_to_end(session_id)
+            game.users += 1
+            evicted = self.evict()
+        if game is not loaded:
+            evicted.append(loaded)
+        for old in evicted:
+            self.release(old)
+        return game
+
+    def checkin(self, game):
+        with self.lock:
+            game.users -= 1
+            game.last_used = time.monotonic()
+            evicted = self.evict()
+        for old in evicted:
+            self.release(old)
+
+    def load(self, session_id):
+        b = self.make_board()
+        if session_id is not None:
+            if turnjournal.journal is not None and not turnjournal.journal.flush_session(session_id):
+                # replaying without those turns would post turn numbers that clash with them
+                raise SessionUnavailable(session_id)
+            if b.join_session(session_id) is None:
+                raise UnknownSession(session_id)
+        return GameSession(session_id, b)
+
+    def add(self, session_id, b):
+        # register the board a session was just created on
+        game = GameSession(session_id, b)
+        with self.lock:
+            old = self.sessions.pop(session_id, None)
+            self.sessions[session_id] = game
+            evicted = self.evict()
+        if old is not None:
+            evicted.append(old)
+        for old in evicted:
+            self.release(old)
+        return game
+
+    def player(self, game):
+        # call with the game locked
+        if game.player is None:
+            game.player = self.make_player()
+        return game.player
+
+    def evict(self):
+        # call with self.lock held, returns the games dropped so they can be released after it
+        # least recently used games go first, past capacity or once they've been idle too long
+        now = time.monotonic()
+        evicted = []
+        for session_id, game in list(self.sessions.items()):
+            over = len(self.sessions) > self.capacity
+            if not over and now - game.last_used < self.idle_timeout:
+                break
+            if session_id is None or game.users > 0:
+                continue
+            del self.sessions[session_id]
+            evicted.append(game)
+        return evicted
+
+    def release(self, game):
+        # let go of what the game's player holds on to
+        if game.player is not None:
+            game.player.reset(game.board, None)
+            if game.player.encoder is not None:
+                game.player.encoder.detach()
+                game.player.encoder = None
+
+    def __len__(self):
+        return len(self.sessions)
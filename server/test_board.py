@@ -1,6 +1,10 @@
 import board
+from server import tokentable, turnjournal, weightblob
 import json
 import numpy
+import os
+import shutil
+import tempfile
 
 b = board.Board()
 for i in range(board.X_MAX):
@@ -105,6 +109,149 @@ print(f'Check red soldier {b.tokens.get(b"R1")}')
 b.finish_turn()
 print(f'Check victory {b.victory}')
 
+print('Token table test: True')
+table = tokentable.from_board(b)
+print(f'Units match {table.output_units() == b.output_units()}')
+print(f'Positions match {table.output_positions() == b.output_positions()}')
+print(f'Totals match {table.color_totals() == b.color_totals()}')
+
+print('Clone and undo test: True')
+c = b.clone()
+c.reset()
+before = c.output_units()
+delta = c.apply_action((2, 4), (4, 4))
+print(f'Clone applies its own action {delta is not None and c.output_units() != b.output_units()}')
+c.undo_action(delta)
+print(f'Undo restores units {c.output_units() == before}')
+print(f'Clone is offline {c.database.enable is False}')
+
+print('Hash test: True')
+c.reset()
+d = c.clone()
+c.resolve_action((3, 5), (3, 7))
+c.resolve_action((3, 3), (4, 4))
+d.resolve_action((3, 3), (4, 4))
+d.resolve_action((3, 5), (3, 7))
+print(f'Move order does not matter {c.hash == d.hash}')
+incremental = c.hash
+c.rehash()
+print(f'Incremental hash matches rehash {incremental == c.hash}')
+d = c.clone()
+d.tokens[b'RT1'][board.ATK] += 1
+d.rehash()
+print(f'Token stats change the hash {d.hash != c.hash}')
+
+print('Weight blob test: True')
+weights = [numpy.arange(6, dtype=numpy.float64).reshape(2, 3), numpy.ones(5, dtype=numpy.float32), numpy.zeros((3, 1, 2))]
+blob = weightblob.pack(weights)
+unpacked = weightblob.unpack(blob)
+start = numpy.frombuffer(blob, dtype=numpy.uint8).ctypes.data
+print(f'Shapes round trip {[w.shape for w in unpacked] == [w.shape for w in weights]}')
+print(f'Values round trip {all(numpy.array_equal(u, w) for u, w in zip(unpacked, weights))}')
+print(f'Values are float32 {all(w.dtype == weightblob.DTYPE for w in unpacked)}')
+print(f'Values are 8 byte aligned {all((w.ctypes.data - start) % weightblob.ALIGN == 0 for w in unpacked)}')
+
+
+class MemoryDatabase:
+    # stands in for MySQL with just what a board needs to post turns and replay them
+    enable = True
+
+    def __init__(self):
+        self.configs = {}
+        self.turns = []
+
+    def save_board(self, terrain_json, positions_json, units_json):
+        self.configs[len(self.configs) + 1] = (terrain_json, positions_json, units_json)
+        return len(self.configs)
+
+    def load_board(self, config_id):
+        return self.configs.get(config_id)
+
+    def session_config(self, session_id):
+        return 1
+
+    def post_turn(self, actions, positions, status, turn=None, keyframe=True, side=None):
+        self.turns.append((turn, int(keyframe), side, actions, positions, status))
+
+    def load_turns(self, session_id, turn=None, from_start=False):
+        # the same rows as LOAD_TURNS_SQL, from the nearest keyframe up to turn
+        rows = [row for row in self.turns if turn is None or row[0] <= turn]
+        if not from_start:
+            start = max(row[0] for row in rows if row[1])
+            rows = [row for row in rows if row[0] >= start]
+        return rows
+
+    def close_session(self):
+        pass
+
+
+print('Replay test: True')
+database = MemoryDatabase()
+r = board.Board(offline=True)
+r.database = database
+r.reset()
+r.save_config()
+r.start_turns(None)
+rng = numpy.random.default_rng(0)
+states = []
+while r.victory is None and len(states) < 60:
+    for x, y in numpy.argwhere(r.positions != b''):
+        frm = (int(x), int(y))
+        token = r.tokens.get(r.positions[x, y])
+        if token is not None and token[board.SIDE] == r.turn:
+            actions = r.list_actions(frm)
+            if len(actions) > 0:
+                r.resolve_action(frm, actions[rng.integers(len(actions))])
+    r.finish_turn()
+    if r.victory is None:
+        states.append((r.output_positions(), r.output_units(), r.turn))
+keyframes = sum(row[1] for row in database.turns)
+print(f'Posted {len(states)} turns, keyframes and deltas {0 < keyframes < len(database.turns)}')
+replayed = board.Board(offline=True)
+replayed.database = database
+matches = 0
+for turn, (positions, units, side) in enumerate(states):
+    if replayed.replay(1, turn) == turn and replayed.output_positions() == positions and \
+            replayed.output_units() == units and replayed.turn == side:
+        matches += 1
+print(f'Every turn replays {matches == len(states)}')
+print(f'Replay carries on from the next turn {replayed.turn_number == len(states)}')
+
+print('Journal test: True')
+folder = tempfile.mkdtemp()
+path = os.path.join(folder, 'turns.journal')
+lines = [json.dumps({'session': 1, 'action': '[]', 'positions': '{}', 'status': '{}', 'turn': i, 'keyframe': 1,
+                     'side': board.RED}).encode('UTF-8') + b'\n' for i in range(5)]
+with open(path, 'wb') as f:
+    f.writelines(lines)
+    # a crash halfway through writing the next record
+    f.write(b'{"session": 1, "act')
+with open(path + '.offset', 'w') as f:
+    f.write(str(len(lines[0]) + len(lines[1])))
+
+
+class MemoryTurns:
+    # post_turns without MySQL, turn 3 is a row the database won't take
+    def __init__(self):
+        self.rows = []
+
+    def post_turns(self, rows):
+        if any(row[4] == 3 for row in rows):
+            raise turnjournal.err.IntegrityError('rejected')
+        self.rows.extend(rows)
+        return len(rows)
+
+
+journal = turnjournal.TurnJournal(path, flush_interval=60)
+journal.database = MemoryTurns()
+print(f'Half written record is truncated {os.path.getsize(path) == sum(len(line) for line in lines)}')
+print(f'Flush {journal.flush()}')
+print(f'Checkpoint is honoured {[row[4] for row in journal.database.rows] == [2, 4]}')
+print(f'Rejected turn is set aside {open(journal.rejected_path, "rb").read() == lines[3]}')
+print(f'Journal starts over once caught up {os.path.getsize(path) == 0 and journal.offset == 0}')
+journal.close()
+shutil.rmtree(folder)
+
 # exercise database stuff
 config_id = b.save_config()
 print(f'Saved board as config {config_id}')
@@ -23,10 +23,12 @@ def post(path, data):
 get('/board/reset')
 get('/board/dimensions')
 get('/board/terrain')
+get('/board/state')
 get('/tokens/status')
 get('/player/victory')
 
 post('/token/actions', {"hex": 202})
 post('/tokens/positions', {202: 402})
+post('/tokens/batch', {"actions": [[305, 406], [303, 404]], "end_turn": False})
 get('/tokens/acted')
 post('/player/turn', {"side": "Red"})
@@ -0,0 +1,157 @@
+import json
+import numpy
+from server import board
+
+# integer codes for the type and side columns, a code is the index into these lists
+TYPES = [board.SOLDIER, board.TANK, board.FLAG]
+SIDES = board.TURNS
+EMPTY = -1
+
+# stat block order used by the board templates, tokens loaded from JSON remember their own order
+STATS = (board.TYPE, board.HP, board.MV, board.ATK, board.RNG, board.SIDE)
+NUMBER_STATS = {board.HP: 'hp', board.MV: 'mp', board.ATK: 'attack', board.RNG: 'range'}
+
+
+class TokenTable:
+    # struct-of-arrays copy of Board.tokens, Board.positions and Board.acted
+    # token ids index every column, and grid holds the id standing on each hex (EMPTY for none)
+    # names and stat_keys are only needed to turn the table back into the dict-of-dicts format
+    def __init__(self, count=0):
+        self.names = []
+        self.ids = {}
+        self.stat_keys = []
+        self.type = numpy.full(count, EMPTY, dtype=numpy.int8)
+        self.side = numpy.full(count, EMPTY, dtype=numpy.int8)
+        self.hp = numpy.zeros(count, dtype=numpy.int16)
+        self.mp = numpy.zeros(count, dtype=numpy.int16)
+        self.attack = numpy.zeros(count, dtype=numpy.int16)
+        self.range = numpy.zeros(count, dtype=numpy.int16)
+        self.x = numpy.full(count, EMPTY, dtype=numpy.int8)
+        self.y = numpy.full(count, EMPTY, dtype=numpy.int8)
+        # 0 for tokens that haven't acted, otherwise the order they acted in this turn
+        self.acted = numpy.zeros(count, dtype=numpy.int16)
+        self.grid = numpy.full([board.X_MAX, board.Y_MAX], EMPTY, dtype=numpy.int16)
+
+    def copy(self):
+        # columns are copied, the name lists are never modified after from_board so they are shared
+        other = TokenTable.__new__(TokenTable)
+        other.names = self.names
+        other.ids = self.ids
+        other.stat_keys = self.stat_keys
+        other.type = self.type.copy()
+        other.side = self.side.copy()
+        other.hp = self.hp.copy()
+        other.mp = self.mp.copy()
+        other.attack = self.attack.copy()
+        other.range = self.range.copy()
+        other.x = self.x.copy()
+        other.y = self.y.copy()
+        other.acted = self.acted.copy()
+        other.grid = self.grid.copy()
+        return other
+
+    def color_totals(self):
+        # same answer as Board.color_totals without walking a dict
+        hp = numpy.bincount(self.side[self.side != EMPTY], self.hp[self.side != EMPTY], len(SIDES))
+        totals = {}
+        for code, color in enumerate(SIDES):
+            totals[color] = int(hp[code])
+        return totals
+
+    def convert_side(self, captured, captor):
+        # flag capture hands every token of the captured side over to the captor, codes not colors
+        self.side[self.side == captured] = captor
+
+    def side_grid(self):
+        # side code of the token on every hex, EMPTY where there is no token with stats
+        sides = numpy.full([board.X_MAX, board.Y_MAX], EMPTY, dtype=numpy.int8)
+        occupied = self.grid != EMPTY
+        sides[occupied] = self.side[self.grid[occupied]]
+        return sides
+
+    def type_grid(self):
+        types = numpy.full([board.X_MAX, board.Y_MAX], EMPTY, dtype=numpy.int8)
+        occupied = self.grid != EMPTY
+        types[occupied] = self.type[self.grid[occupied]]
+        return types
+
+    # compatibility views in the formats Board uses
+    def to_tokens(self):
+        tokens = {}
+        for token_id, name in enumerate(self.names):
+            keys = self.stat_keys[token_id]
+            if keys is not None:
+                stats = {}
+                for key in keys:
+                    stats[key] = self.stat_value(token_id, key)
+                tokens[name] = stats
+        return tokens
+
+    def stat_value(self, token_id, key):
+        if key == board.TYPE:
+            return TYPES[self.type[token_id]]
+        if key == board.SIDE:
+            return SIDES[self.side[token_id]]
+        return int(getattr(self, NUMBER_STATS[key])[token_id])
+
+    def to_positions(self):
+        positions = numpy.full([board.X_MAX, board.Y_MAX], '', dtype='S3')
+        for x, y in numpy.argwhere(self.grid != EMPTY):
+            positions[x, y] = self.names[self.grid[x, y]]
+        return positions
+
+    def to_acted(self):
+        order = numpy.argsort(self.acted, kind='stable')
+        return [self.names[token_id] for token_id in order if self.acted[token_id] > 0]
+
+    def apply_to(self, b):
+        # write the table back onto a Board, e.g. after a simulation has played out
+        b.tokens = self.to_tokens()
+        b.positions = self.to_positions()
+        b.acted = self.to_acted()
+
+    # serialization for REST calls, identical to the Board.output_* methods
+    def output_positions(self):
+        pos = {}
+        for x, y in numpy.argwhere(self.grid != EMPTY):
+            pos[board.make_coord_num((int(x), int(y)))] = self.names[self.grid[x, y]].decode('UTF-8')
+        return json.dumps(pos)
+
+    def output_units(self):
+        str_key_dict = {}
+        for key, stats in self.to_tokens().items():
+            str_key_dict[key.decode('UTF-8')] = stats
+        return json.dumps(str_key_dict)
+
+
+def from_board(b):
+    # position ids without a stat block (the editor allows it) get a row with no stats
+    # the rules treat those hexes as empty, just like tokens.get() returning None does on the Board
+    names = list(b.tokens.keys())
+    for token_chars in b.positions[b.positions != b'']:
+        if token_chars not in b.tokens and token_chars not in names:
+            names.append(bytes(token_chars))
+
+    table = TokenTable(len(names))
+    table.names = names
+    for token_id, name in enumerate(names):
+        table.ids[name] = token_id
+        stats = b.tokens.get(name)
+        if stats is None:
+            table.stat_keys.append(None)
+            continue
+        table.stat_keys.append(tuple(key for key in stats if key in STATS))
+        table.type[token_id] = TYPES.index(stats[board.TYPE])
+        table.side[token_id] = SIDES.index(stats[board.SIDE])
+        for key, column in NUMBER_STATS.items():
+            getattr(table, column)[token_id] = stats.get(key, 0)
+
+    for x, y in numpy.argwhere(b.positions != b''):
+        token_id = table.ids[b.positions[x, y]]
+        table.grid[x, y] = token_id
+        table.x[token_id] = x
+        table.y[token_id] = y
+
+    for order, token_chars in enumerate(b.acted):
+        table.acted[table.ids[token_chars]] = order + 1
+    return table
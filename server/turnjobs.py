@@ -0,0 +1,92 @@
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# AI turns run on a pool of worker threads, so the request that starts one returns straight away with a job id
+# clients poll the job, or wait on it for a while, until the turn is done
+# finished jobs are kept for JOB_TTL seconds so a slow poller still gets the result
+JOB_WORKERS = int(os.environ.get('HEXBATTLE_JOB_WORKERS', 4))
+JOB_TTL = 600
+# longest a poll waits on a running job, in seconds
+MAX_WAIT = 30.0
+
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class TurnJob:
+    def __init__(self, job_id, session_id):
+        self.job_id = job_id
+        self.session_id = session_id
+        self.status = RUNNING
+        self.result = None
+        self.error = None
+        self.finished = None
+        self.done = threading.Event()
+
+    def output(self):
+        out = {'job': self.job_id, 'session': self.session_id, 'status': self.status, 'result': self.result}
+        if self.error is not None:
+            out['error'] = self.error
+        return out
+
+
+class TurnJobs:
+    def __init__(self, workers=JOB_WORKERS, ttl=JOB_TTL):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='turnjob')
+        self.ttl = ttl
+        self.ids = itertools.count(1)
+        # job id: TurnJob
+        self.jobs = {}
+        # session id: the job running for it, so one game never has two AI turns going at once
+        self.running = {}
+        self.lock = threading.Lock()
+
+    def submit(self, session_id, fn, *args):
+        # run fn(*args) for a session, or hand back the job already running for it
+        with self.lock:
+            self.prune()
+            job = self.running.get(session_id)
+            if job is not None:
+                return job
+            job = TurnJob(next(self.ids), session_id)
+            self.jobs[job.job_id] = job
+            self.running[session_id] = job
+        self.executor.submit(self.run, job, fn, args)
+        return job
+
+    def run(self, job, fn, args):
+        try:
+            job.result = fn(*args)
+            job.status = DONE
+        except Exception as e:
+            print(f'Turn job {job.job_id} failed: {e}')
+            job.error = str(e)
+            job.status = FAILED
+        with self.lock:
+            job.finished = time.monotonic()
+            if self.running.get(job.session_id) is job:
+                del self.running[job.session_id]
+        job.done.set()
+
+    def get(self, job_id, wait=0.0):
+        # the job, after waiting up to wait seconds for it to finish, None for an unknown or expired job
+        with self.lock:
+            job = self.jobs.get(job_id)
+        if job is not None and wait > 0:
+            job.done.wait(min(wait, MAX_WAIT))
+        return job
+
+    def prune(self):
+        # call with self.lock held
+        now = time.monotonic()
+        expired = [job_id for job_id, job in self.jobs.items()
+                   if job.finished is not None and now - job.finished > self.ttl]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,221 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import mysql.connector.errors as err
+from server import dbconnect
+
+# write-behind log for game_turn rows, so ending a turn never waits on MySQL
+# turns are appended to a local file right away, and a background thread copies them to the database
+# in multi-row inserts, the file is the queue, so memory stays at one batch however far the database falls behind
+# a second file records how far into the journal the database has caught up, so a restart carries on from there
+# a crash between an insert and its checkpoint can post that batch twice on recovery
+# only a database that can't be reached is waited for, records it rejects, or that don't parse,
+# are moved to a dead letter file beside the journal so they never hold up the turns behind them
+BATCH_SIZE = 100
+FLUSH_INTERVAL = 0.5
+RETRY_INTERVAL = 5.0
+# longest flush_session waits for the database to catch up with a session, in seconds
+SESSION_WAIT = 10.0
+# relative paths are from the server's working directory
+JOURNAL_PATH = os.environ.get('HEXBATTLE_JOURNAL', 'turns.journal')
+# the connection went wrong rather than the rows, so the batch is tried again later
+RETRY_ERRORS = (err.InterfaceError, err.OperationalError)
+
+log = logging.getLogger(__name__)
+
+
+class TurnJournal:
+    def __init__(self, path=JOURNAL_PATH, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.checkpoint_path = path + '.offset'
+        self.rejected_path = path + '.rejected'
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.database = dbconnect.DBConnection()
+        self.lock = threading.Lock()
+        # notified every time the checkpoint moves
+        self.caught_up = threading.Condition(self.lock)
+        self.wake = threading.Event()
+        self.stopping = False
+        # records behind the checkpoint, in the database or the dead letter file
+        self.posted = 0
+        # records journaled so far, counting any left over from the last process, posted catches up to it
+        # session id: the appended count at that session's latest record, for flush_session
+        self.appended = 0
+        self.latest = {}
+
+        self.offset = 0
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as f:
+                self.offset = int(f.read() or 0)
+        self.recover()
+        with open(self.path, 'ab+') as f:
+            f.seek(self.offset)
+            self.appended = f.read().count(b'\n')
+        self.writer = open(self.path, 'ab')
+        self.reader = open(self.path, 'rb')
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def recover(self):
+        # a crash can leave half a record at the end of the file, which would corrupt the next append
+        if not os.path.exists(self.path):
+            self.offset = 0
+            return
+        with open(self.path, 'rb+') as f:
+            data = f.read()
+            end = data.rfind(b'\n') + 1
+            if end < len(data):
+                f.truncate(end)
+        self.offset = min(self.offset, end)
+
+    def append(self, session_id, actions, positions, status, turn=None, keyframe=True, side=None):
+        record = json.dumps({'session': session_id, 'action': actions, 'positions': positions, 'status': status,
+                             'turn': turn, 'keyframe': int(keyframe), 'side': side})
+        with self.lock:
+            self.writer.write(record.encode('UTF-8') + b'\n')
+            self.writer.flush()
+            self.appended += 1
+            self.latest[session_id] = self.appended
+        self.wake.set()
+
+    def flush_session(self, session_id, timeout=SESSION_WAIT):
+        # wait until every turn journaled for the session is in game_turn, so it can be replayed from there
+        # returns False if the database didn't catch up in time
+        with self.lock:
+            target = self.latest.get(session_id)
+            if target is None:
+                return True
+            self.wake.set()
+            if not self.caught_up.wait_for(lambda: self.posted >= target, timeout):
+                return False
+            if self.latest.get(session_id) == target:
+                del self.latest[session_id]
+            return True
+
+    def pending(self):
+        with self.lock:
+            return os.path.getsize(self.path) - self.offset
+
+    def read_batch(self):
+        # up to batch_size complete records after the checkpoint, as (line, row), row is None if the line won't parse
+        self.reader.seek(self.offset)
+        records = []
+        while len(records) < self.batch_size:
+            line = self.reader.readline()
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+                row = (record['session'], record['action'], record['positions'], record['status'],
+                       record.get('turn'), record.get('keyframe', 1), record.get('side'))
+            except (KeyError, TypeError, ValueError):
+                row = None
+            records.append((line, row))
+        return records
+
+    def save_checkpoint(self, offset):
+        temp_path = self.checkpoint_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            f.write(str(offset))
+        os.replace(temp_path, self.checkpoint_path)
+        self.offset = offset
+
+    def flush(self):
+        # post everything journaled so far, returns False if the database couldn't be reached
+        while True:
+            records = self.read_batch()
+            if len(records) == 0:
+                break
+            rows = [row for line, row in records if row is not None]
+            try:
+                if len(rows) > 0 and self.database.post_turns(rows) is None:
+                    return False
+            except RETRY_ERRORS:
+                raise
+            except err.Error as e:
+                # one bad row fails the whole insert, so find it by posting the batch a row at a time
+                log.warning('Database rejected a batch of %d turns, posting them one at a time: %s', len(rows), e)
+                records, reachable = self.post_each(records)
+                self.advance(records)
+                if not reachable:
+                    return False
+                continue
+            self.advance(records)
+        with self.lock:
+            # start the file over once the database has everything in it
+            if self.offset > 0 and os.path.getsize(self.path) == self.offset:
+                self.writer.truncate(0)
+                self.save_checkpoint(0)
+                self.latest.clear()
+        return True
+
+    def post_each(self, records):
+        # returns the records dealt with, rejected ones with their row set to None, and whether the database was reachable
+        done = []
+        for line, row in records:
+            if row is not None:
+                try:
+                    if self.database.post_turns([row]) is None:
+                        return done, False
+                except RETRY_ERRORS:
+                    return done, False
+                except err.Error as e:
+                    log.error('Database rejected turn %s of session %s: %s', row[4], row[0], e)
+                    row = None
+            done.append((line, row))
+        return done, True
+
+    def advance(self, records):
+        # move the checkpoint past records, those without a row go to the dead letter file first
+        rejected = [line for line, row in records if row is None]
+        if len(rejected) > 0:
+            with open(self.rejected_path, 'ab') as f:
+                f.writelines(rejected)
+            log.error('Moved %d journaled turns the database can\'t take to %s', len(rejected), self.rejected_path)
+        self.save_checkpoint(self.offset + sum(len(line) for line, row in records))
+        with self.lock:
+            self.posted += len(records)
+            self.caught_up.notify_all()
+
+    def run(self):
+        while True:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            stopping = self.stopping
+            try:
+                flushed = self.flush()
+            except Exception:
+                log.warning('Turn journal flush failed, trying again in %s seconds', RETRY_INTERVAL, exc_info=True)
+                flushed = False
+            if stopping:
+                return
+            if not flushed:
+                # whatever is left stays in the journal for the next try
+                self.wake.wait(RETRY_INTERVAL)
+
+    def close(self):
+        # flush on shutdown, anything the database won't take now is posted by the next process
+        if self.thread is None:
+            return
+        self.stopping = True
+        self.wake.set()
+        self.thread.join(timeout=30)
+        self.thread = None
+        self.writer.close()
+        self.reader.close()
+
+
+journal = None
+
+
+def start(path=JOURNAL_PATH):
+    # turns posted by any board in this process go through the journal from now on
+    global journal
+    if journal is None:
+        journal = TurnJournal(path)
+        dbconnect.turn_journal = journal
+    return journal
@@ -0,0 +1,45 @@
+import struct
+import numpy
+
+# binary format for a model's list of weight arrays, stored in game_model.weights_blob
+# magic and array count, then for every array its rank, its shape and its float32 values
+# all little-endian, with the values padded to start on an 8 byte boundary
+MAGIC = b'HXW1'
+DTYPE = numpy.dtype('<f4')
+ALIGN = 8
+HEADER = struct.Struct('<4sI')
+UINT = struct.Struct('<I')
+
+
+def pack(weights):
+    parts = [HEADER.pack(MAGIC, len(weights))]
+    size = HEADER.size
+    for w in weights:
+        w = numpy.asarray(w, dtype=DTYPE)
+        shape = struct.pack(f'<{w.ndim + 1}I', w.ndim, *w.shape)
+        padding = -(size + len(shape)) % ALIGN
+        parts.append(shape + bytes(padding))
+        parts.append(w.tobytes())
+        size += len(shape) + padding + w.nbytes
+    return b''.join(parts)
+
+
+def unpack(blob):
+    # arrays are numpy.frombuffer views on blob, so nothing is copied
+    # a bytes blob gives read-only arrays, copy them before changing weights in place
+    magic, count = HEADER.unpack_from(blob, 0)
+    if magic != MAGIC:
+        raise ValueError('not a packed weight list')
+    offset = HEADER.size
+    weights = []
+    for i in range(count):
+        (ndim,) = UINT.unpack_from(blob, offset)
+        shape = struct.unpack_from(f'<{ndim}I', blob, offset + UINT.size)
+        offset += UINT.size * (ndim + 1)
+        offset += -offset % ALIGN
+        length = 1
+        for dim in shape:
+            length *= dim
+        weights.append(numpy.reshape(numpy.frombuffer(blob, dtype=DTYPE, count=length, offset=offset), shape))
+        offset += length * DTYPE.itemsize
+    return weights
@@ -0,0 +1,96 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+# zobrist keys for hashing board state, a board hash is the XOR of the keys for everything on it
+# keys are derived from a digest of their description rather than a random table so every process agrees,
+# which lets self-play workers and the server share cached results keyed on a hash
+HASH_BITS = 64
+CACHE_SIZE = 10000
+
+_keys = {}
+
+
+def _key(*parts):
+    # parts must already be plain python values so repr() is the same everywhere
+    k = _keys.get(parts)
+    if k is None:
+        digest = hashlib.blake2b(repr(parts).encode('UTF-8'), digest_size=HASH_BITS // 8).digest()
+        k = int.from_bytes(digest, 'little')
+        _keys[parts] = k
+    return k
+
+
+def cell_key(token_chars, x, y):
+    # token standing on hex (x, y), an empty hex contributes nothing
+    if token_chars == b'':
+        return 0
+    return _key('cell', bytes(token_chars), int(x), int(y))
+
+
+def hp_key(token_chars, hp):
+    return _key('hp', bytes(token_chars), hp)
+
+
+def side_key(token_chars, side):
+    return _key('side', bytes(token_chars), side)
+
+
+def stats_key(token_chars, stats):
+    # the stats play never changes, (type, movement, attack, range), hashed so boards from different configs differ
+    return _key('stats', bytes(token_chars), tuple(stats))
+
+
+def acted_key(token_chars):
+    return _key('acted', bytes(token_chars))
+
+
+def turn_key(side):
+    return _key('turn', side)
+
+
+def terrain_key(terrain):
+    # terrain only changes in the editor, so it is hashed as one block
+    digest = hashlib.blake2b(terrain.tobytes(), digest_size=HASH_BITS // 8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class TranspositionCache:
+    # bounded LRU map from hash-based keys to results
+    # callers put the kind of result first in the key, e.g. ('reach', terrain hash, hex)
+    def __init__(self, capacity=CACHE_SIZE):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# one cache per process, shared by reachability, search and model inference
+TRANSPOSITIONS = TranspositionCache()